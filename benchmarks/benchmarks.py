@@ -1,13 +1,21 @@
+import logging
 from io import StringIO
 
 from benchmarks import snippets
+from rich.cells import _cell_len, get_character_cell_size
 from rich.color import Color, ColorSystem
 from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.logging import RichHandler
+from rich.markup import compile_markup
+from rich.markup import render as render_markup
 from rich.pretty import Pretty
+from rich.progress import Progress
 from rich.segment import Segment
+from rich.segment_buffer import SegmentBuffer
 from rich.style import Style
 from rich.syntax import Syntax
-from rich.table import Table
+from rich.table import Table, TableView
 from rich.text import Text
 
 
@@ -18,10 +26,19 @@ class TextSuite:
         )
         self.len_lorem_ipsum = len(snippets.LOREM_IPSUM)
         self.text = Text.from_markup(snippets.MARKUP)
+        self.many_spans_text = Text(snippets.LOREM_IPSUM * 10)
+        self.many_spans_text.highlight_regex(r"\w+", "bold")
 
     def time_wrapping(self):
         self.text.wrap(self.console, 12, overflow="fold")
 
+    def time_wrapping_paragraphs(self):
+        Text(snippets.LOREM_IPSUM * 5).wrap(self.console, 80)
+
+    def time_get_style_at_offset_many_spans(self):
+        for offset in range(0, len(self.many_spans_text), 10):
+            self.many_spans_text.get_style_at_offset(self.console, offset)
+
     def time_indent_guides(self):
         Text(snippets.PYTHON_SNIPPET).with_indent_guides()
 
@@ -94,6 +111,52 @@ class SyntaxWrappingSuite:
         self.console.print(self.syntax, width)
 
 
+class SyntaxLineRangeSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False
+        )
+        self.code = snippets.PYTHON_SNIPPET * 200
+        self.line_count = self.code.count("\n")
+
+    def time_scroll_line_range(self):
+        for start in range(self.line_count - 400, self.line_count - 40, 40):
+            self.console.print(
+                Syntax(
+                    self.code,
+                    lexer="python",
+                    line_numbers=True,
+                    line_range=(start, start + 40),
+                )
+            )
+
+
+class LogSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(),
+            color_system="truecolor",
+            legacy_windows=False,
+            width=120,
+        )
+        self.handler = RichHandler(console=self.console)
+        self.record = logging.LogRecord(
+            "benchmark",
+            logging.INFO,
+            "benchmarks.py",
+            10,
+            "Request handled in %d ms",
+            (42,),
+            None,
+        )
+
+    def time_console_log(self):
+        self.console.log("Hello, World!", 42)
+
+    def time_rich_handler_emit(self):
+        self.handler.emit(self.record)
+
+
 class TableSuite:
     def time_table_no_wrapping(self):
         self._print_table(width=100)
@@ -126,6 +189,25 @@ class TableSuite:
         console.print(table)
 
 
+class TableMeasureSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False, width=100
+        )
+        self.table = Table("SKU", "Name", "Quantity")
+        for index in range(1000):
+            self.table.add_row(
+                f"SKU-{index:06}", f"Widget [b]{index}[/b] deluxe", str(index)
+            )
+        self.console.measure(self.table)
+
+    def time_measure_table_warm_cache(self):
+        self.console.measure(self.table)
+
+    def time_render_table_view(self):
+        self.console.print(TableView(self.table, offset=500, height=20))
+
+
 class PrettySuite:
     def setup(self):
         self.console = Console(
@@ -166,6 +248,34 @@ class StyleSuite:
         self.style1 + self.style2
 
 
+class MarkupSuite:
+    def setup(self):
+        self.template = compile_markup("[bold]{user}[/] did [cyan]{action}[/]")
+
+    def time_render_markup(self):
+        render_markup(snippets.MARKUP)
+
+    def time_format_markup_template(self):
+        for number in range(100):
+            self.template.format(user=f"user{number}", action="login")
+
+
+class HighlighterSuite:
+    def setup(self):
+        self.highlighter = ReprHighlighter()
+        self.short_text = "Hello, World!"
+        self.repr_text = repr(snippets.PYTHON_DICT)
+
+    def time_highlight_short_text(self):
+        self.highlighter(self.short_text)
+
+    def time_highlight_repr(self):
+        self.highlighter(self.repr_text)
+
+    def time_highlight_lorem_ipsum(self):
+        self.highlighter(snippets.LOREM_IPSUM)
+
+
 class ColorSuite:
     def setup(self):
         self.console = Console(
@@ -216,3 +326,121 @@ class SegmentSuite:
 
     def test_divide_complex(self):
         list(Segment.divide(self.line, [5, 10, 20, 50, 108, 110, 118]))
+
+
+class RenderBufferSuite:
+    params = [False, True]
+    param_names = ["optimize_sgr"]
+
+    def setup(self, optimize_sgr):
+        self.console = Console(
+            file=StringIO(),
+            color_system="truecolor",
+            legacy_windows=False,
+            width=100,
+            optimize_sgr=optimize_sgr,
+        )
+        syntax = Syntax(code=snippets.PYTHON_SNIPPET, lexer="python")
+        self.segments = list(self.console.render(syntax))
+
+    def time_render_buffer(self, optimize_sgr):
+        self.console._render_buffer(self.segments)
+
+    def track_render_buffer_bytes(self, optimize_sgr):
+        return len(self.console._render_buffer(self.segments).encode("utf-8"))
+
+    track_render_buffer_bytes.unit = "bytes"
+
+
+class SegmentBufferSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False, width=120
+        )
+        self.table = Table()
+        for column in range(6):
+            self.table.add_column(f"column {column}", style="cyan")
+        for row in range(500):
+            self.table.add_row(*[f"[b]cell[/b] {row}/{column}" for column in range(6)])
+
+    def peakmem_split_and_crop_lines(self):
+        list(
+            Segment.split_and_crop_lines(self.console.render(self.table), 100, pad=True)
+        )
+
+    def peakmem_split_and_crop_lines_buffer(self):
+        SegmentBuffer.from_segments(
+            self.console.render(self.table)
+        ).split_and_crop_lines(100, pad=True)
+
+
+class ProgressSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False, width=120
+        )
+        self.progress = Progress(console=self.console, auto_refresh=False)
+        self.task_ids = [
+            self.progress.add_task(f"download {index}", total=1000)
+            for index in range(1000)
+        ]
+        self.console.render_lines(self.progress.get_renderable())
+
+    def time_refresh_with_idle_tasks(self):
+        for task_id in self.task_ids[:50]:
+            self.progress.advance(task_id, 1)
+        self.console.render_lines(self.progress.get_renderable())
+
+    def time_speed_of_busy_tasks(self):
+        for task_id in self.task_ids[:50]:
+            for _ in range(100):
+                self.progress.advance(task_id, 1)
+        for task in self.progress.tasks:
+            task.speed
+            task.time_remaining
+
+
+class CellsSuite:
+    def setup(self):
+        self.japanese = (
+            "吾輩は猫である。名前はまだ無い。どこで生れたかとんと見当がつかぬ。" * 20
+        )
+        self.characters = [chr(codepoint) for codepoint in range(0x4E00, 0x9FFF)]
+
+    def time_cell_len_japanese(self):
+        _cell_len(self.japanese, "auto")
+
+    def time_get_character_cell_size(self):
+        for character in self.characters:
+            get_character_cell_size(character)
+
+
+class PrintStreamSuite:
+    params = [False, True]
+    param_names = ["stream"]
+
+    def setup(self, stream):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False, width=100
+        )
+        self.text = Text()
+        for index in range(20000):
+            self.text.append(f"word{index}", style="italic" if index % 2 else "red")
+            self.text.append("\n" if index % 10 == 9 else " ")
+
+    def peakmem_print(self, stream):
+        self.console.print(self.text, stream=stream)
+
+
+class ImportSuite:
+    def timeraw_import_rich(self):
+        return "import rich"
+
+    def timeraw_import_console(self):
+        return "from rich.console import Console"
+
+    def timeraw_print(self):
+        return """
+from rich import print
+print("[bold]Hello[/bold], World!")
+"""
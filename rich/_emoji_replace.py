@@ -1,8 +1,6 @@
 from typing import Callable, Match, Optional
 import re
 
-from ._emoji_codes import EMOJI
-
 
 _ReStringMatch = Match[str]  # regex match object
 _ReSubCallable = Callable[[_ReStringMatch], str]  # Callable invoked by re.sub
@@ -15,15 +13,17 @@ def _emoji_replace(
     _emoji_sub: _EmojiSubMethod = re.compile(r"(:(\S*?)(?:(?:\-)(emoji|text))?:)").sub,
 ) -> str:
     """Replace emoji code in text."""
-    get_emoji = EMOJI.__getitem__
     variants = {"text": "\uFE0E", "emoji": "\uFE0F"}
     get_variant = variants.get
     default_variant_code = variants.get(default_variant, "") if default_variant else ""
 
     def do_replace(match: Match[str]) -> str:
+        # The emoji codes are large, and only imported if there is a possible code in the text
+        from ._emoji_codes import EMOJI
+
         emoji_code, emoji_name, variant = match.groups()
         try:
-            return get_emoji(emoji_name.lower()) + get_variant(
+            return EMOJI[emoji_name.lower()] + get_variant(
                 variant, default_variant_code
             )
         except KeyError:
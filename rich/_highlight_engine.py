@@ -0,0 +1,374 @@
+"""Reduces the regular expressions of a highlighter to the alternatives which may match a given text.
+
+A highlight regex is often many regexes combined with ``|``, and the regex engine will try every
+alternative at every position in the text. Most alternatives require a literal string or one of a
+set of characters (e.g. an IPv4 address requires a "."), which is much faster to search for. If a
+requirement isn't found in the text, then the alternative can't match, and may be removed from the
+regex without changing the matches of the other alternatives.
+
+The remaining alternatives are guarded by a lookahead for the characters which may start a match,
+so the regex engine can skip most positions in the text without trying each alternative.
+"""
+
+import re
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    from re import _constants as sre_constants  # type: ignore[attr-defined]
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    import sre_constants
+    import sre_parse
+
+# A set of strings, one of which must be in a text for a regex to match
+Requirement = FrozenSet[str]
+
+# Maximum number of characters in a requirement from a character set
+MAX_REQUIREMENT_CHARACTERS = 32
+# Maximum number of characters which may start a match, for a regex to be guarded by them
+MAX_FIRST_CHARACTERS = 128
+# Maximum number of reduced regexes to keep for each highlight regex
+MAX_REDUCED_REGEXES = 128
+
+_DIGITS = frozenset("0123456789")
+
+
+def split_alternatives(regex: str) -> List[str]:
+    """Split a regex at the top level ``|`` operators.
+
+    Args:
+        regex (str): A regular expression.
+
+    Returns:
+        List[str]: The alternatives, or a list containing just the regex if it can't safely be split.
+    """
+    # Global flags, back references, and conditionals may depend on the other alternatives
+    if re.match(r"\(\?[aiLmsux]+\)", regex):
+        return [regex]
+    if re.search(r"\\[1-9]|\(\?P=|\(\?\(", regex):
+        return [regex]
+    alternatives: List[str] = []
+    depth = 0
+    in_set = False
+    start = 0
+    position = 0
+    length = len(regex)
+    while position < length:
+        character = regex[position]
+        if character == "\\":
+            position += 2
+            continue
+        if in_set:
+            if character == "]" and regex[position - 1] != "[":
+                if not (regex[position - 1] == "^" and regex[position - 2] == "["):
+                    in_set = False
+        elif character == "[":
+            in_set = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            alternatives.append(regex[start:position])
+            start = position + 1
+        position += 1
+    alternatives.append(regex[start:])
+    return alternatives
+
+
+def _get_set_characters(
+    items: List[Tuple[int, object]],
+    max_characters: int = MAX_REQUIREMENT_CHARACTERS,
+    flags: int = 0,
+) -> Optional[FrozenSet[str]]:
+    """Get the characters matched by a character set, if there are few enough."""
+    characters: Set[str] = set()
+    for op, value in items:
+        if op is sre_constants.LITERAL:
+            characters.add(chr(value))  # type: ignore[arg-type]
+        elif op is sre_constants.RANGE:
+            low: int
+            high: int
+            low, high = value  # type: ignore[misc]
+            if high - low >= max_characters:
+                return None
+            characters.update(chr(code) for code in range(low, high + 1))
+        elif (
+            op is sre_constants.CATEGORY
+            and value is sre_constants.CATEGORY_DIGIT
+            and flags & re.ASCII
+        ):
+            # Without the ASCII flag, \d matches any Unicode decimal digit
+            characters.update(_DIGITS)
+        else:
+            return None
+    if len(characters) > max_characters:
+        return None
+    return frozenset(characters)
+
+
+def _rank(requirement: Requirement) -> Tuple[int, int]:
+    """Rank a requirement by how selective it is likely to be (higher is better)."""
+    return (min(len(string) for string in requirement), -len(requirement))
+
+
+def _get_requirement(pattern: "sre_parse.SubPattern") -> Optional[Requirement]:
+    """Get a requirement for a parsed regex to match.
+
+    Args:
+        pattern (sre_parse.SubPattern): A parsed regex.
+
+    Returns:
+        Optional[Requirement]: Strings, one of which must be in the text for the regex to match, or ``None``
+            if no requirement could be found.
+    """
+    requirements: List[Requirement] = []
+    literal: List[str] = []
+
+    def end_literal() -> None:
+        if literal:
+            requirements.append(frozenset(["".join(literal)]))
+            del literal[:]
+
+    for op, value in pattern:
+        if op is sre_constants.LITERAL:
+            literal.append(chr(value))
+            continue
+        end_literal()
+        requirement: Optional[Requirement] = None
+        if op is sre_constants.IN:
+            requirement = _get_set_characters(value, flags=pattern.state.flags)
+        elif op is sre_constants.SUBPATTERN:
+            _group, add_flags, _del_flags, sub_pattern = value
+            if not add_flags:
+                requirement = _get_requirement(sub_pattern)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) or (
+            op is getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+        ):
+            minimum, _maximum, sub_pattern = value
+            if minimum:
+                requirement = _get_requirement(sub_pattern)
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            requirement = _get_requirement(value)
+        elif op is sre_constants.BRANCH:
+            _, branches = value
+            branch_requirements = [_get_requirement(branch) for branch in branches]
+            if all(branch_requirements):
+                requirement = frozenset().union(*branch_requirements)  # type: ignore[arg-type]
+        if requirement:
+            requirements.append(requirement)
+    end_literal()
+    return max(requirements, key=_rank) if requirements else None
+
+
+def _get_first_characters(
+    pattern: "sre_parse.SubPattern",
+) -> Tuple[Optional[FrozenSet[str]], bool]:
+    """Get the characters which may start a match of a parsed regex.
+
+    Args:
+        pattern (sre_parse.SubPattern): A parsed regex.
+
+    Returns:
+        Tuple[Optional[FrozenSet[str]], bool]: The characters (or ``None`` if they couldn't be found),
+            and ``True`` if the regex may match an empty string.
+    """
+    characters: Set[str] = set()
+    for op, value in pattern:
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Zero width
+            continue
+        item_characters: Optional[FrozenSet[str]] = None
+        nullable = False
+        if op is sre_constants.LITERAL:
+            item_characters = frozenset(chr(value))
+        elif op is sre_constants.IN:
+            item_characters = _get_set_characters(
+                value, MAX_FIRST_CHARACTERS, pattern.state.flags
+            )
+        elif op is sre_constants.SUBPATTERN:
+            _group, add_flags, _del_flags, sub_pattern = value
+            if not add_flags:
+                item_characters, nullable = _get_first_characters(sub_pattern)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) or (
+            op is getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+        ):
+            minimum, _maximum, sub_pattern = value
+            item_characters, nullable = _get_first_characters(sub_pattern)
+            nullable = nullable or not minimum
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            item_characters, nullable = _get_first_characters(value)
+        elif op is sre_constants.BRANCH:
+            branch_characters: Set[str] = set()
+            for branch in value[1]:
+                first_characters, branch_nullable = _get_first_characters(branch)
+                if first_characters is None:
+                    return None, False
+                branch_characters.update(first_characters)
+                nullable = nullable or branch_nullable
+            item_characters = frozenset(branch_characters)
+        if item_characters is None:
+            return None, False
+        characters.update(item_characters)
+        if not nullable:
+            return frozenset(characters), False
+    return frozenset(characters), True
+
+
+def analyze(regex: str) -> Tuple[Optional[Requirement], Optional[FrozenSet[str]]]:
+    """Find what a text requires for a regex to match.
+
+    Args:
+        regex (str): A regular expression.
+
+    Returns:
+        Tuple[Optional[Requirement], Optional[FrozenSet[str]]]: A set of strings one of which must be in the
+            text (or ``None`` if no requirement was found), and the characters which may start a match (or
+            ``None`` if they couldn't be found, or the regex may match an empty string).
+    """
+    try:
+        pattern = sre_parse.parse(regex)
+    except Exception:
+        return None, None
+    if pattern.state.flags & (re.IGNORECASE | re.VERBOSE):
+        return None, None
+    requirement = _get_requirement(pattern)
+    first_characters, nullable = _get_first_characters(pattern)
+    return requirement, (None if nullable else first_characters)
+
+
+def _make_character_set(characters: Iterable[str]) -> str:
+    """Make a regex character set."""
+    return f"[{''.join(re.escape(character) for character in sorted(characters))}]"
+
+
+class HighlightRegexes:
+    """The highlight regexes of a highlighter, which may be reduced to the alternatives that can
+    match a given text.
+
+    Args:
+        regexes (Sequence[Union[str, Pattern[str]]]): Regular expressions.
+    """
+
+    def __init__(self, regexes: Sequence[Union[str, Pattern[str]]]) -> None:
+        self.regexes = regexes
+        # Every alternative of every regex is given a bit in a mask
+        self._alternatives: List[str] = []
+        # The characters which may start a match of each alternative
+        self._first_characters: List[Optional[FrozenSet[str]]] = []
+        # For each regex, the first bit and the number of bits (no bits if it is compiled as is)
+        self._regex_bits: List[Tuple[int, int]] = []
+        self._compiled: Dict[int, Pattern[str]] = {}
+        # Bits of alternatives which are always active
+        self._always_mask = 0
+        # Map required characters and longer strings on to the bits of the alternatives they activate
+        self._character_masks: Dict[str, int] = {}
+        self._string_masks: Dict[str, int] = {}
+        self._reduced: Dict[int, List[Pattern[str]]] = {}
+
+        requirements: List[Optional[Requirement]] = []
+        for index, regex in enumerate(regexes):
+            if isinstance(regex, str):
+                alternatives = split_alternatives(regex)
+                analyses = [analyze(alternative) for alternative in alternatives]
+                if any(
+                    requirement or first_characters
+                    for requirement, first_characters in analyses
+                ):
+                    self._regex_bits.append(
+                        (len(self._alternatives), len(alternatives))
+                    )
+                    self._alternatives.extend(alternatives)
+                    for requirement, first_characters in analyses:
+                        requirements.append(requirement)
+                        self._first_characters.append(first_characters)
+                    continue
+                regex = re.compile(regex)
+            self._compiled[index] = regex
+            self._regex_bits.append((0, 0))
+
+        for bit, requirement in enumerate(requirements):
+            if requirement is None:
+                self._always_mask |= 1 << bit
+                continue
+            for string in requirement:
+                masks = (
+                    self._character_masks if len(string) == 1 else self._string_masks
+                )
+                masks[string] = masks.get(string, 0) | 1 << bit
+
+    def get_patterns(self, text: str) -> List[Pattern[str]]:
+        """Get regexes which find the same matches as the original regexes in a given text.
+
+        Args:
+            text (str): The text to be searched.
+
+        Returns:
+            List[Pattern[str]]: Compiled regexes, excluding those which can't match.
+        """
+        mask = self._always_mask
+        character_masks = self._character_masks
+        for character in character_masks.keys() & set(text):
+            mask |= character_masks[character]
+        for string, string_mask in self._string_masks.items():
+            if string_mask & ~mask and string in text:
+                mask |= string_mask
+        patterns = self._reduced.get(mask)
+        if patterns is None:
+            if len(self._reduced) >= MAX_REDUCED_REGEXES:
+                self._reduced.clear()
+            patterns = self._reduced[mask] = self._reduce(mask)
+        return patterns
+
+    def _reduce(self, mask: int) -> List[Pattern[str]]:
+        """Compile regexes with just the alternatives which are active in a mask."""
+        patterns: List[Pattern[str]] = []
+        alternatives = self._alternatives
+        for index, (first_bit, bit_count) in enumerate(self._regex_bits):
+            if index in self._compiled:
+                patterns.append(self._compiled[index])
+                continue
+            bits = [
+                bit
+                for bit in range(first_bit, first_bit + bit_count)
+                if mask & (1 << bit)
+            ]
+            if bits:
+                patterns.append(re.compile(self._combine(bits)))
+        return patterns
+
+    def _combine(self, bits: List[int]) -> str:
+        """Combine alternatives in to a regex.
+
+        Each alternative is guarded by a lookahead for the characters which may start a match, which
+        saves the regex engine from attempting a match at positions where it can't succeed.
+        """
+        alternatives = self._alternatives
+        guarded_alternatives: List[str] = []
+        union: Optional[Set[str]] = set()
+        for bit in bits:
+            first_characters = self._first_characters[bit]
+            if first_characters is None:
+                guarded_alternatives.append(alternatives[bit])
+                union = None
+            else:
+                guarded_alternatives.append(
+                    f"(?={_make_character_set(first_characters)}){alternatives[bit]}"
+                )
+                if union is not None:
+                    union.update(first_characters)
+        regex = "|".join(guarded_alternatives)
+        if len(bits) > 1 and union is not None:
+            regex = f"(?={_make_character_set(union)})(?:{regex})"
+        return regex
@@ -0,0 +1,260 @@
+"""Lexes code with Pygments in chunks, and stores checkpoints of the lexer state.
+
+A ``RegexLexer`` works through the code with a position and a stack of states. Lexing may be
+resumed from any position if the state stack is known, so every ``CHECKPOINT_LINES`` lines the
+position and state stack are stored. Highlighting a range of lines then only needs to lex from
+the nearest checkpoint before it.
+
+Checkpoints aren't re-used for edited code: a regex may look past the end of the text it matches
+(or fails to match), so tokens before an edit may depend on text after it.
+"""
+
+from functools import lru_cache
+from itertools import count
+from threading import Lock
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pygments.lexer import Lexer, RegexLexer
+from pygments.token import Error, _TokenType
+
+from . import caches
+
+Token = Tuple[Any, str]
+
+# Number of lines between checkpoints
+CHECKPOINT_LINES = 100
+
+
+class Checkpoint(NamedTuple):
+    """A point in the code from which lexing may be resumed."""
+
+    line: int
+    """Line number (from 0) of the line starting at the checkpoint."""
+    position: int
+    """Offset in to the code."""
+    stack: Tuple[str, ...]
+    """State stack of the lexer."""
+
+
+@lru_cache(maxsize=None)
+def _get_end_of_line_token_type() -> Any:
+    """Get the token type a RegexLexer gives to a new line which no rule matches (it differs
+    between versions of Pygments)."""
+
+    class EndOfLineLexer(RegexLexer):  # type: ignore[misc]
+        tokens: Dict[str, List[Any]] = {"root": []}
+
+    ((token_type, _),) = EndOfLineLexer().get_tokens("\n")
+    return token_type
+
+
+def _lex(
+    lexer: RegexLexer, text: str, checkpoint: Checkpoint, stop_line: int
+) -> Tuple[List[Token], Optional[Checkpoint]]:
+    """Lex from a checkpoint to the first line on or after a given line which starts at
+    a token boundary.
+
+    This is the loop from ``RegexLexer.get_tokens_unprocessed``, resumed from a checkpoint.
+
+    Args:
+        lexer (RegexLexer): A lexer.
+        text (str): Pre-processed code.
+        checkpoint (Checkpoint): Checkpoint to resume from.
+        stop_line (int): Line number to stop at.
+
+    Returns:
+        Tuple[List[Token], Optional[Checkpoint]]: Tokens, and the next checkpoint (or ``None`` if
+            the end of the code was reached).
+    """
+    tokens: List[Token] = []
+    add_token = tokens.append
+    line, position, stack = checkpoint
+    counted_position = position
+    count_new_lines = text.count
+    text_length = len(text)
+    token_definitions = lexer._tokens
+    state_stack = list(stack)
+    state_tokens = token_definitions[state_stack[-1]]
+    while True:
+        if position > counted_position and text[position - 1] == "\n":
+            line += count_new_lines("\n", counted_position, position)
+            counted_position = position
+            if line >= stop_line and position < text_length:
+                return tokens, Checkpoint(line, position, tuple(state_stack))
+        for match_regex, action, new_state in state_tokens:
+            match = match_regex(text, position)
+            if match:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        add_token((action, match.group()))
+                    else:
+                        tokens.extend(
+                            (token_type, value)
+                            for _, token_type, value in action(lexer, match)
+                        )
+                position = match.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(state_stack) > 1:
+                                    state_stack.pop()
+                            elif state == "#push":
+                                state_stack.append(state_stack[-1])
+                            else:
+                                state_stack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(state_stack):
+                            del state_stack[1:]
+                        else:
+                            del state_stack[new_state:]
+                    elif new_state == "#push":
+                        state_stack.append(state_stack[-1])
+                    else:
+                        raise ValueError(f"wrong state def: {new_state!r}")
+                    state_tokens = token_definitions[state_stack[-1]]
+                break
+        else:
+            if position >= text_length:
+                break
+            if text[position] == "\n":
+                # At the end of a line, the state is reset to "root"
+                state_stack = ["root"]
+                state_tokens = token_definitions["root"]
+                add_token((_get_end_of_line_token_type(), "\n"))
+            else:
+                add_token((Error, text[position]))
+            position += 1
+    return tokens, None
+
+
+def can_checkpoint(lexer: Lexer) -> bool:
+    """Check if lexing may be resumed from checkpoints with a given lexer.
+
+    Args:
+        lexer (Lexer): A Pygments lexer.
+
+    Returns:
+        bool: ``True`` if the lexer is a ``RegexLexer`` which doesn't customize lexing.
+    """
+    lexer_type = type(lexer)
+    return (
+        isinstance(lexer, RegexLexer)
+        and lexer_type.get_tokens_unprocessed is RegexLexer.get_tokens_unprocessed
+        and lexer_type.get_tokens is Lexer.get_tokens
+        and hasattr(lexer, "_preprocess_lexer_input")
+        and not lexer.filters
+    )
+
+
+def _get_lexer_key(lexer: Lexer) -> Tuple[Any, ...]:
+    """Get a key which identifies a lexer and its options."""
+    return (
+        type(lexer),
+        tuple(sorted((name, repr(value)) for name, value in lexer.options.items())),
+    )
+
+
+# Checkpoints of lexed code, keyed on the lexer and the code
+_lexed_codes: "caches.LRUCache[LexedCode]" = caches.LRUCache("syntax.lexed_code")
+# Tokens in a chunk of lexed code, keyed on the ID of the lexed code and the index of the chunk
+_chunks: "caches.LRUCache[List[Token]]" = caches.LRUCache("syntax.tokens")
+_new_id = count().__next__
+
+
+class LexedCode:
+    """Code lexed in chunks, which start at checkpoints.
+
+    Args:
+        lexer (RegexLexer): Lexer to use, which must pass :func:`can_checkpoint`.
+        code (str): Code to lex.
+    """
+
+    def __init__(self, lexer: RegexLexer, code: str) -> None:
+        self.lexer = lexer
+        self.text: str = lexer._preprocess_lexer_input(code)
+        self.checkpoints: List[Checkpoint] = [Checkpoint(0, 0, ("root",))]
+        # True when the last checkpoint is the start of the last chunk
+        self.complete = False
+        self._id = _new_id()
+        self._lock = Lock()
+
+    def _get_chunk(self, index: int) -> List[Token]:
+        """Get the tokens from a checkpoint to the next checkpoint."""
+        tokens = _chunks.get((self._id, index))
+        if tokens is not None:
+            return tokens
+        checkpoint = self.checkpoints[index]
+        tokens, next_checkpoint = _lex(
+            self.lexer,
+            self.text,
+            checkpoint,
+            checkpoint.line + CHECKPOINT_LINES,
+        )
+        with self._lock:
+            if index == len(self.checkpoints) - 1:
+                if next_checkpoint is None:
+                    self.complete = True
+                else:
+                    self.checkpoints.append(next_checkpoint)
+        _chunks.set((self._id, index), tokens)
+        return tokens
+
+    def get_tokens(
+        self, start_line: int = 0, end_line: Optional[int] = None
+    ) -> Tuple[Checkpoint, Iterable[Token]]:
+        """Get tokens from the last checkpoint on or before a line.
+
+        Args:
+            start_line (int, optional): First line (from 0) required. Defaults to 0.
+            end_line (Optional[int], optional): Line (from 0) after the last line required,
+                or ``None`` for every line. Defaults to None.
+
+        Returns:
+            Tuple[Checkpoint, Iterable[Token]]: The checkpoint the tokens start from, and the tokens,
+                which end at a checkpoint on or after ``end_line``.
+        """
+        index = 0
+        while True:
+            checkpoints = self.checkpoints
+            index = len(checkpoints) - 1
+            if checkpoints[index].line >= start_line or self.complete:
+                break
+            self._get_chunk(index)
+        while index and self.checkpoints[index].line > start_line:
+            index -= 1
+        first_index = index
+
+        def iter_tokens() -> Iterable[Token]:
+            index = first_index
+            while True:
+                yield from self._get_chunk(index)
+                index += 1
+                if index >= len(self.checkpoints):
+                    break
+                if end_line is not None and self.checkpoints[index].line >= end_line:
+                    break
+
+        return self.checkpoints[first_index], iter_tokens()
+
+
+def get_lexed_code(lexer: Lexer, code: str) -> Optional[LexedCode]:
+    """Get lexed code from the cache, or lex it (lazily) if it isn't in the cache.
+
+    Args:
+        lexer (Lexer): A Pygments lexer.
+        code (str): Code to lex.
+
+    Returns:
+        Optional[LexedCode]: Lexed code, or ``None`` if the lexer doesn't support checkpoints.
+    """
+    if not can_checkpoint(lexer):
+        return None
+    lexer_key = _get_lexer_key(lexer)
+    lexed_code = _lexed_codes.get((lexer_key, code))
+    if lexed_code is not None:
+        return lexed_code
+    assert isinstance(lexer, RegexLexer)
+    lexed_code = LexedCode(lexer, code)
+    _lexed_codes.set((lexer_key, code), lexed_code)
+    return lexed_code
@@ -1,15 +1,41 @@
 from datetime import datetime
-from typing import Iterable, List, Optional, TYPE_CHECKING, Union, Callable
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
+from .cells import cell_len
+from .segment import Segment
+from .style import Style
 from .text import Text, TextType
 
 if TYPE_CHECKING:
-    from .console import Console, ConsoleRenderable, RenderableType
+    from .console import (
+        Console,
+        ConsoleOptions,
+        ConsoleRenderable,
+        OverflowMethod,
+        RenderableType,
+        RenderResult,
+    )
+    from .measure import Measurement
     from .table import Table
 
 FormatTimeCallable = Callable[[datetime], Text]
 
+# Maximum number of column layouts to store
+MAX_LAYOUTS = 64
+# Maximum number of rendered time, level, and path cells to store
+MAX_CELLS = 256
+
 
 class LogRender:
     def __init__(
@@ -28,6 +54,10 @@ class LogRender:
         self.omit_repeated_times = omit_repeated_times
         self.level_width = level_width
         self._last_time: Optional[Text] = None
+        self._layouts: Dict[Tuple[int, Tuple[int, ...]], Optional[List[int]]] = {}
+        self._cells: Dict[
+            Hashable, Tuple["Console", Dict[str, Style], List[List[Segment]]]
+        ] = {}
 
     def __call__(
         self,
@@ -39,20 +69,8 @@ class LogRender:
         path: Optional[str] = None,
         line_no: Optional[int] = None,
         link_path: Optional[str] = None,
-    ) -> "Table":
-        from .containers import Renderables
-        from .table import Table
-
-        output = Table.grid(padding=(0, 1))
-        output.expand = True
-        if self.show_time:
-            output.add_column(style="log.time")
-        if self.show_level:
-            output.add_column(style="log.level", width=self.level_width)
-        output.add_column(ratio=1, style="log.message", overflow="fold")
-        if self.show_path and path:
-            output.add_column(style="log.path")
-        row: List["RenderableType"] = []
+    ) -> "LogLine":
+        log_time_display: Optional[Text] = None
         if self.show_time:
             log_time = log_time or console.get_datetime()
             time_format = time_format or self.time_format
@@ -61,14 +79,11 @@ class LogRender:
             else:
                 log_time_display = Text(log_time.strftime(time_format))
             if log_time_display == self._last_time and self.omit_repeated_times:
-                row.append(Text(" " * len(log_time_display)))
+                log_time_display = Text(" " * len(log_time_display))
             else:
-                row.append(log_time_display)
                 self._last_time = log_time_display
-        if self.show_level:
-            row.append(level)
 
-        row.append(Renderables(renderables))
+        path_text: Optional[Text] = None
         if self.show_path and path:
             path_text = Text()
             path_text.append(
@@ -80,11 +95,271 @@ class LogRender:
                     f"{line_no}",
                     style=f"link file://{link_path}#{line_no}" if link_path else "",
                 )
-            row.append(path_text)
 
+        return LogLine(
+            self,
+            log_time_display,
+            level if self.show_level else None,
+            list(renderables),
+            path_text,
+        )
+
+    def get_layout(
+        self, max_width: int, fixed_widths: Tuple[int, ...]
+    ) -> Optional[List[int]]:
+        """Get the widths of the columns of a log line, as they would be calculated by a grid.
+
+        Args:
+            max_width (int): Maximum width of the log line.
+            fixed_widths (Tuple[int, ...]): Widths (including padding) of the columns before
+                the message, followed by the width of the path column (or 0 for no path column).
+
+        Returns:
+            Optional[List[int]]: Widths of the columns, or ``None`` if the columns don't fit
+                in the maximum width, and the grid must collapse them.
+        """
+        key = (max_width, fixed_widths)
+        layouts = self._layouts
+        if key in layouts:
+            return layouts[key]
+        *widths, path_width = fixed_widths
+        # The message column has a minimum width of 1, plus padding if it isn't the last column
+        message_minimum = 2 if path_width else 1
+        message_width = max_width - sum(fixed_widths)
+        layout: Optional[List[int]] = None
+        if message_width >= message_minimum:
+            layout = [*widths, message_width]
+            if path_width:
+                layout.append(path_width)
+        if len(layouts) >= MAX_LAYOUTS:
+            layouts.clear()
+        layouts[key] = layout
+        return layout
+
+    def get_cell_lines(
+        self,
+        console: "Console",
+        options: "ConsoleOptions",
+        text: Text,
+        style_name: str,
+        width: int,
+        pad: bool,
+    ) -> List[List[Segment]]:
+        """Get the lines of a rendered time, level, or path cell.
+
+        The time, level, and path are often the same from one log line to the next, so the
+        rendered cells are stored, for the console and theme they were rendered with.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Options for the cell.
+            text (Text): Single line of text in the cell.
+            style_name (str): Style of the column.
+            width (int): Width of the column.
+            pad (bool): Pad the cell on the right.
+
+        Returns:
+            List[List[Segment]]: Lines of segments.
+        """
+        key = (
+            style_name,
+            width,
+            pad,
+            text.plain,
+            text.style,
+            tuple(text.spans),
+            text.justify,
+            text.overflow,
+            text.no_wrap,
+            text.end,
+        )
+        theme_styles = console._theme_stack._entries[-1]
+        cells = self._cells
+        cell = cells.get(key)
+        if cell is not None and cell[0] is console and cell[1] is theme_styles:
+            return cell[2]
+        lines = _render_cell(console, options, text, console.get_style(style_name), pad)
+        if len(cells) >= MAX_CELLS:
+            cells.clear()
+        cells[key] = (console, theme_styles, lines)
+        return lines
+
+
+def _get_text_width(text: "RenderableType") -> Optional[int]:
+    """Get the width of a single line of text, or ``None`` if it's not a single line of Text."""
+    if isinstance(text, Text):
+        plain = text.plain
+        if plain.isprintable():
+            return cell_len(plain)
+    return None
+
+
+def _render_cell(
+    console: "Console",
+    options: "ConsoleOptions",
+    renderable: "RenderableType",
+    style: Style,
+    pad: bool,
+) -> List[List[Segment]]:
+    """Render a cell, as a grid would render it (with padding of 1 on the right, if required)."""
+    if not pad:
+        return console.render_lines(renderable, options, style=style)
+    lines = console.render_lines(
+        renderable, options.update_width(options.max_width - 1), style=style
+    )
+    pad_segment = Segment(" ", style)
+    for line in lines:
+        line.append(pad_segment)
+    return lines
+
+
+class LogLine:
+    """A line of log output, with columns for the time, level, message, and path.
+
+    Renders the same as a grid with a column for each, but the widths of the columns are
+    calculated without measuring the message.
+
+    Args:
+        log_render (LogRender): The log render which created the line.
+        time (Optional[Text]): Time column, or ``None`` for no time column.
+        level (Optional[TextType]): Level column, or ``None`` for no level column.
+        renderables (List[ConsoleRenderable]): Renderables in the message column.
+        path (Optional[Text]): Path column, or ``None`` for no path column.
+    """
+
+    def __init__(
+        self,
+        log_render: LogRender,
+        time: Optional[Text],
+        level: Optional[TextType],
+        renderables: List["ConsoleRenderable"],
+        path: Optional[Text],
+    ) -> None:
+        self.log_render = log_render
+        self.time = time
+        self.level = level
+        self.renderables = renderables
+        self.path = path
+
+    def get_table(self) -> "Table":
+        """Get a grid which renders the same as the log line.
+
+        Returns:
+            Table: A grid.
+        """
+        from .containers import Renderables
+        from .table import Table
+
+        log_render = self.log_render
+        output = Table.grid(padding=(0, 1))
+        output.expand = True
+        row: List["RenderableType"] = []
+        if self.time is not None:
+            output.add_column(style="log.time")
+            row.append(self.time)
+        if self.level is not None:
+            output.add_column(style="log.level", width=log_render.level_width)
+            row.append(self.level)
+        output.add_column(ratio=1, style="log.message", overflow="fold")
+        row.append(Renderables(self.renderables))
+        if self.path is not None:
+            output.add_column(style="log.path")
+            row.append(self.path)
         output.add_row(*row)
         return output
 
+    def _get_layout(self, max_width: int) -> Optional[List[int]]:
+        """Get the widths of the columns, or ``None`` if the grid is required."""
+        if max_width < 1:
+            return None
+        fixed_widths: List[int] = []
+        if self.time is not None:
+            time_width = _get_text_width(self.time)
+            if time_width is None:
+                return None
+            fixed_widths.append(time_width + 1)
+        if self.level is not None:
+            level_width = self.log_render.level_width
+            if level_width is None:
+                level_width = _get_text_width(self.level)
+                if level_width is None:
+                    return None
+            fixed_widths.append(level_width + 1)
+        if self.path is None:
+            fixed_widths.append(0)
+        else:
+            path_width = _get_text_width(self.path)
+            if not path_width:
+                return None
+            fixed_widths.append(path_width)
+        return self.log_render.get_layout(max_width, tuple(fixed_widths))
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        widths = self._get_layout(options.max_width)
+        if widths is None:
+            yield self.get_table()
+            return
+
+        from .containers import Renderables
+
+        cells: List[Tuple["RenderableType", str, "OverflowMethod"]] = []
+        if self.time is not None:
+            cells.append((self.time, "log.time", "ellipsis"))
+        if self.level is not None:
+            cells.append((self.level, "log.level", "ellipsis"))
+        cells.append((Renderables(self.renderables), "log.message", "fold"))
+        if self.path is not None:
+            cells.append((self.path, "log.path", "ellipsis"))
+
+        log_render = self.log_render
+        get_style = console.get_style
+        options = options.update(highlight=False, height=None)
+        last_index = len(cells) - 1
+        rendered_cells: List[List[List[Segment]]] = []
+        styles: List[Style] = []
+        for index, ((renderable, style_name, overflow), width) in enumerate(
+            zip(cells, widths)
+        ):
+            pad = index != last_index
+            cell_options = options.update(
+                width=width, justify="left", no_wrap=False, overflow=overflow
+            )
+            if style_name != "log.message" and _get_text_width(renderable) is not None:
+                assert isinstance(renderable, Text)
+                lines = log_render.get_cell_lines(
+                    console, cell_options, renderable, style_name, width, pad
+                )
+            else:
+                lines = _render_cell(
+                    console, cell_options, renderable, get_style(style_name), pad
+                )
+            rendered_cells.append(lines)
+            styles.append(get_style(style_name))
+
+        row_height = max(len(lines) for lines in rendered_cells)
+        height = max(1, row_height)
+        if any(len(lines) != height for lines in rendered_cells):
+            rendered_cells[:] = [
+                Segment.set_shape(
+                    Segment.align_top(lines, width, row_height, style), width, height
+                )
+                for lines, width, style in zip(rendered_cells, widths, styles)
+            ]
+        new_line = Segment.line()
+        for line_no in range(height):
+            for lines in rendered_cells:
+                yield from lines[line_no]
+            yield new_line
+
+    def __rich_measure__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "Measurement":
+        from .measure import Measurement
+
+        return Measurement.get(console, options, self.get_table())
+
 
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
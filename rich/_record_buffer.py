@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from .segment import Segment
+
+
+class RecordBuffer:
+    """Stores the segments recorded by a Console, discarding the oldest lines when a limit is reached.
+
+    Args:
+        max_lines (int, optional): Maximum number of lines to keep, or ``None`` for no limit.
+        max_bytes (int, optional): Maximum size of the recorded text in bytes (encoded as UTF-8),
+            or ``None`` for no limit.
+    """
+
+    def __init__(
+        self, max_lines: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        if max_lines is not None and max_lines < 1:
+            raise ValueError("max_lines must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._lines: Deque[List[Segment]] = deque()
+        self._line_sizes: Deque[int] = deque()
+        self._line: List[Segment] = []
+        self._line_size = 0
+        self._size = 0
+
+    def __iter__(self) -> Iterator[Segment]:
+        for line in self._lines:
+            yield from line
+        yield from self._line
+
+    def __len__(self) -> int:
+        """Number of lines, including an incomplete last line."""
+        return len(self._lines) + bool(self._line)
+
+    @property
+    def size(self) -> int:
+        """The size of the recorded text, in bytes."""
+        return self._size + self._line_size
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        """Record segments, then discard the oldest lines if a limit has been exceeded.
+
+        Args:
+            segments (Iterable[Segment]): Segments to record.
+        """
+        line = self._line
+        append = line.append
+        line_size = self._line_size
+        for segment in segments:
+            text, style, control = segment
+            if control or "\n" not in text:
+                append(segment)
+                line_size += len(text.encode("utf-8"))
+                continue
+            *texts, last_text = text.split("\n")
+            for text in texts:
+                append(Segment(f"{text}\n", style))
+                self._lines.append(line)
+                self._line_sizes.append(line_size + len(text.encode("utf-8")) + 1)
+                self._size += self._line_sizes[-1]
+                line = []
+                append = line.append
+                line_size = 0
+            if last_text:
+                append(Segment(last_text, style))
+                line_size += len(last_text.encode("utf-8"))
+        self._line = line
+        self._line_size = line_size
+        self._trim()
+
+    def _trim(self) -> None:
+        """Discard the oldest lines until the buffer is within its limits.
+
+        If the incomplete last line alone exceeds ``max_bytes``, the start of it is discarded.
+        """
+        lines = self._lines
+        line_sizes = self._line_sizes
+        max_lines = self.max_lines
+        if max_lines is not None:
+            # The incomplete last line counts toward the limit
+            max_complete_lines = max_lines - bool(self._line)
+            while lines and len(lines) > max_complete_lines:
+                lines.popleft()
+                self._size -= line_sizes.popleft()
+        max_bytes = self.max_bytes
+        if max_bytes is not None:
+            while lines and self._size + self._line_size > max_bytes:
+                lines.popleft()
+                self._size -= line_sizes.popleft()
+            if self._line_size > max_bytes:
+                self._truncate_line(max_bytes)
+
+    def _truncate_line(self, max_bytes: int) -> None:
+        """Discard the start of the incomplete last line, so that it fits in ``max_bytes``.
+
+        Args:
+            max_bytes (int): Maximum size of the line in bytes.
+        """
+        line = self._line
+        excess = self._line_size - max_bytes
+        index = 0
+        while excess > 0:
+            text, style, control = line[index]
+            encoded = text.encode("utf-8")
+            size = len(encoded)
+            if size <= excess or control:
+                # Control codes can't be split
+                index += 1
+                excess -= size
+                self._line_size -= size
+                continue
+            # Drop any character split by the cut
+            text = encoded[excess:].decode("utf-8", "ignore")
+            self._line_size -= size - len(text.encode("utf-8"))
+            if text:
+                line[index] = Segment(text, style)
+            else:
+                index += 1
+            break
+        del line[:index]
+
+    def clear(self) -> None:
+        """Discard everything that was recorded."""
+        self._lines.clear()
+        self._line_sizes.clear()
+        self._line = []
+        self._line_size = 0
+        self._size = 0
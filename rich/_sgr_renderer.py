@@ -0,0 +1,216 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import caches
+from .color import ColorSystem
+from .segment import Segment
+from .style import Style
+
+# SGR parameter to switch each attribute bit on (matches Style._style_map)
+_SET_CODES = (
+    "1",  # bold
+    "2",  # dim
+    "3",  # italic
+    "4",  # underline
+    "5",  # blink
+    "6",  # blink2
+    "7",  # reverse
+    "8",  # conceal
+    "9",  # strike
+    "21",  # underline2
+    "51",  # frame
+    "52",  # encircle
+    "53",  # overline
+)
+
+# SGR parameter to switch each attribute bit off
+_RESET_CODES = (
+    "22",  # bold
+    "22",  # dim
+    "23",  # italic
+    "24",  # underline
+    "25",  # blink
+    "25",  # blink2
+    "27",  # reverse
+    "28",  # conceal
+    "29",  # strike
+    "24",  # underline2
+    "54",  # frame
+    "54",  # encircle
+    "55",  # overline
+)
+
+# Some reset codes switch off more than one attribute (e.g. 22 is "normal intensity")
+_RESET_MASKS = {
+    code: sum(1 << bit for bit, reset in enumerate(_RESET_CODES) if reset == code)
+    for code in _RESET_CODES
+}
+
+
+class SGRState(NamedTuple):
+    """The SGR state of the terminal, as set by a single style."""
+
+    attributes: int
+    """Bit mask of attributes that are switched on."""
+    color: Tuple[str, ...]
+    """SGR parameters for the foreground color, or empty tuple for no color."""
+    bgcolor: Tuple[str, ...]
+    """SGR parameters for the background color, or empty tuple for no color."""
+
+    @property
+    def codes(self) -> List[str]:
+        """Get the SGR parameters to set this state from a reset terminal."""
+        attributes = self.attributes
+        codes = [_SET_CODES[bit] for bit in range(13) if attributes & (1 << bit)]
+        codes.extend(self.color)
+        codes.extend(self.bgcolor)
+        return codes
+
+
+NULL_STATE = SGRState(0, (), ())
+
+
+@caches.lru_cache("sgr.state")
+def get_sgr_state(style: Style, color_system: ColorSystem) -> SGRState:
+    """Get the SGR state a style will set.
+
+    Args:
+        style (Style): A style.
+        color_system (ColorSystem): Color system to render to.
+
+    Returns:
+        SGRState: The terminal state after the style is applied.
+    """
+    color = style._color
+    bgcolor = style._bgcolor
+    state = SGRState(
+        style._attributes & style._set_attributes,
+        () if color is None else color.downgrade(color_system).get_ansi_codes(),
+        (
+            ()
+            if bgcolor is None
+            else bgcolor.downgrade(color_system).get_ansi_codes(foreground=False)
+        ),
+    )
+    return NULL_STATE if state == NULL_STATE else state
+
+
+@caches.lru_cache("sgr.transition")
+def get_sgr_transition(previous: SGRState, state: SGRState) -> str:
+    """Get the shortest escape sequence that changes the terminal from one SGR state to another.
+
+    Args:
+        previous (SGRState): The current state of the terminal.
+        state (SGRState): The required state.
+
+    Returns:
+        str: An escape sequence, or empty string if no change is required.
+    """
+    if previous == state:
+        return ""
+    if state == NULL_STATE:
+        return "\x1b[0m"
+
+    codes: List[str] = []
+    append = codes.append
+    removed = previous.attributes & ~state.attributes
+    cleared = 0
+    if removed:
+        for bit in range(13):
+            if removed & (1 << bit):
+                reset_code = _RESET_CODES[bit]
+                if reset_code not in codes:
+                    append(reset_code)
+                    cleared |= _RESET_MASKS[reset_code]
+    retained = previous.attributes & ~cleared
+    added = state.attributes & ~retained
+    if added:
+        codes.extend(_SET_CODES[bit] for bit in range(13) if added & (1 << bit))
+    if state.color != previous.color:
+        codes.extend(state.color or ("39",))
+    if state.bgcolor != previous.bgcolor:
+        codes.extend(state.bgcolor or ("49",))
+
+    delta = ";".join(codes)
+    reset = ";".join(["0", *state.codes])
+    return f"\x1b[{delta if len(delta) <= len(reset) else reset}m"
+
+
+def sgr_render(
+    buffer: Iterable[Segment],
+    color_system: Optional[ColorSystem],
+    legacy_windows: bool = False,
+    not_terminal: bool = False,
+) -> str:
+    """Render segments to a string, emitting only the changes in SGR state between segments.
+
+    The output displays identically to rendering each segment with `Style.render`, but
+    avoids resetting and re-applying attributes that are common to consecutive segments.
+
+    Args:
+        buffer (Iterable[Segment]): Segments to render.
+        color_system (Optional[ColorSystem]): Color system to render to, or None for no color.
+        legacy_windows (bool, optional): Disable hyperlinks for legacy Windows. Defaults to False.
+        not_terminal (bool, optional): Strip unstyled control segments. Defaults to False.
+
+    Returns:
+        str: Rendered output.
+    """
+    output: List[str] = []
+    append = output.append
+
+    if color_system is None:
+        for text, style, control in buffer:
+            if style or not (not_terminal and control):
+                append(text)
+        return "".join(output)
+
+    state = NULL_STATE
+    link: Optional[Tuple[str, str]] = None
+    get_state = get_sgr_state
+    get_transition = get_sgr_transition
+    # Keyed on id for speed; the style is kept in the value so the id can't be reused
+    states: Dict[int, Tuple[Style, SGRState]] = {}
+    transitions: Dict[Tuple[int, int], str] = {}
+    for text, style, control in buffer:
+        if not text:
+            continue
+        if style:
+            if style._link and not legacy_windows:
+                new_link = (style._link_id, style._link)
+                if new_link != link:
+                    if link is not None:
+                        append("\x1b]8;;\x1b\\")
+                    append(f"\x1b]8;id={new_link[0]};{new_link[1]}\x1b\\")
+                    link = new_link
+            elif link is not None:
+                append("\x1b]8;;\x1b\\")
+                link = None
+            cached = states.get(id(style))
+            if cached is None:
+                new_state = get_state(style, color_system)
+                states[id(style)] = (style, new_state)
+            else:
+                new_state = cached[1]
+            if new_state is not state:
+                key = (id(state), id(new_state))
+                sequence = transitions.get(key)
+                if sequence is None:
+                    sequence = transitions[key] = get_transition(state, new_state)
+                append(sequence)
+                state = new_state
+            append(text)
+        else:
+            if state is not NULL_STATE:
+                append("\x1b[0m")
+                state = NULL_STATE
+            if link is not None:
+                append("\x1b]8;;\x1b\\")
+                link = None
+            if not (not_terminal and control):
+                append(text)
+
+    if state is not NULL_STATE:
+        append("\x1b[0m")
+    if link is not None:
+        append("\x1b]8;;\x1b\\")
+    return "".join(output)
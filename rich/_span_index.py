@@ -0,0 +1,92 @@
+from bisect import bisect_right
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .text import Span
+
+
+class SpanIndex:
+    """An index of the spans in a Text, which finds the spans covering an offset with a binary search.
+
+    The offsets where spans start or end divide the text in to intervals. For each interval,
+    the index stores the indexes of the spans which cover it, in the order they were added.
+
+    Args:
+        spans (List[Span]): Spans to index. The list is referenced, not copied.
+    """
+
+    def __init__(self, spans: List["Span"]) -> None:
+        self.spans = spans
+        self.count = 0
+        self.boundaries: List[int] = []
+        self.active: List[Tuple[int, ...]] = []
+        self._build()
+
+    def _build(self) -> None:
+        """Index every span with a sweep over the sorted boundaries."""
+        spans = self.spans
+        events = sorted(
+            [
+                *((start, False, index) for index, (start, _, _) in enumerate(spans)),
+                *((end, True, index) for index, (_, end, _) in enumerate(spans)),
+            ]
+        )
+        boundaries: List[int] = []
+        active: List[Tuple[int, ...]] = []
+        add_boundary = boundaries.append
+        add_active = active.append
+        stack: Set[int] = set()
+        previous_offset: Optional[int] = None
+        for offset, leaving, index in events:
+            if offset != previous_offset:
+                if previous_offset is not None:
+                    add_boundary(previous_offset)
+                    add_active(tuple(sorted(stack)) if len(stack) > 1 else tuple(stack))
+                previous_offset = offset
+            if leaving:
+                stack.discard(index)
+            else:
+                stack.add(index)
+        if previous_offset is not None:
+            add_boundary(previous_offset)
+            add_active(tuple(sorted(stack)))
+        self.boundaries = boundaries
+        self.active = active
+        self.count = len(spans)
+
+    def update(self) -> None:
+        """Index spans which have been added to the end of the list since the index was updated.
+
+        Spans which start after every indexed span (such as those added by appending to a Text)
+        are added to the end of the index. Otherwise the index is rebuilt.
+        """
+        spans = self.spans
+        boundaries = self.boundaries
+        active = self.active
+        for index in range(self.count, len(spans)):
+            start, end, _ = spans[index]
+            if boundaries and start < boundaries[-1]:
+                self._build()
+                return
+            # No span covers offsets after the last boundary
+            if not boundaries or start > boundaries[-1]:
+                boundaries.append(start)
+                active.append((index,) if end > start else ())
+            elif end > start:
+                active[-1] = (index,)
+            if end > start:
+                boundaries.append(end)
+                active.append(())
+        self.count = len(spans)
+
+    def get_spans_at(self, offset: int) -> Tuple[int, ...]:
+        """Get the indexes of the spans which cover an offset.
+
+        Args:
+            offset (int): An offset in to the text.
+
+        Returns:
+            Tuple[int, ...]: Indexes of the spans, in ascending order.
+        """
+        interval = bisect_right(self.boundaries, offset) - 1
+        return self.active[interval] if interval >= 0 else ()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import bisect
 import os
+import pkgutil
 import sys
 
 if sys.version_info[:2] >= (3, 9):
@@ -9,10 +10,11 @@ if sys.version_info[:2] >= (3, 9):
 else:
     from functools import lru_cache as cache  # pragma: no cover
 
-from importlib import import_module
 from typing import TYPE_CHECKING, cast
 
+from rich._unicode_data._packed import unpack
 from rich._unicode_data._versions import VERSIONS
+from rich._unicode_data._width_table import WidthTable
 
 if TYPE_CHECKING:
     from rich.cells import CellTable
@@ -85,9 +87,37 @@ def load(unicode_version: str = "auto") -> CellTable:
             insert_position = bisect.bisect_left(VERSION_ORDER, version_numbers)
             version = VERSIONS[max(0, insert_position - 1)]
 
+    cell_table, _width_table = _load_version(version)
+    return cell_table
+
+
+@cache
+def load_width_table(unicode_version: str = "auto") -> WidthTable:
+    """Load a lookup table of cell widths for the given unicode version.
+
+    Args:
+        unicode_version: Unicode version, `"auto"` to auto detect, `"latest"` for the latest unicode version.
+
+    """
+    _cell_table, width_table = _load_version(load(unicode_version).unicode_version)
+    return width_table
+
+
+@cache
+def _load_version(version: str) -> tuple[CellTable, WidthTable]:
+    """Read the data file for an exact unicode version.
+
+    Args:
+        version: A version in `VERSIONS`.
+
+    Returns:
+        The cell table and width table.
+    """
+    from rich.cells import CellTable
+
     version_path_component = version.replace(".", "-")
-    module_name = f".unicode{version_path_component}"
-    module = import_module(module_name, "rich._unicode_data")
-    if TYPE_CHECKING:
-        assert isinstance(module.cell_table, CellTable)
-    return module.cell_table
+    # Read with the package's loader, so the data may be read from a zip file
+    packed = pkgutil.get_data(__name__, f"unicode{version_path_component}.bin")
+    assert packed is not None, "unable to load unicode data"
+    widths, narrow_to_wide, width_table = unpack(packed)
+    return CellTable(version, widths, narrow_to_wide), width_table
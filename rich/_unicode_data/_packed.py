@@ -0,0 +1,107 @@
+"""Reads and writes the binary unicode data files (unicode*.bin), generated by tools/make_width_tables.py.
+
+A file is compressed with zlib, and contains a header followed by little endian arrays:
+
+- Ranges of codepoints and their cell widths, as (start, end, width) triples of uint32.
+- Codepoints which become wide when followed by variation selector 16, as uint32.
+- The page index of the width table, as uint16.
+- The pages of the width table, one byte per codepoint.
+
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+from typing import List, Tuple
+
+from rich._unicode_data._width_table import WidthTable
+
+MAGIC = b"RUD1"
+# Magic, number of width ranges, number of narrow to wide codepoints, number of pages in the index
+_HEADER = struct.Struct("<4sIII")
+
+
+def _to_little_endian(values: array[int]) -> bytes:
+    """Get the bytes of an array, in little endian order."""
+    if sys.byteorder == "big":  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array[int]:
+    """Make an array from bytes in little endian order."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+def pack(
+    widths: List[Tuple[int, int, int]],
+    narrow_to_wide: frozenset[str],
+    width_table: WidthTable,
+) -> bytes:
+    """Pack unicode data in to the binary format.
+
+    Args:
+        widths: Ranges of codepoints and their widths.
+        narrow_to_wide: Characters which become wide when followed by variation selector 16.
+        width_table: A width table built from `widths`.
+
+    Returns:
+        Compressed data.
+    """
+    data = b"".join(
+        [
+            _HEADER.pack(
+                MAGIC, len(widths), len(narrow_to_wide), len(width_table.index)
+            ),
+            _to_little_endian(
+                array("I", [value for width_range in widths for value in width_range])
+            ),
+            _to_little_endian(array("I", sorted(map(ord, narrow_to_wide)))),
+            _to_little_endian(width_table.index),
+            width_table.pages,
+        ]
+    )
+    return zlib.compress(data, 9)
+
+
+def unpack(
+    packed: bytes,
+) -> Tuple[List[Tuple[int, int, int]], frozenset[str], WidthTable]:
+    """Unpack unicode data from the binary format.
+
+    Args:
+        packed: Data returned from `pack`.
+
+    Raises:
+        ValueError: If the data is not in the expected format.
+
+    Returns:
+        A tuple of width ranges, narrow to wide characters, and the width table.
+    """
+    data = zlib.decompress(packed)
+    magic, widths_count, narrow_to_wide_count, index_count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a unicode data file")
+    position = _HEADER.size
+
+    def read_array(typecode: str, count: int) -> array[int]:
+        nonlocal position
+        size = count * array(typecode).itemsize
+        values = _from_little_endian(typecode, data[position : position + size])
+        position += size
+        return values
+
+    width_values = iter(read_array("I", widths_count * 3))
+    widths = list(zip(width_values, width_values, width_values))
+    narrow_to_wide = frozenset(map(chr, read_array("I", narrow_to_wide_count)))
+    index = read_array("H", index_count)
+    pages = data[position:]
+    return widths, narrow_to_wide, WidthTable(index, pages, widths)
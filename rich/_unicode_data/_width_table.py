@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+from array import array
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# Codepoints are looked up in pages of 256
+PAGE_SHIFT = 8
+PAGE_SIZE = 1 << PAGE_SHIFT
+PAGE_MASK = PAGE_SIZE - 1
+PAGE_COUNT = 0x110000 >> PAGE_SHIFT
+
+# Control codes occupy no cells, but are not in the width tables
+CONTROL_RANGES = ((1, 31, 0), (0x7F, 0x9F, 0))
+
+FindRuns = Callable[[str], List[str]]
+
+# Number of characters to measure before compiling the regexes used by `cell_len`
+COMPILE_THRESHOLD = 4096
+
+# Finds a character outside of the Basic Multilingual Plane
+_search_astral = re.compile("[\U00010000-\U0010ffff]").search
+
+
+def _find_nothing(text: str) -> list[str]:
+    """Stands in for a regex with no characters to find."""
+    return []
+
+
+def _compile_find_runs(ranges: Iterable[tuple[int, int]]) -> FindRuns:
+    """Compile a function which finds runs of characters in the given ranges of codepoints."""
+    character_class = "".join(
+        f"\\U{start:08x}" if start == end else f"\\U{start:08x}-\\U{end:08x}"
+        for start, end in ranges
+    )
+    if not character_class:
+        return _find_nothing
+    return re.compile(f"[{character_class}]+").findall
+
+
+class WidthTable:
+    """A two-level lookup table of the number of cells occupied by every codepoint.
+
+    Codepoints are divided in to pages of 256. The index maps a page number on to the offset
+    of its widths in `pages`, where identical pages are stored only once.
+
+    Args:
+        index: Offset in pages (divided by the page size) for each page of codepoints.
+        pages: Cell width of each codepoint, one byte per codepoint.
+        widths: Ranges of codepoints and their widths, as found in `CellTable.widths`.
+    """
+
+    __slots__ = ["index", "pages", "widths", "_finders", "_measured"]
+
+    def __init__(
+        self,
+        index: array[int],
+        pages: bytes,
+        widths: Iterable[tuple[int, int, int]],
+    ) -> None:
+        self.index = index
+        self.pages = pages
+        self.widths = list(widths)
+        self._finders: Optional[Tuple[FindRuns, FindRuns, FindRuns, FindRuns]] = None
+        self._measured = 0
+
+    @classmethod
+    def from_widths(cls, widths: Iterable[tuple[int, int, int]]) -> WidthTable:
+        """Build a lookup table from ranges of codepoints.
+
+        Args:
+            widths: Ranges of codepoints and their widths, as found in `CellTable.widths`.
+                Codepoints not in a range occupy a single cell.
+
+        Returns:
+            A new width table.
+        """
+        widths = list(widths)
+        codepoint_widths = bytearray(b"\x01" * (PAGE_COUNT * PAGE_SIZE))
+        for start, end, width in (*CONTROL_RANGES, *widths):
+            codepoint_widths[start : end + 1] = bytes([width]) * (end - start + 1)
+        codepoint_widths[0] = 0
+
+        index: array[int] = array("H")
+        pages = bytearray()
+        page_offsets: dict[bytes, int] = {}
+        for page_start in range(0, len(codepoint_widths), PAGE_SIZE):
+            page = bytes(codepoint_widths[page_start : page_start + PAGE_SIZE])
+            offset = page_offsets.get(page)
+            if offset is None:
+                offset = page_offsets[page] = len(pages) >> PAGE_SHIFT
+                pages.extend(page)
+            index.append(offset)
+        return cls(index, bytes(pages), widths)
+
+    def get_width(self, codepoint: int) -> int:
+        """Get the number of cells occupied by a codepoint.
+
+        Args:
+            codepoint: A unicode codepoint.
+
+        Returns:
+            Number of cells (0, 1 or 2).
+        """
+        return self.pages[
+            self.index[codepoint >> PAGE_SHIFT] << PAGE_SHIFT | codepoint & PAGE_MASK
+        ]
+
+    def _compile(self) -> Tuple[FindRuns, FindRuns, FindRuns, FindRuns]:
+        """Compile the regexes used by `cell_len`, on first use."""
+        widths = self.widths
+        wide = [(start, end) for start, end, width in widths if width == 2]
+        zero = [
+            (start, end)
+            for start, end, width in (*CONTROL_RANGES, *widths)
+            if width == 0
+        ]
+        # The regex engine checks ranges above U+FFFF one at a time, which is slow
+        # when the text has no such characters
+        wide_bmp = [(start, min(end, 0xFFFF)) for start, end in wide if start <= 0xFFFF]
+        zero_bmp = [(start, min(end, 0xFFFF)) for start, end in zero if start <= 0xFFFF]
+        self._finders = finders = (
+            _compile_find_runs(wide),
+            _compile_find_runs(zero),
+            _compile_find_runs(wide_bmp),
+            _compile_find_runs(zero_bmp),
+        )
+        return finders
+
+    def cell_len(self, text: str) -> int:
+        """Get the sum of the cell widths of each character in a string.
+
+        This does not account for zero width joiners or variation selectors.
+
+        Args:
+            text: String to measure.
+
+        Returns:
+            Number of cells.
+        """
+        finders = self._finders
+        if finders is None:
+            self._measured += len(text)
+            if self._measured < COMPILE_THRESHOLD:
+                # Compiling takes a few milliseconds, which isn't worth it for a little text
+                index = self.index
+                pages = self.pages
+                return sum(
+                    [
+                        pages[
+                            index[codepoint >> PAGE_SHIFT] << PAGE_SHIFT
+                            | codepoint & PAGE_MASK
+                        ]
+                        for codepoint in map(ord, text)
+                    ]
+                )
+            finders = self._compile()
+        find_wide, find_zero, find_wide_bmp, find_zero_bmp = finders
+        if _search_astral(text) is None:
+            find_wide = find_wide_bmp
+            find_zero = find_zero_bmp
+        return (
+            len(text) + sum(map(len, find_wide(text))) - sum(map(len, find_zero(text)))
+        )
@@ -4,9 +4,10 @@ import re
 from typing import Iterable
 
 from ._loop import loop_last
-from .cells import cell_len, chop_cells
+from .cells import _is_single_cell_widths, cell_len, chop_cells
 
 re_word = re.compile(r"\s*\S+\s*")
+re_word_parts = re.compile(r"(\s*\S+)(\s*)")
 
 
 def words(text: str) -> Iterable[tuple[int, int, str]]:
@@ -36,44 +37,98 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
     Returns:
         A list of indices to break the line at.
     """
+    # Each word is a tuple of (word, whitespace to the right of the word)
+    word_parts: list[tuple[str, str]] = re_word_parts.findall(text)
+    if _is_single_cell_widths(text):
+        # Every character is a single cell, so cell lengths are string lengths
+        return _divide_single_cell_line(word_parts, width, fold)
+
     break_positions: list[int] = []  # offsets to insert the breaks at
     append = break_positions.append
     cell_offset = 0
+    end = 0
     _cell_len = cell_len
 
-    for start, _end, word in words(text):
-        word_length = _cell_len(word.rstrip())
-        remaining_space = width - cell_offset
-        word_fits_remaining_space = remaining_space >= word_length
+    for word, space in word_parts:
+        start = end
+        end += len(word) + len(space)
+        word_length = _cell_len(word)
+        # Measured together, since a zero width joiner may join the word to the space
+        word_space_length = _cell_len(word + space) if space else word_length
 
-        if word_fits_remaining_space:
+        if width - cell_offset >= word_length:
             # Simplest case - the word fits within the remaining width for this line.
-            cell_offset += _cell_len(word)
-        else:
-            # Not enough space remaining for this word on the current line.
-            if word_length > width:
-                # The word doesn't fit on any line, so we can't simply
-                # place it on the next line...
-                if fold:
-                    # Fold the word across multiple lines.
-                    folded_word = chop_cells(word, width=width)
-                    for last, line in loop_last(folded_word):
-                        if start:
-                            append(start)
-                        if last:
-                            cell_offset = _cell_len(line)
-                        else:
-                            start += len(line)
-                else:
-                    # Folding isn't allowed, so crop the word.
+            cell_offset += word_space_length
+        elif word_length > width:
+            # The word doesn't fit on any line, so we can't simply
+            # place it on the next line...
+            if fold:
+                # Fold the word across multiple lines.
+                folded_word = chop_cells(word + space, width=width)
+                for last, line in loop_last(folded_word):
                     if start:
                         append(start)
-                    cell_offset = _cell_len(word)
-            elif cell_offset and start:
-                # The word doesn't fit within the remaining space on the current
-                # line, but it *can* fit on to the next (empty) line.
-                append(start)
-                cell_offset = _cell_len(word)
+                    if last:
+                        cell_offset = _cell_len(line)
+                    else:
+                        start += len(line)
+            else:
+                # Folding isn't allowed, so crop the word.
+                if start:
+                    append(start)
+                cell_offset = word_space_length
+        elif cell_offset and start:
+            # The word doesn't fit within the remaining space on the current
+            # line, but it *can* fit on to the next (empty) line.
+            append(start)
+            cell_offset = word_space_length
+
+    return break_positions
+
+
+def _divide_single_cell_line(
+    word_parts: list[tuple[str, str]], width: int, fold: bool
+) -> list[int]:
+    """Divide a line where every character is a single cell.
+
+    Equivalent to `divide_line`, with the cell offsets calculated from the lengths of the words.
+
+    Args:
+        word_parts: Pairs of word and the whitespace which follows it.
+        width: The available cell width.
+        fold: If True, words longer than `width` will be folded onto a new line.
+
+    Returns:
+        A list of indices to break the line at.
+    """
+    break_positions: list[int] = []
+    append = break_positions.append
+    cell_offset = 0
+    end = 0
+
+    for word, space in word_parts:
+        start = end
+        word_length = len(word)
+        word_space_length = word_length + len(space)
+        end += word_space_length
+
+        if width - cell_offset >= word_length:
+            cell_offset += word_space_length
+        elif word_length > width:
+            if fold:
+                # Break every `width` characters, leaving the remainder on the last line
+                fold_end = start + word_space_length
+                for fold_start in range(start, fold_end, width):
+                    if fold_start:
+                        append(fold_start)
+                cell_offset = fold_end - fold_start
+            else:
+                if start:
+                    append(start)
+                cell_offset = word_space_length
+        elif cell_offset and start:
+            append(start)
+            cell_offset = word_space_length
 
     return break_positions
 
@@ -0,0 +1,372 @@
+"""A registry of the caches used by Rich, which may be inspected, resized, and cleared.
+
+Rich caches the results of frequently called functions (such as parsing styles and measuring
+text). The maximum size of each cache is a trade off between speed and memory, and the defaults
+may not suit every application. A long running process may inspect the caches with
+:func:`cache_info`, then adjust them with :func:`resize` or :func:`set_memory_budget`.
+
+The memory budget may also be set with the ``RICH_CACHE_MEMORY`` environment variable, as a
+number of bytes with an optional ``K``, ``M``, or ``G`` suffix (e.g. ``RICH_CACHE_MEMORY=8M``).
+
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from functools import lru_cache as _lru_cache
+from functools import partial
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+CacheValue = TypeVar("CacheValue")
+
+# Default maximum number of entries, and an estimate of the memory used per entry in bytes
+CACHE_SIZES: Dict[str, Tuple[int, int]] = {
+    "cells.cached_cell_len": (4096, 150),
+    "color.downgrade": (1024, 250),
+    "color.get_ansi_codes": (1024, 350),
+    "color.parse": (1024, 350),
+    "markup.parse": (1024, 1500),
+    "palette.match": (1024, 150),
+    "progress_bar.pulse_segments": (16, 4000),
+    "segment.split_cells": (1024 * 16, 900),
+    "sgr.state": (4096, 300),
+    "sgr.transition": (4096, 200),
+    "style.clear_meta_and_links": (128, 400),
+    "style.get_html_style": (1024, 300),
+    "style.interner": (4096, 700),
+    "style.normalize": (1024, 200),
+    "style.parse": (4096, 400),
+    "syntax.lexed_code": (8, 50_000),
+    "syntax.tokens": (32, 100_000),
+    "traceback.segments": (256, 10_000),
+    "traceback.syntax": (64, 50_000),
+}
+
+_SIZE_SUFFIXES = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a cache."""
+
+    name: str
+    """Name of the cache."""
+    hits: Optional[int]
+    """Number of calls which found a result in the cache, or ``None`` if not counted."""
+    misses: Optional[int]
+    """Number of calls which didn't find a result in the cache, or ``None`` if not counted."""
+    maxsize: int
+    """Maximum number of entries."""
+    currsize: int
+    """Current number of entries."""
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Ratio of hits to calls, or ``None`` if there have been no calls (or they aren't counted)."""
+        if self.hits is None or self.misses is None:
+            return None
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else None
+
+
+class _Cache:
+    """A cache registered with a name."""
+
+    def __init__(
+        self,
+        name: str,
+        get_info: Callable[[], Tuple[Optional[int], Optional[int], int]],
+        resize: Callable[[int], None],
+        clear: Callable[[], None],
+    ) -> None:
+        self.name = name
+        self.maxsize = _get_maxsize(name)
+        self.get_info = get_info
+        self.resize = resize
+        self.clear = clear
+
+    def info(self) -> CacheInfo:
+        hits, misses, currsize = self.get_info()
+        return CacheInfo(self.name, hits, misses, self.maxsize, currsize)
+
+
+_caches: Dict[str, _Cache] = {}
+_maxsizes: Dict[str, int] = {}
+
+
+def _parse_size(size: str) -> int:
+    """Parse a size in bytes, with an optional K, M, or G suffix."""
+    size = size.strip().upper().rstrip("B")
+    multiplier = _SIZE_SUFFIXES.get(size[-1:], 1)
+    if multiplier != 1:
+        size = size[:-1]
+    return int(float(size) * multiplier)
+
+
+def _budget_maxsizes(budget: int) -> Dict[str, int]:
+    """Scale the default maximum size of each cache, to fit within a budget.
+
+    Every cache keeps at least one entry. The memory for caches which would be scaled below one
+    entry is taken from the budget, before the other caches are scaled.
+    """
+    maxsizes: Dict[str, int] = {}
+    scaled = dict(CACHE_SIZES)
+    while scaled:
+        default_memory = sum(
+            maxsize * entry_size for maxsize, entry_size in scaled.values()
+        )
+        scale = max(0, budget) / default_memory
+        minimum_caches = {
+            name: entry_size
+            for name, (maxsize, entry_size) in scaled.items()
+            if maxsize * scale < 1
+        }
+        if not minimum_caches:
+            break
+        for name, entry_size in minimum_caches.items():
+            maxsizes[name] = 1
+            budget -= entry_size
+            del scaled[name]
+    for name, (maxsize, _entry_size) in scaled.items():
+        maxsizes[name] = max(1, int(maxsize * scale))
+    return maxsizes
+
+
+def _get_maxsize(name: str) -> int:
+    """Get the maximum size a cache should be created with."""
+    if name not in CACHE_SIZES:
+        raise KeyError(f"no cache called {name!r}")
+    return _maxsizes.get(name, CACHE_SIZES[name][0])
+
+
+def lru_cache(name: str) -> Callable[[F], F]:
+    """A replacement for :func:`functools.lru_cache`, which registers the cache so that it may be resized.
+
+    Resizing replaces the cached function. The function will be updated where it is stored in its class,
+    or in any Rich module.
+
+    Args:
+        name (str): Name of the cache, which must be in ``CACHE_SIZES``.
+
+    Returns:
+        Callable[[F], F]: A decorator.
+    """
+
+    def decorator(function: F) -> F:
+        cached_function = _lru_cache(maxsize=_get_maxsize(name))(function)
+
+        def get_info() -> Tuple[Optional[int], Optional[int], int]:
+            hits, misses, _maxsize, currsize = cached_function.cache_info()
+            return hits, misses, currsize
+
+        def resize(maxsize: int) -> None:
+            nonlocal cached_function
+            previous_function = cached_function
+            cached_function = _lru_cache(maxsize=maxsize)(function)
+            _replace_function(function, previous_function, cached_function)
+
+        def clear() -> None:
+            cached_function.cache_clear()
+
+        register(name, get_info, resize, clear)
+        return cached_function  # type: ignore[return-value]
+
+    return decorator
+
+
+def _replace_function(
+    function: Callable[..., Any],
+    previous_function: Callable[..., Any],
+    new_function: Callable[..., Any],
+) -> None:
+    """Replace references to a cached function with a new cached function."""
+    module = sys.modules[function.__module__]
+    owner: Any = module
+    *owner_names, attribute_name = function.__qualname__.split(".")
+    for owner_name in owner_names:
+        owner = getattr(owner, owner_name)
+    if owner is not module:
+        value = owner.__dict__[attribute_name]
+        if isinstance(value, classmethod):
+            setattr(owner, attribute_name, classmethod(new_function))
+        elif isinstance(value, staticmethod):
+            setattr(owner, attribute_name, staticmethod(new_function))
+        else:
+            setattr(owner, attribute_name, new_function)
+        return
+    # Module level functions may have been imported in to other Rich modules
+    for module_name, rich_module in list(sys.modules.items()):
+        if module_name != "rich" and not module_name.startswith("rich."):
+            continue
+        for name, value in list(vars(rich_module).items()):
+            if value is previous_function:
+                setattr(rich_module, name, new_function)
+
+
+def register(
+    name: str,
+    get_info: Callable[[], Tuple[Optional[int], Optional[int], int]],
+    resize: Callable[[int], None],
+    clear: Callable[[], None],
+) -> int:
+    """Register a cache which isn't created with :func:`lru_cache`.
+
+    Args:
+        name (str): Name of the cache, which must be in ``CACHE_SIZES``.
+        get_info (Callable[[], Tuple[Optional[int], Optional[int], int]]): Callable which returns hits, misses, and current size.
+        resize (Callable[[int], None]): Callable which sets the maximum size.
+        clear (Callable[[], None]): Callable which clears the cache.
+
+    Returns:
+        int: The maximum size the cache should have.
+    """
+    cache = _caches[name] = _Cache(name, get_info, resize, clear)
+    return cache.maxsize
+
+
+class LRUCache(Generic[CacheValue]):
+    """A least recently used cache, for caches which aren't created with :func:`lru_cache`.
+
+    Args:
+        name (str): Name of the cache, which must be in ``CACHE_SIZES``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._entries: "OrderedDict[Hashable, CacheValue]" = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = register(
+            name, lambda: (None, None, len(self._entries)), self.resize, self.clear
+        )
+
+    def get(self, key: Hashable) -> Optional[CacheValue]:
+        """Get a value, or ``None`` if it isn't in the cache."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: CacheValue) -> None:
+        """Set a value, discarding the least recently used values if the cache is full."""
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def values(self) -> List[CacheValue]:
+        """Get the values, from least to most recently used."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def resize(self, maxsize: int) -> None:
+        """Set the maximum number of entries, and clear the cache."""
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _get_cache(name: str) -> _Cache:
+    """Get a registered cache."""
+    if name not in _caches:
+        if name in CACHE_SIZES:
+            # The module with the cache hasn't been imported yet
+            return _Cache(name, lambda: (0, 0, 0), partial(_set_maxsize, name), _no_op)
+        raise KeyError(f"no cache called {name!r}")
+    return _caches[name]
+
+
+def _set_maxsize(name: str, maxsize: int) -> None:
+    """Set the maximum size of a cache, before it is created."""
+    _maxsizes[name] = maxsize
+
+
+def _no_op() -> None:
+    """Does nothing."""
+
+
+def cache_info(names: Optional[Iterable[str]] = None) -> List[CacheInfo]:
+    """Get statistics for caches.
+
+    Args:
+        names (Iterable[str], optional): Names of caches, or ``None`` for all caches.
+
+    Returns:
+        List[CacheInfo]: Statistics for each cache.
+    """
+    return [
+        _get_cache(name).info()
+        for name in (sorted(CACHE_SIZES) if names is None else names)
+    ]
+
+
+def resize(name: str, maxsize: int) -> None:
+    """Set the maximum size of a cache. The cache is cleared.
+
+    Args:
+        name (str): Name of the cache.
+        maxsize (int): Maximum number of entries.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    cache = _get_cache(name)
+    _set_maxsize(name, maxsize)
+    cache.maxsize = maxsize
+    cache.resize(maxsize)
+
+
+def clear(name: Optional[str] = None) -> None:
+    """Clear a cache.
+
+    Args:
+        name (str, optional): Name of the cache, or ``None`` to clear all caches.
+    """
+    for cache_name in CACHE_SIZES if name is None else [name]:
+        _get_cache(cache_name).clear()
+
+
+def estimate_memory() -> int:
+    """Estimate the memory that will be used when every cache is full.
+
+    Returns:
+        int: Approximate number of bytes.
+    """
+    return sum(
+        _get_cache(name).maxsize * entry_size
+        for name, (_maxsize, entry_size) in CACHE_SIZES.items()
+    )
+
+
+def set_memory_budget(budget: int) -> None:
+    """Resize every cache in proportion to its default size, so that the caches are
+    estimated to use at most the given amount of memory. All caches are cleared.
+
+    Args:
+        budget (int): Approximate number of bytes to use.
+    """
+    for name, maxsize in _budget_maxsizes(budget).items():
+        resize(name, maxsize)
+
+
+_budget = os.environ.get("RICH_CACHE_MEMORY", "")
+if _budget:
+    try:
+        _maxsizes.update(_budget_maxsizes(_parse_size(_budget)))
+    except ValueError:
+        pass
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from operator import itemgetter
 from typing import Callable, NamedTuple, Sequence, Tuple
 
+from rich import caches
 from rich._unicode_data import load as load_cell_table
+from rich._unicode_data import load_width_table
+from rich._unicode_data._width_table import PAGE_MASK, PAGE_SHIFT
 
 CellSpan = Tuple[int, int, int]
 
@@ -43,7 +45,6 @@ class CellTable(NamedTuple):
     narrow_to_wide: frozenset[str]
 
 
-@lru_cache(maxsize=4096)
 def get_character_cell_size(character: str, unicode_version: str = "auto") -> int:
     """Get the cell size of a character.
 
@@ -54,31 +55,15 @@ def get_character_cell_size(character: str, unicode_version: str = "auto") -> in
     Returns:
         int: Number of cells (0, 1 or 2) occupied by that character.
     """
+    table = load_width_table(unicode_version)
     codepoint = ord(character)
-    if codepoint and codepoint < 32 or 0x07F <= codepoint < 0x0A0:
-        return 0
-    table = load_cell_table(unicode_version).widths
-
-    last_entry = table[-1]
-    if codepoint > last_entry[1]:
-        return 1
-
-    lower_bound = 0
-    upper_bound = len(table) - 1
-
-    while lower_bound <= upper_bound:
-        index = (lower_bound + upper_bound) >> 1
-        start, end, width = table[index]
-        if codepoint < start:
-            upper_bound = index - 1
-        elif codepoint > end:
-            lower_bound = index + 1
-        else:
-            return width
-    return 1
+    # Inlined WidthTable.get_width
+    return table.pages[
+        table.index[codepoint >> PAGE_SHIFT] << PAGE_SHIFT | codepoint & PAGE_MASK
+    ]
 
 
-@lru_cache(4096)
+@caches.lru_cache("cells.cached_cell_len")
 def cached_cell_len(text: str, unicode_version: str = "auto") -> int:
     """Get the number of cells required to display text.
 
@@ -128,11 +113,14 @@ def _cell_len(text: str, unicode_version: str) -> int:
     # "\ufe0f" is variation selector 16
     if "\u200d" not in text and "\ufe0f" not in text:
         # Simplest case with no unicode stuff that changes the size
-        return sum(
-            get_character_cell_size(character, unicode_version) for character in text
-        )
+        return load_width_table(unicode_version).cell_len(text)
 
     cell_table = load_cell_table(unicode_version)
+    width_table = load_width_table(unicode_version)
+    width_index = width_table.index
+    width_pages = width_table.pages
+    page_shift = PAGE_SHIFT
+    page_mask = PAGE_MASK
     total_width = 0
     last_measured_character: str | None = None
 
@@ -150,7 +138,11 @@ def _cell_len(text: str, unicode_version: str) -> int:
                 total_width += last_measured_character in cell_table.narrow_to_wide
                 last_measured_character = None
         else:
-            if character_width := get_character_cell_size(character, unicode_version):
+            codepoint = ord(character)
+            if character_width := width_pages[
+                width_index[codepoint >> page_shift] << page_shift
+                | codepoint & page_mask
+            ]:
                 last_measured_character = character
                 total_width += character_width
         index += 1
@@ -177,6 +169,11 @@ def split_graphemes(
     """
 
     cell_table = load_cell_table(unicode_version)
+    width_table = load_width_table(unicode_version)
+    width_index = width_table.index
+    width_pages = width_table.pages
+    page_shift = PAGE_SHIFT
+    page_mask = PAGE_MASK
     codepoint_count = len(text)
     index = 0
     last_measured_character: str | None = None
@@ -215,7 +212,10 @@ def split_graphemes(
                     spans[-1] = (start, index, cell_length)
             continue
 
-        if character_width := get_character_cell_size(character, unicode_version):
+        codepoint = ord(character)
+        if character_width := width_pages[
+            width_index[codepoint >> page_shift] << page_shift | codepoint & page_mask
+        ]:
             last_measured_character = character
             spans.append((index, index := index + 1, character_width))
             total_width += character_width
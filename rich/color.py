@@ -2,9 +2,9 @@ import re
 import sys
 from colorsys import rgb_to_hls
 from enum import IntEnum
-from functools import lru_cache
 from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
 
+from . import caches
 from ._palettes import EIGHT_BIT_PALETTE, STANDARD_PALETTE, WINDOWS_PALETTE
 from .color_triplet import ColorTriplet
 from .repr import Result, rich_repr
@@ -429,7 +429,7 @@ class Color(NamedTuple):
         return cls(name="default", type=ColorType.DEFAULT)
 
     @classmethod
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("color.parse")
     def parse(cls, color: str) -> "Color":
         """Parse a color definition."""
         original_color = color
@@ -481,7 +481,7 @@ class Color(NamedTuple):
                 )
             return cls(color, ColorType.TRUECOLOR, triplet=triplet)
 
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("color.get_ansi_codes")
     def get_ansi_codes(self, foreground: bool = True) -> Tuple[str, ...]:
         """Get the ANSI escape codes for this color."""
         _type = self.type
@@ -509,7 +509,7 @@ class Color(NamedTuple):
             red, green, blue = self.triplet
             return ("38" if foreground else "48", "2", str(red), str(green), str(blue))
 
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("color.downgrade")
     def downgrade(self, system: ColorSystem) -> "Color":
         """Downgrade a color system to a system with fewer colors."""
 
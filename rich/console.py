@@ -8,9 +8,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
 from getpass import getpass
-from html import escape
+from importlib import import_module
 from inspect import isclass
-from itertools import islice
+from itertools import chain, islice
 from math import ceil
 from time import monotonic
 from types import FrameType, ModuleType, TracebackType
@@ -27,6 +27,7 @@ from typing import (
     NamedTuple,
     Optional,
     Protocol,
+    Sequence,
     TextIO,
     Tuple,
     Type,
@@ -42,6 +43,7 @@ from ._emoji_replace import _emoji_replace
 from ._export_format import CONSOLE_HTML_FORMAT, CONSOLE_SVG_FORMAT
 from ._fileno import get_fileno
 from ._log_render import FormatTimeCallable, LogRender
+from ._record_buffer import RecordBuffer
 from .align import Align, AlignMethod
 from .color import ColorSystem, blend_rgb
 from .control import Control
@@ -49,26 +51,47 @@ from .emoji import EmojiVariant
 from .highlighter import NullHighlighter, ReprHighlighter
 from .markup import render as render_markup
 from .measure import Measurement, measure_renderables
-from .pager import Pager, SystemPager
-from .pretty import Pretty, is_expandable
 from .protocol import rich_cast
 from .region import Region
-from .scope import render_scope
-from .screen import Screen
 from .segment import Segment
 from .style import Style, StyleType
-from .styled import Styled
 from .terminal_theme import DEFAULT_TERMINAL_THEME, SVG_EXPORT_THEME, TerminalTheme
 from .text import Text, TextType
 from .theme import Theme, ThemeStack
 
 if TYPE_CHECKING:
     from ._windows import WindowsConsoleFeatures
+    from .export import StreamExporter
     from .live import Live
+    from .pager import Pager
     from .status import Status
+    from .table import Table
+
+# Names which were imported by this module, and are now imported on first use
+_DEFERRED_IMPORTS = {
+    "escape": "html",
+    "Pager": "rich.pager",
+    "SystemPager": "rich.pager",
+    "Pretty": "rich.pretty",
+    "is_expandable": "rich.pretty",
+    "render_scope": "rich.scope",
+    "Screen": "rich.screen",
+    "Styled": "rich.styled",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import names that are no longer imported when the module is loaded."""
+    module_name = _DEFERRED_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
+
 
 JUPYTER_DEFAULT_COLUMNS = 115
 JUPYTER_DEFAULT_LINES = 100
+# Number of segments to write at a time when printing with stream=True
+STREAM_CHUNK_SIZE = 1024
 WINDOWS = sys.platform == "win32"
 
 HighlighterType = Callable[[Union[str, "Text"]], "Text"]
@@ -279,6 +302,36 @@ RenderResult = Iterable[Union[RenderableType, Segment]]
 _null_highlighter = NullHighlighter()
 
 
+def _insert_new_line_start(segments: Iterable[Segment]) -> Iterable[Segment]:
+    """Insert a new line before segments, if they contain more than one line.
+
+    Args:
+        segments (Iterable[Segment]): Segments to print.
+
+    Returns:
+        Iterable[Segment]: The segments, which may be preceded by a new line.
+    """
+    held: List[Segment] = []
+    iter_segments = iter(segments)
+    new_line = False
+    for segment in iter_segments:
+        held.append(segment)
+        text = segment.text
+        if new_line and text:
+            break
+        position = text.find("\n")
+        if position != -1:
+            if position < len(text) - 1:
+                break
+            new_line = True
+    else:
+        yield from held
+        return
+    yield Segment.line()
+    yield from held
+    yield from iter_segments
+
+
 class CaptureError(Exception):
     """An error in the Capture context manager."""
 
@@ -367,16 +420,41 @@ class ThemeContext:
         self.console.pop_theme()
 
 
+class StreamExportContext:
+    """A context manager to stream output to an exporter. See :meth:`~rich.console.Console.stream_export` for usage."""
+
+    def __init__(self, console: "Console", exporter: "StreamExporter") -> None:
+        self.console = console
+        self.exporter = exporter
+
+    def __enter__(self) -> "StreamExporter":
+        with self.console._lock:
+            self.console._stream_exporters.append(self.exporter)
+        return self.exporter
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        with self.console._lock:
+            self.console._stream_exporters.remove(self.exporter)
+            self.exporter.close()
+
+
 class PagerContext:
     """A context manager that 'pages' content. See :meth:`~rich.console.Console.pager` for usage."""
 
     def __init__(
         self,
         console: "Console",
-        pager: Optional[Pager] = None,
+        pager: Optional["Pager"] = None,
         styles: bool = False,
         links: bool = False,
     ) -> None:
+        from .pager import SystemPager
+
         self._console = console
         self.pager = SystemPager() if pager is None else pager
         self.styles = styles
@@ -412,6 +490,8 @@ class ScreenContext:
     def __init__(
         self, console: "Console", hide_cursor: bool, style: StyleType = ""
     ) -> None:
+        from .screen import Screen
+
         self.console = console
         self.hide_cursor = hide_cursor
         self.screen = Screen(style=style)
@@ -605,6 +685,10 @@ class Console:
         tab_size (int, optional): Number of spaces used to replace a tab character. Defaults to 8.
         record (bool, optional): Boolean to enable recording of terminal output,
             required to call :meth:`export_html`, :meth:`export_svg`, and :meth:`export_text`. Defaults to False.
+        record_max_lines (int, optional): Maximum number of lines to record. The oldest lines are discarded
+            when the limit is reached. Defaults to None for no limit.
+        record_max_bytes (int, optional): Maximum size of the recorded text in bytes. The oldest lines (or the start
+            of a line which is too long) are discarded when the limit is reached. Defaults to None for no limit.
         markup (bool, optional): Boolean to enable :ref:`console_markup`. Defaults to True.
         emoji (bool, optional): Enable emoji code. Defaults to True.
         emoji_variant (str, optional): Optional emoji variant, either "text" or "emoji". Defaults to None.
@@ -618,6 +702,8 @@ class Console:
         get_datetime (Callable[[], datetime], optional): Callable that gets the current time as a datetime.datetime object (used by Console.log),
             or None for datetime.now.
         get_time (Callable[[], time], optional): Callable that gets the current time in seconds, default uses time.monotonic.
+        optimize_sgr (bool, optional): Emit only the changes in style between consecutive segments, rather than
+            resetting and re-applying the style for every segment. Reduces output size. Defaults to False.
     """
 
     _environ: Mapping[str, str] = os.environ
@@ -642,6 +728,8 @@ class Console:
         no_color: Optional[bool] = None,
         tab_size: int = 8,
         record: bool = False,
+        record_max_lines: Optional[int] = None,
+        record_max_bytes: Optional[int] = None,
         markup: bool = True,
         emoji: bool = True,
         emoji_variant: Optional[EmojiVariant] = None,
@@ -654,6 +742,7 @@ class Console:
         safe_box: bool = True,
         get_datetime: Optional[Callable[[], datetime]] = None,
         get_time: Optional[Callable[[], float]] = None,
+        optimize_sgr: bool = False,
         _environ: Optional[Mapping[str, str]] = None,
     ):
         # Copy of os.environ allows us to replace it for testing
@@ -728,6 +817,7 @@ class Console:
         self.get_datetime = get_datetime or datetime.now
         self.get_time = get_time or monotonic
         self.style = style
+        self.optimize_sgr = optimize_sgr
         self.no_color = (
             no_color
             if no_color is not None
@@ -751,7 +841,12 @@ class Console:
         self._thread_locals = ConsoleThreadLocals(
             theme_stack=ThemeStack(themes.DEFAULT if theme is None else theme)
         )
-        self._record_buffer: List[Segment] = []
+        self._record_buffer: Union[List[Segment], RecordBuffer] = (
+            []
+            if record_max_lines is None and record_max_bytes is None
+            else RecordBuffer(record_max_lines, record_max_bytes)
+        )
+        self._stream_exporters: List[StreamExporter] = []
         self._render_hooks: List[RenderHook] = []
         self._live_stack: List[Live] = []
         self._is_alt_screen = False
@@ -899,6 +994,17 @@ class Console:
         """Remove theme from top of stack, restoring previous theme."""
         self._theme_stack.pop_theme()
 
+    def stream_export(self, exporter: "StreamExporter") -> "StreamExportContext":
+        """Write console output to an exporter as it is produced, for the duration of the context manager.
+
+        Args:
+            exporter (StreamExporter): An exporter from :mod:`rich.export`, which is closed on exit.
+
+        Returns:
+            StreamExportContext: A context manager.
+        """
+        return StreamExportContext(self, exporter)
+
     def use_theme(self, theme: Theme, *, inherit: bool = True) -> ThemeContext:
         """Use a different theme for the duration of the context manager.
 
@@ -1117,7 +1223,7 @@ class Console:
         return capture
 
     def pager(
-        self, pager: Optional[Pager] = None, styles: bool = False, links: bool = False
+        self, pager: Optional["Pager"] = None, styles: bool = False, links: bool = False
     ) -> PagerContext:
         """A context manager to display anything printed within a "pager". The pager application
         is defined by the system and will typically support at least pressing a key to scroll.
@@ -1568,15 +1674,20 @@ class Console:
             elif isinstance(renderable, ConsoleRenderable):
                 check_text()
                 append(renderable)
-            elif is_expandable(renderable):
-                check_text()
-                append(Pretty(renderable, highlighter=_highlighter))
             else:
-                append_text(_highlighter(str(renderable)))
+                from .pretty import Pretty, is_expandable
+
+                if is_expandable(renderable):
+                    check_text()
+                    append(Pretty(renderable, highlighter=_highlighter))
+                else:
+                    append_text(_highlighter(str(renderable)))
 
         check_text()
 
         if self.style is not None:
+            from .styled import Styled
+
             style = self.get_style(self.style)
             renderables = [Styled(renderable, style) for renderable in renderables]
 
@@ -1662,6 +1773,7 @@ class Console:
         crop: bool = True,
         soft_wrap: Optional[bool] = None,
         new_line_start: bool = False,
+        stream: bool = False,
     ) -> None:
         """Print to the console.
 
@@ -1681,6 +1793,8 @@ class Console:
             soft_wrap (bool, optional): Enable soft wrap mode which disables word wrapping and cropping of text or ``None`` for
                 Console default. Defaults to ``None``.
             new_line_start (bool, False): Insert a new line at the start if the output contains more than one line. Defaults to ``False``.
+            stream (bool, optional): Write output in chunks as it is rendered, rather than all at once, so that large renderables
+                don't need to be held in memory. Has no effect within a capture or a ``with console:`` block. Defaults to ``False``.
         """
         if not objects:
             objects = (NewLine(),)
@@ -1716,22 +1830,27 @@ class Console:
                 highlight=highlight,
             )
 
+            rendered = self._render_print(
+                renderables,
+                render_options,
+                None if style is None else self.get_style(style),
+            )
+
+            if stream and self._buffer_index == 1 and not self.is_jupyter:
+                segments: Iterable[Segment] = chain.from_iterable(rendered)
+                if new_line_start:
+                    segments = _insert_new_line_start(segments)
+                if crop:
+                    segments = chain.from_iterable(
+                        Segment.split_and_crop_lines(segments, self.width, pad=False)
+                    )
+                self._write_stream(segments)
+                return
+
             new_segments: List[Segment] = []
             extend = new_segments.extend
-            render = self.render
-            if style is None:
-                for renderable in renderables:
-                    extend(render(renderable, render_options))
-            else:
-                render_style = self.get_style(style)
-                new_line = Segment.line()
-                for renderable in renderables:
-                    for line, add_new_line in Segment.split_lines_terminator(
-                        render(renderable, render_options)
-                    ):
-                        extend(Segment.apply_style(line, render_style))
-                        if add_new_line:
-                            new_segments.append(new_line)
+            for segments in rendered:
+                extend(segments)
 
             if new_line_start:
                 if (
@@ -1748,6 +1867,77 @@ class Console:
             else:
                 self._buffer.extend(new_segments)
 
+    def _render_print(
+        self,
+        renderables: Iterable[RenderableType],
+        options: ConsoleOptions,
+        style: Optional[Style],
+    ) -> Iterable[Iterable[Segment]]:
+        """Render the renderables for :meth:`print`, applying a style to each line.
+
+        Args:
+            renderables (Iterable[RenderableType]): Renderables to print.
+            options (ConsoleOptions): Options for render.
+            style (Optional[Style]): Style to apply to each line, or ``None`` for no style.
+
+        Returns:
+            Iterable[Iterable[Segment]]: Iterables of rendered segments.
+        """
+        render = self.render
+        if style is None:
+            for renderable in renderables:
+                yield render(renderable, options)
+        else:
+            new_line = [Segment.line()]
+            for renderable in renderables:
+                for line, add_new_line in Segment.split_lines_terminator(
+                    render(renderable, options)
+                ):
+                    yield Segment.apply_style(line, style)
+                    if add_new_line:
+                        yield new_line
+
+    def _write_stream(self, segments: Iterable[Segment]) -> None:
+        """Write segments to the output file in chunks, as they are generated.
+
+        Args:
+            segments (Iterable[Segment]): Segments to write.
+        """
+        buffer = self._buffer
+        append = buffer.append
+        chunk_size = STREAM_CHUNK_SIZE
+        for segment in segments:
+            append(segment)
+            if len(buffer) >= chunk_size:
+                # Leaving the buffer context writes (and records) the buffer
+                self._exit_buffer()
+                self._enter_buffer()
+
+    def print_table_stream(
+        self,
+        table: "Table",
+        rows: Iterable[Sequence[Optional[RenderableType]]],
+        *,
+        sample_size: int = 100,
+    ) -> None:
+        """Print a table from an iterable of rows, writing each row as soon as it is produced.
+
+        Column widths are calculated from the first ``sample_size`` rows, which are read before anything
+        is written. See :class:`~rich.table.TableStream` for details.
+
+        Args:
+            table (Table): A table with the columns and style to print. Any rows in the table are ignored.
+            rows (Iterable[Sequence[Optional[RenderableType]]]): An iterable of rows, where each row is a
+                sequence of cells (renderables, or ``None`` for a blank cell).
+            sample_size (int, optional): Number of rows to measure before printing. Defaults to 100.
+        """
+        from .segment import Segments
+        from .table import TableStream
+
+        table_stream = TableStream(table, rows, sample_size=sample_size)
+        for segments in table_stream.render_chunks(self, self.options):
+            self.print(Segments(segments), end="")
+
     def print_json(
         self,
         json: Optional[str] = None,
@@ -1977,12 +2167,16 @@ class Console:
                 highlight=highlight,
             )
             if style is not None:
+                from .styled import Styled
+
                 renderables = [Styled(renderable, style) for renderable in renderables]
 
             filename, line_no, locals = self._caller_frame_info(_stack_offset)
             link_path = None if filename.startswith("<") else os.path.abspath(filename)
             path = filename.rpartition(os.sep)[-1]
             if log_locals:
+                from .scope import render_scope
+
                 locals_map = {
                     key: value
                     for key, value in locals.items()
@@ -2050,6 +2244,9 @@ class Console:
             if self.record and not self._buffer_index:
                 with self._record_buffer_lock:
                     self._record_buffer.extend(self._buffer[:])
+            if self._stream_exporters and not self._buffer_index:
+                for exporter in self._stream_exporters:
+                    exporter.write(self._buffer)
 
             if self._buffer_index == 0:
                 if self.is_jupyter:  # pragma: no cover
@@ -2125,6 +2322,10 @@ class Console:
         not_terminal = not self.is_terminal
         if self.no_color and color_system:
             buffer = Segment.remove_color(buffer)
+        if self.optimize_sgr:
+            from ._sgr_renderer import sgr_render
+
+            return sgr_render(buffer, color_system, legacy_windows, not_terminal)
         for text, style, control in buffer:
             if style:
                 append(
@@ -2203,7 +2404,7 @@ class Console:
                     if not segment.control
                 )
             if clear:
-                del self._record_buffer[:]
+                self._record_buffer.clear()
         return text
 
     def save_text(self, path: str, *, clear: bool = True, styles: bool = False) -> None:
@@ -2242,6 +2443,8 @@ class Console:
         Returns:
             str: String containing console contents as HTML.
         """
+        from html import escape
+
         assert (
             self.record
         ), "To export console contents set record=True in the constructor or instance"
@@ -2292,7 +2495,7 @@ class Console:
                 background=_theme.background_color.hex,
             )
             if clear:
-                del self._record_buffer[:]
+                self._record_buffer.clear()
         return rendered_code
 
     def save_html(
@@ -2352,6 +2555,7 @@ class Console:
             unique_id (str, optional): unique id that is used as the prefix for various elements (CSS styles, node
                 ids). If not set, this defaults to a computed value based on the recorded content.
         """
+        from html import escape
 
         from rich.cells import cell_len
 
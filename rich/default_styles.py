@@ -50,6 +50,7 @@ DEFAULT_STYLES: Dict[str, Style] = {
     "live.ellipsis": Style(bold=True, color="red"),
     "layout.tree.row": Style(dim=False, color="red"),
     "layout.tree.column": Style(dim=False, color="blue"),
+    "logging.dropped": Style(color="red", dim=True),
     "logging.keyword": Style(bold=True, color="yellow"),
     "logging.level.notset": Style(dim=True),
     "logging.level.debug": Style(color="green"),
@@ -122,6 +123,7 @@ DEFAULT_STYLES: Dict[str, Style] = {
     "traceback.offset": Style(color="bright_red", bold=True),
     "traceback.error_range": Style(underline=True, bold=True),
     "traceback.note": Style(color="green", bold=True),
+    "traceback.repeated": Style(dim=True),
     "traceback.group.border": Style(color="magenta"),
     "bar.back": Style(color="grey23"),
     "bar.complete": Style(color="rgb(249,38,114)"),
@@ -23,6 +23,7 @@ def report() -> None:  # pragma: no cover
         "JUPYTER_LINES",
         "LINES",
         "NO_COLOR",
+        "RICH_CACHE_MEMORY",
         "TERM_PROGRAM",
         "TERM",
         "TTY_COMPATIBLE",
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING, Optional, Union, Literal
 from .jupyter import JupyterMixin
 from .segment import Segment
 from .style import Style
-from ._emoji_codes import EMOJI
 from ._emoji_replace import _emoji_replace
 
 
@@ -39,6 +38,8 @@ class Emoji(JupyterMixin):
         Raises:
             NoEmoji: If the emoji doesn't exist.
         """
+        from ._emoji_codes import EMOJI
+
         self.name = name
         self.style = style
         self.variant = variant
@@ -76,6 +77,7 @@ class Emoji(JupyterMixin):
 if __name__ == "__main__":  # pragma: no cover
     import sys
 
+    from rich._emoji_codes import EMOJI
     from rich.columns import Columns
     from rich.console import Console
 
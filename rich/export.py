@@ -0,0 +1,172 @@
+"""Exporters which write console output to a file as it is produced.
+
+Unlike :meth:`~rich.console.Console.export_text` and :meth:`~rich.console.Console.export_html`,
+which build a string from everything recorded, a stream exporter writes each batch of output as
+soon as the console writes it, so the output doesn't need to be kept in memory::
+
+    from rich.console import Console
+    from rich.export import HTMLStreamExporter
+
+    console = Console()
+    with open("log.html", "wt", encoding="utf-8") as html_file:
+        with console.stream_export(HTMLStreamExporter(html_file)):
+            console.print("Hello, [bold magenta]World[/]!")
+
+"""
+
+from abc import ABC, abstractmethod
+from html import escape
+from typing import IO, Iterable, List, Optional
+
+from ._export_format import CONSOLE_HTML_FORMAT
+from .segment import Segment
+from .terminal_theme import DEFAULT_TERMINAL_THEME, TerminalTheme
+
+
+class StreamExporter(ABC):
+    """Base class for an exporter which writes console output to a file as it is produced.
+
+    Args:
+        file (IO[str]): File to write to.
+        flush (bool, optional): Flush the file after every write. Defaults to ``True``.
+    """
+
+    def __init__(self, file: IO[str], *, flush: bool = True) -> None:
+        self.file = file
+        self.flush = flush
+        self._started = False
+        self._closed = False
+
+    def write(self, segments: Iterable[Segment]) -> None:
+        """Export segments written by the console.
+
+        Args:
+            segments (Iterable[Segment]): Segments to export.
+        """
+        if self._closed:
+            return
+        if not self._started:
+            self._started = True
+            self.file.write(self.start())
+        self.file.write(self.export(segments))
+        if self.flush:
+            self.file.flush()
+
+    def close(self) -> None:
+        """Finish exporting. The file is not closed."""
+        if self._closed:
+            return
+        if not self._started:
+            self._started = True
+            self.file.write(self.start())
+        self.file.write(self.end())
+        self.file.flush()
+        self._closed = True
+
+    def start(self) -> str:
+        """Get the text to write before any segments.
+
+        Returns:
+            str: Text to write.
+        """
+        return ""
+
+    @abstractmethod
+    def export(self, segments: Iterable[Segment]) -> str:
+        """Convert segments to the exported format.
+
+        Args:
+            segments (Iterable[Segment]): Segments to export.
+
+        Returns:
+            str: Text to write.
+        """
+
+    def end(self) -> str:
+        """Get the text to write when exporting has finished.
+
+        Returns:
+            str: Text to write.
+        """
+        return ""
+
+
+class TextStreamExporter(StreamExporter):
+    """Writes console output as text. See :meth:`~rich.console.Console.export_text`.
+
+    Args:
+        file (IO[str]): File to write to.
+        styles (bool, optional): If ``True``, ansi escape codes will be included. ``False`` for plain text.
+            Defaults to ``False``.
+        flush (bool, optional): Flush the file after every write. Defaults to ``True``.
+    """
+
+    def __init__(
+        self, file: IO[str], *, styles: bool = False, flush: bool = True
+    ) -> None:
+        super().__init__(file, flush=flush)
+        self.styles = styles
+
+    def export(self, segments: Iterable[Segment]) -> str:
+        if self.styles:
+            return "".join(
+                (style.render(text) if style else text) for text, style, _ in segments
+            )
+        return "".join(segment.text for segment in segments if not segment.control)
+
+
+class HTMLStreamExporter(StreamExporter):
+    """Writes console output as HTML. See :meth:`~rich.console.Console.export_html`.
+
+    Styles are always inlined, since a stylesheet would have to be written before the styles are known.
+
+    Args:
+        file (IO[str]): File to write to.
+        theme (TerminalTheme, optional): TerminalTheme object containing console colors.
+        code_format (str, optional): Format string to render HTML. In addition to '{foreground}',
+            '{background}', and '{stylesheet}', should contain '{code}' exactly once.
+        flush (bool, optional): Flush the file after every write. Defaults to ``True``.
+    """
+
+    def __init__(
+        self,
+        file: IO[str],
+        *,
+        theme: Optional[TerminalTheme] = None,
+        code_format: Optional[str] = None,
+        flush: bool = True,
+    ) -> None:
+        super().__init__(file, flush=flush)
+        self.theme = theme or DEFAULT_TERMINAL_THEME
+        code_format = CONSOLE_HTML_FORMAT if code_format is None else code_format
+        if code_format.count("{code}") != 1:
+            raise ValueError("code_format should contain '{code}' exactly once")
+        self._start_format, self._end_format = code_format.split("{code}")
+
+    def _format(self, code_format: str) -> str:
+        theme = self.theme
+        return code_format.format(
+            stylesheet="",
+            foreground=theme.foreground_color.hex,
+            background=theme.background_color.hex,
+        )
+
+    def start(self) -> str:
+        return self._format(self._start_format)
+
+    def export(self, segments: Iterable[Segment]) -> str:
+        theme = self.theme
+        fragments: List[str] = []
+        append = fragments.append
+        for text, style, _ in Segment.filter_control(Segment.simplify(segments)):
+            text = escape(text)
+            if style:
+                rule = style.get_html_style(theme)
+                if style.link:
+                    text = f'<a href="{style.link}">{text}</a>'
+                text = f'<span style="{rule}">{text}</span>' if rule else text
+            append(text)
+        return "".join(fragments)
+
+    def end(self) -> str:
+        return self._format(self._end_format)
@@ -1,9 +1,13 @@
 import re
 from abc import ABC, abstractmethod
-from typing import ClassVar, Sequence, Union
+from typing import ClassVar, Dict, Pattern, Sequence, Tuple, Union
 
+from ._highlight_engine import HighlightRegexes
 from .text import Span, Text
 
+# Highlight regexes, keyed on the highlights of a RegexHighlighter
+_highlight_regexes: Dict[Tuple[Union[str, Pattern[str]], ...], HighlightRegexes] = {}
+
 
 def _combine_regex(*regexes: str) -> str:
     """Combine a number of regexes in to a single regex.
@@ -72,8 +76,14 @@ class RegexHighlighter(Highlighter):
 
         """
 
+        highlights = tuple(self.highlights)
+        re_highlights = _highlight_regexes.get(highlights)
+        if re_highlights is None:
+            re_highlights = _highlight_regexes[highlights] = HighlightRegexes(
+                highlights
+            )
         highlight_regex = text.highlight_regex
-        for re_highlight in self.highlights:
+        for re_highlight in re_highlights.get_patterns(text.plain):
             highlight_regex(re_highlight, style_prefix=self.base_style)
 
 
@@ -15,6 +15,8 @@ from .screen import Screen
 from .text import Text
 
 if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Task
+
     # Can be replaced with `from typing import Self` in Python 3.11+
     from typing_extensions import Self  # pragma: no cover
 
@@ -52,6 +54,7 @@ class Live(JupyterMixin, RenderHook):
         redirect_stderr (bool, optional): Enable redirection of stderr. Defaults to True.
         vertical_overflow (VerticalOverflowMethod, optional): How to handle renderable when it is too tall for the console. Defaults to "ellipsis".
         get_renderable (Callable[[], RenderableType], optional): Optional callable to get renderable. Defaults to None.
+        diff_redraw (bool, optional): Only redraw the lines (and parts of lines) which changed since the last refresh. Defaults to False.
     """
 
     def __init__(
@@ -67,6 +70,7 @@ class Live(JupyterMixin, RenderHook):
         redirect_stderr: bool = True,
         vertical_overflow: VerticalOverflowMethod = "ellipsis",
         get_renderable: Optional[Callable[[], RenderableType]] = None,
+        diff_redraw: bool = False,
     ) -> None:
         assert refresh_per_second > 0, "refresh_per_second must be > 0"
         self._renderable = renderable
@@ -87,11 +91,17 @@ class Live(JupyterMixin, RenderHook):
 
         self._refresh_thread: Optional[_RefreshThread] = None
         self.refresh_per_second = refresh_per_second
+        # Event loop which refreshes the display, when used with "async with"
+        self._loop: Optional[AbstractEventLoop] = None
+        self._refresh_task: Optional[Task[None]] = None
+        self._refresh_requested = False
 
         self.vertical_overflow = vertical_overflow
         self._get_renderable = get_renderable
         self._live_render = LiveRender(
-            self.get_renderable(), vertical_overflow=vertical_overflow
+            self.get_renderable(),
+            vertical_overflow=vertical_overflow,
+            diff_redraw=diff_redraw,
         )
         self._nested = False
 
@@ -128,6 +138,8 @@ class Live(JupyterMixin, RenderHook):
             self.console.show_cursor(False)
             self._enable_redirect_io()
             self.console.push_render_hook(self)
+            # Anything may have been written since the last render, so start afresh
+            self._live_render.invalidate()
             if refresh:
                 try:
                     self.refresh()
@@ -139,8 +151,68 @@ class Live(JupyterMixin, RenderHook):
                     self.stop()
                     raise
             if self.auto_refresh:
-                self._refresh_thread = _RefreshThread(self, self.refresh_per_second)
-                self._refresh_thread.start()
+                if self._loop is not None:
+                    self._refresh_task = self._loop.create_task(self._refresh_loop())
+                else:
+                    self._refresh_thread = _RefreshThread(self, self.refresh_per_second)
+                    self._refresh_thread.start()
+
+    async def _refresh_loop(self) -> None:
+        """Refresh at regular intervals, on the event loop."""
+        from asyncio import sleep
+
+        interval = 1 / self.refresh_per_second
+        while self._started:
+            await sleep(interval)
+            if self._started:
+                self.refresh()
+
+    def _start_on_loop(self, refresh: bool = False) -> None:
+        """Start live rendering display, with refreshes scheduled on the running event loop.
+
+        Args:
+            refresh (bool, optional): Also refresh. Defaults to False.
+        """
+        from asyncio import get_running_loop
+
+        with self._lock:
+            if self._started:
+                return
+            self._loop = get_running_loop()
+            try:
+                self.start(refresh=refresh)
+            finally:
+                if not self._started:
+                    self._loop = None
+
+    def _request_refresh(self) -> None:
+        """Refresh the display.
+
+        When the display is refreshed on an event loop, and this is called from the loop, the
+        refresh is scheduled to run once in the current iteration of the loop, so that
+        updates from many coroutines are combined in to a single refresh.
+        """
+        loop = self._loop
+        if loop is None:
+            self.refresh()
+            return
+        from asyncio import get_running_loop
+
+        try:
+            running_loop: Optional[AbstractEventLoop] = get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not loop:
+            self.refresh()
+        elif not self._refresh_requested:
+            self._refresh_requested = True
+            loop.call_soon(self._requested_refresh)
+
+    def _requested_refresh(self) -> None:
+        """Called by the event loop to run a refresh scheduled by _request_refresh."""
+        self._refresh_requested = False
+        if self._started:
+            self.refresh()
 
     def stop(self) -> None:
         """Stop live rendering display."""
@@ -149,6 +221,13 @@ class Live(JupyterMixin, RenderHook):
                 return
             self._started = False
             self.console.clear_live()
+            refresh_task = self._refresh_task
+            if refresh_task is not None:
+                self._refresh_task = None
+                loop = refresh_task.get_loop()
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(refresh_task.cancel)
+            self._loop = None
             if self._nested:
                 if not self.transient:
                     self.console.print(self.renderable)
@@ -166,6 +245,7 @@ class Live(JupyterMixin, RenderHook):
                 finally:
                     self._disable_redirect_io()
                     self.console.pop_render_hook()
+                    self._live_render.invalidate()
                     if (
                         not self._alt_screen
                         and self.console.is_terminal
@@ -192,6 +272,18 @@ class Live(JupyterMixin, RenderHook):
     ) -> None:
         self.stop()
 
+    async def __aenter__(self) -> Self:
+        self._start_on_loop(refresh=self._renderable is not None)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
     def _enable_redirect_io(self) -> None:
         """Enable redirecting of stdout / stderr."""
         if self.console.is_terminal or self.console.is_jupyter:
@@ -239,7 +331,7 @@ class Live(JupyterMixin, RenderHook):
         with self._lock:
             self._renderable = renderable
             if refresh:
-                self.refresh()
+                self._request_refresh()
 
     def refresh(self) -> None:
         """Update the display of the Live Render."""
@@ -268,7 +360,11 @@ class Live(JupyterMixin, RenderHook):
                         self.console.print(self._live_render.renderable)
             elif self.console.is_terminal and not self.console.is_dumb_terminal:
                 with self.console:
-                    self.console.print(Control())
+                    # Lines are already cropped, and a diff redraw may write more
+                    # than a line's width between new lines
+                    self.console.print(
+                        Control(), crop=not self._live_render.diff_redraw
+                    )
             elif (
                 not self._started and not self.transient
             ):  # if it is finished allow files or dumb-terminals to see final result
@@ -283,11 +379,16 @@ class Live(JupyterMixin, RenderHook):
         if self.console.is_interactive:
             # lock needs acquiring as user can modify live_render renderable at any time unlike in Progress.
             with self._lock:
-                reset = (
-                    Control.home()
-                    if self._alt_screen
-                    else self._live_render.position_cursor()
-                )
+                if self._alt_screen:
+                    reset = Control.home()
+                else:
+                    if not all(
+                        isinstance(renderable, Control) and not renderable.segment.text
+                        for renderable in renderables
+                    ):
+                        # Output is being printed above the live display, which will scroll it
+                        self._live_render.invalidate()
+                    reset = self._live_render.position_cursor()
                 renderables = [reset, *renderables, self._live_render]
         elif (
             not self._started and not self.transient
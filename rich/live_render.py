@@ -1,6 +1,7 @@
-from typing import Literal, Optional, Tuple
+from typing import Iterable, List, Literal, Optional, Tuple
 
 from ._loop import loop_last
+from .cells import cell_len, get_character_cell_size
 from .console import Console, ConsoleOptions, RenderableType, RenderResult
 from .control import Control
 from .segment import ControlType, Segment
@@ -16,6 +17,8 @@ class LiveRender:
     Args:
         renderable (RenderableType): Any renderable object.
         style (StyleType, optional): An optional style to apply to the renderable. Defaults to "".
+        vertical_overflow (VerticalOverflowMethod, optional): How to handle renderable when it is too tall for the console. Defaults to "ellipsis".
+        diff_redraw (bool, optional): Only redraw the parts of the render that changed since the last render. Defaults to False.
     """
 
     def __init__(
@@ -23,11 +26,16 @@ class LiveRender:
         renderable: RenderableType,
         style: StyleType = "",
         vertical_overflow: VerticalOverflowMethod = "ellipsis",
+        diff_redraw: bool = False,
     ) -> None:
         self.renderable = renderable
         self.style = style
         self.vertical_overflow = vertical_overflow
+        self.diff_redraw = diff_redraw
         self._shape: Optional[Tuple[int, int]] = None
+        self._previous_lines: Optional[List[List[Segment]]] = None
+        self._previous_width = 0
+        self._render_diff = False
 
     @property
     def last_render_height(self) -> int:
@@ -48,12 +56,26 @@ class LiveRender:
         """
         self.renderable = renderable
 
+    def invalidate(self) -> None:
+        """Discard the previous render, so that the next render is written in full."""
+        self._previous_lines = None
+
     def position_cursor(self) -> Control:
         """Get control codes to move cursor to beginning of live render.
 
         Returns:
             Control: A control instance that may be printed.
         """
+        self._render_diff = False
+        if self.diff_redraw and self._previous_lines is not None:
+            # Leave the previous render on screen, it will be updated in place
+            self._render_diff = True
+            height = len(self._previous_lines)
+            if height > 1:
+                return Control(
+                    ControlType.CARRIAGE_RETURN, (ControlType.CURSOR_UP, height - 1)
+                )
+            return Control(ControlType.CARRIAGE_RETURN)
         if self._shape is not None:
             _, height = self._shape
             return Control(
@@ -109,8 +131,155 @@ class LiveRender:
                 shape = Segment.get_shape(lines)
         self._shape = shape
 
+        previous_lines = self._previous_lines
+        if self.diff_redraw:
+            self._previous_lines = lines
+            self._previous_width = options.max_width
+        if self._render_diff and previous_lines is not None:
+            self._render_diff = False
+            if options.max_width != self._previous_width:
+                # Lines may have been wrapped differently, so rewrite every line
+                previous_lines = [[] for _ in previous_lines]
+            yield from _render_line_changes(previous_lines, lines)
+            return
+
         new_line = Segment.line()
         for last, line in loop_last(lines):
             yield from line
             if not last:
                 yield new_line
+
+
+def _get_common_prefix(line1: List[Segment], line2: List[Segment]) -> int:
+    """Get the number of cells at the start of two lines which are identical.
+
+    Args:
+        line1 (List[Segment]): A line of segments.
+        line2 (List[Segment]): Another line of segments.
+
+    Returns:
+        int: Number of cells.
+    """
+    cells = 0
+    for segment1, segment2 in zip(line1, line2):
+        if segment1 == segment2:
+            cells += segment1.cell_length
+            continue
+        text1, style1, control1 = segment1
+        text2, style2, control2 = segment2
+        if style1 == style2 and not (control1 or control2):
+            index = 0
+            for index, (character1, character2) in enumerate(zip(text1, text2)):
+                if character1 != character2:
+                    break
+            else:
+                index = min(len(text1), len(text2))
+            # Don't split a character from any combining characters that follow
+            while index and (
+                (index < len(text1) and not get_character_cell_size(text1[index]))
+                or (index < len(text2) and not get_character_cell_size(text2[index]))
+            ):
+                index -= 1
+            cells += cell_len(text2[:index])
+        break
+    return cells
+
+
+def _get_common_suffix(line1: List[Segment], line2: List[Segment]) -> int:
+    """Get the number of cells at the end of two lines which are identical.
+
+    Args:
+        line1 (List[Segment]): A line of segments.
+        line2 (List[Segment]): Another line of segments.
+
+    Returns:
+        int: Number of cells.
+    """
+    cells = 0
+    for segment1, segment2 in zip(reversed(line1), reversed(line2)):
+        if segment1 == segment2:
+            cells += segment1.cell_length
+            continue
+        text1, style1, control1 = segment1
+        text2, style2, control2 = segment2
+        if style1 == style2 and not (control1 or control2):
+            count = 0
+            for character1, character2 in zip(reversed(text1), reversed(text2)):
+                if character1 != character2:
+                    break
+                count += 1
+            # The suffix must not start with a combining character
+            while count and not get_character_cell_size(text2[-count]):
+                count -= 1
+            if count:
+                cells += cell_len(text2[-count:])
+        break
+    return cells
+
+
+def _render_line_changes(
+    previous_lines: List[List[Segment]], lines: List[List[Segment]]
+) -> Iterable[Segment]:
+    """Render the segments and control codes to update previously rendered lines.
+
+    The cursor is expected to be at the start of the first line of the previous render,
+    and is left at the end of the last line of the new render.
+
+    Args:
+        previous_lines (List[List[Segment]]): Lines currently on screen.
+        lines (List[List[Segment]]): New lines.
+
+    Returns:
+        Iterable[Segment]: Segments to update the screen.
+    """
+
+    def control(*codes: Tuple[ControlType, int]) -> Segment:
+        return Control(*codes).segment
+
+    previous_height = len(previous_lines)
+    height = len(lines)
+    row = 0
+
+    for y, (previous_line, line) in enumerate(zip(previous_lines, lines)):
+        if previous_line == line:
+            continue
+        previous_length = Segment.get_line_length(previous_line)
+        length = Segment.get_line_length(line)
+        start = _get_common_prefix(previous_line, line)
+        end = length
+        if length == previous_length:
+            end = max(start, length - _get_common_suffix(previous_line, line))
+        if y > row:
+            yield control((ControlType.CURSOR_DOWN, y - row))
+            row = y
+        yield control((ControlType.CURSOR_MOVE_TO_COLUMN, start))
+        if end > start:
+            _, changed, _ = Segment.divide(line, [start, end, length])
+            yield from changed
+        if length < previous_length:
+            yield control((ControlType.ERASE_IN_LINE, 0))
+
+    if height > previous_height:
+        if previous_height - 1 > row:
+            yield control((ControlType.CURSOR_DOWN, previous_height - 1 - row))
+        new_line = Segment.line()
+        for y in range(previous_height, height):
+            if y:
+                yield new_line
+            yield from lines[y]
+        row = height - 1
+    else:
+        for y in range(height, previous_height):
+            yield control(
+                (ControlType.CURSOR_DOWN, y - row), (ControlType.ERASE_IN_LINE, 2)
+            )
+            row = y
+        last_row = max(0, height - 1)
+        if row > last_row:
+            yield control((ControlType.CURSOR_UP, row - last_row))
+        elif last_row > row:
+            yield control((ControlType.CURSOR_DOWN, last_row - row))
+        last_line = lines[last_row] if lines else []
+        yield control(
+            (ControlType.CURSOR_MOVE_TO_COLUMN, Segment.get_line_length(last_line))
+        )
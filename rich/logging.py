@@ -1,9 +1,24 @@
 import logging
+from copy import copy
 from datetime import datetime
 from logging import Handler, LogRecord
 from pathlib import Path
-from types import ModuleType
-from typing import ClassVar, Iterable, List, Optional, Type, Union
+from queue import Full, Queue
+from threading import Lock, Thread, current_thread
+from types import ModuleType, TracebackType
+from typing import (
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from rich._null_file import NullFile
 
@@ -14,6 +29,84 @@ from .highlighter import Highlighter, ReprHighlighter
 from .text import Text
 from .traceback import Traceback
 
+# Maximum number of traceback signatures to remember, when deduping tracebacks
+MAX_TRACEBACK_SIGNATURES = 1024
+
+
+def _get_traceback_signature(
+    exc_value: BaseException, exc_traceback: Optional[TracebackType]
+) -> Hashable:
+    """Get a signature which identifies the exception types and frames of a traceback.
+
+    Args:
+        exc_value (BaseException): The exception.
+        exc_traceback (Optional[TracebackType]): Traceback of the exception.
+
+    Returns:
+        Hashable: The signature.
+    """
+    signature: List[Hashable] = []
+    seen: Set[int] = set()
+    exception: Optional[BaseException] = exc_value
+    while exception is not None and id(exception) not in seen:
+        seen.add(id(exception))
+        frames: List[Tuple[str, int, str]] = []
+        traceback = exc_traceback if exception is exc_value else exception.__traceback__
+        while traceback is not None:
+            code = traceback.tb_frame.f_code
+            frames.append((code.co_filename, traceback.tb_lineno, code.co_name))
+            traceback = traceback.tb_next
+        sub_exceptions = getattr(exception, "exceptions", None)
+        signature.append(
+            (
+                type(exception),
+                tuple(frames),
+                (
+                    tuple(
+                        _get_traceback_signature(
+                            sub_exception, sub_exception.__traceback__
+                        )
+                        for sub_exception in sub_exceptions
+                        if isinstance(sub_exception, BaseException)
+                    )
+                    if isinstance(sub_exceptions, (list, tuple))
+                    else ()
+                ),
+            )
+        )
+        exception = exception.__cause__ or (
+            None if exception.__suppress_context__ else exception.__context__
+        )
+    return tuple(signature)
+
+
+class _RenderThread(Thread):
+    """A thread that renders and writes the records queued by a RichHandler."""
+
+    def __init__(self, handler: "RichHandler") -> None:
+        self.handler = handler
+        super().__init__(daemon=True, name="RichHandler")
+
+    def run(self) -> None:
+        handler = self.handler
+        queue = handler._queue
+        while True:
+            item = queue.get()
+            try:
+                if item is None:
+                    break
+                record, message, traceback = item
+                try:
+                    handler._write(record, message, traceback)
+                except Exception:
+                    handler.handleError(record)
+                if handler.dropped_count and queue.empty():
+                    handler._write_dropped_count()
+            except Exception:
+                pass
+            finally:
+                queue.task_done()
+
 
 class RichHandler(Handler):
     """A logging handler that renders output with Rich. The time / level / message and file are displayed in columns.
@@ -43,11 +136,20 @@ class RichHandler(Handler):
         tracebacks_show_locals (bool, optional): Enable display of locals in tracebacks. Defaults to False.
         tracebacks_suppress (Sequence[Union[str, ModuleType]]): Optional sequence of modules or paths to exclude from traceback.
         tracebacks_max_frames (int, optional): Optional maximum number of frames returned by traceback.
+        tracebacks_dedupe_window (Optional[float], optional): Number of seconds in which a traceback with the same
+            exception types and frames as an earlier traceback is replaced with a line showing the exception and a repeat
+            count, or None to render every traceback. Defaults to None.
         locals_max_length (int, optional): Maximum length of containers before abbreviating, or None for no abbreviation.
             Defaults to 10.
         locals_max_string (int, optional): Maximum length of string before truncating, or None to disable. Defaults to 80.
         log_time_format (Union[str, TimeFormatterCallable], optional): If ``log_time`` is enabled, either string for strftime or callable that formats the time. Defaults to "[%x %X] ".
         keywords (List[str], optional): List of words to highlight instead of ``RichHandler.KEYWORDS``.
+        background (bool, optional): Render and write records on a background thread. The calling thread only formats
+            the message and extracts the traceback. Defaults to False.
+        queue_size (int, optional): Maximum number of records waiting to be written in the background, or 0 for no
+            maximum. Defaults to 1000.
+        queue_full (str, optional): What to do when the queue is full: "block" to wait for space in the queue, or
+            "drop" to discard the record (the number of dropped records is written). Defaults to "block".
     """
 
     KEYWORDS: ClassVar[Optional[List[str]]] = [
@@ -83,11 +185,19 @@ class RichHandler(Handler):
         tracebacks_show_locals: bool = False,
         tracebacks_suppress: Iterable[Union[str, ModuleType]] = (),
         tracebacks_max_frames: int = 100,
+        tracebacks_dedupe_window: Optional[float] = None,
         locals_max_length: int = 10,
         locals_max_string: int = 80,
         log_time_format: Union[str, FormatTimeCallable] = "[%x %X]",
         keywords: Optional[List[str]] = None,
+        background: bool = False,
+        queue_size: int = 1000,
+        queue_full: Literal["block", "drop"] = "block",
     ) -> None:
+        if queue_full not in ("block", "drop"):
+            raise ValueError(
+                f'invalid value for queue_full, expected "block" or "drop" (not {queue_full!r})'
+            )
         super().__init__(level=level)
         self.console = console or get_console()
         self.highlighter = highlighter or self.HIGHLIGHTER_CLASS()
@@ -110,9 +220,20 @@ class RichHandler(Handler):
         self.tracebacks_suppress = tracebacks_suppress
         self.tracebacks_max_frames = tracebacks_max_frames
         self.tracebacks_code_width = tracebacks_code_width
+        self.tracebacks_dedupe_window = tracebacks_dedupe_window
+        # Time a traceback signature was first rendered, and the number of times it has been seen since
+        self._traceback_repeats: Dict[Hashable, Tuple[float, int]] = {}
         self.locals_max_length = locals_max_length
         self.locals_max_string = locals_max_string
         self.keywords = keywords
+        self.background = background
+        self.queue_full = queue_full
+        self.dropped_count = 0
+        self._queue: (
+            "Queue[Optional[Tuple[LogRecord, str, Optional[ConsoleRenderable]]]]"
+        ) = Queue(queue_size)
+        self._render_thread: Optional[_RenderThread] = None
+        self._render_thread_lock = Lock()
 
     def get_level_text(self, record: LogRecord) -> Text:
         """Get the level name from the record.
@@ -131,8 +252,23 @@ class RichHandler(Handler):
 
     def emit(self, record: LogRecord) -> None:
         """Invoked by logging."""
+        message, traceback = self._prepare(record)
+        if self.background and current_thread() is not self._render_thread:
+            self._enqueue(record, message, traceback)
+        else:
+            self._write(record, message, traceback)
+
+    def _prepare(self, record: LogRecord) -> Tuple[str, Optional["ConsoleRenderable"]]:
+        """Format the message, and extract the traceback (if any) from a record.
+
+        Args:
+            record (LogRecord): logging Record.
+
+        Returns:
+            Tuple[str, Optional[ConsoleRenderable]]: The message, and the traceback.
+        """
         message = self.format(record)
-        traceback = None
+        traceback: Optional[ConsoleRenderable] = None
         if (
             self.rich_tracebacks
             and record.exc_info
@@ -141,21 +277,29 @@ class RichHandler(Handler):
             exc_type, exc_value, exc_traceback = record.exc_info
             assert exc_type is not None
             assert exc_value is not None
-            traceback = Traceback.from_exception(
-                exc_type,
-                exc_value,
-                exc_traceback,
-                width=self.tracebacks_width,
-                code_width=self.tracebacks_code_width,
-                extra_lines=self.tracebacks_extra_lines,
-                theme=self.tracebacks_theme,
-                word_wrap=self.tracebacks_word_wrap,
-                show_locals=self.tracebacks_show_locals,
-                locals_max_length=self.locals_max_length,
-                locals_max_string=self.locals_max_string,
-                suppress=self.tracebacks_suppress,
-                max_frames=self.tracebacks_max_frames,
+            repeat_count = self._count_traceback_repeat(
+                record, exc_value, exc_traceback
             )
+            if repeat_count:
+                traceback = self.render_repeated_traceback(
+                    exc_type, exc_value, repeat_count
+                )
+            else:
+                traceback = Traceback.from_exception(
+                    exc_type,
+                    exc_value,
+                    exc_traceback,
+                    width=self.tracebacks_width,
+                    code_width=self.tracebacks_code_width,
+                    extra_lines=self.tracebacks_extra_lines,
+                    theme=self.tracebacks_theme,
+                    word_wrap=self.tracebacks_word_wrap,
+                    show_locals=self.tracebacks_show_locals,
+                    locals_max_length=self.locals_max_length,
+                    locals_max_string=self.locals_max_string,
+                    suppress=self.tracebacks_suppress,
+                    max_frames=self.tracebacks_max_frames,
+                )
             message = record.getMessage()
             if self.formatter:
                 record.message = record.getMessage()
@@ -163,7 +307,21 @@ class RichHandler(Handler):
                 if hasattr(formatter, "usesTime") and formatter.usesTime():
                     record.asctime = formatter.formatTime(record, formatter.datefmt)
                 message = formatter.formatMessage(record)
+        return message, traceback
 
+    def _write(
+        self,
+        record: LogRecord,
+        message: str,
+        traceback: Optional["ConsoleRenderable"],
+    ) -> None:
+        """Render a record and write it to the console.
+
+        Args:
+            record (LogRecord): logging Record.
+            message (str): The formatted message.
+            traceback (Optional[ConsoleRenderable]): The traceback, or None for no traceback.
+        """
         message_renderable = self.render_message(record, message)
         log_renderable = self.render(
             record=record, traceback=traceback, message_renderable=message_renderable
@@ -179,6 +337,129 @@ class RichHandler(Handler):
             except Exception:
                 self.handleError(record)
 
+    def _enqueue(
+        self,
+        record: LogRecord,
+        message: str,
+        traceback: Optional["ConsoleRenderable"],
+    ) -> None:
+        """Add a record to the queue, to be written by the render thread.
+
+        Args:
+            record (LogRecord): logging Record.
+            message (str): The formatted message.
+            traceback (Optional[ConsoleRenderable]): The traceback, or None for no traceback.
+        """
+        with self._render_thread_lock:
+            if self._render_thread is None or not self._render_thread.is_alive():
+                self._render_thread = _RenderThread(self)
+                self._render_thread.start()
+        # Copy the record without references to the exception or arguments, as in QueueHandler
+        record = copy(record)
+        record.exc_info = None
+        record.exc_text = None
+        record.args = None
+        item = (record, message, traceback)
+        if self.queue_full == "block":
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                with self._render_thread_lock:
+                    self.dropped_count += 1
+
+    def flush(self) -> None:
+        """Wait for queued records to be written (when rendering in the background)."""
+        if self._render_thread is not None and self._render_thread.is_alive():
+            if current_thread() is not self._render_thread:
+                self._queue.join()
+
+    def close(self) -> None:
+        """Write queued records, and stop the render thread."""
+        render_thread = self._render_thread
+        if render_thread is not None and render_thread.is_alive():
+            self.flush()
+            if current_thread() is not render_thread:
+                self._queue.put(None)
+                render_thread.join()
+        self._render_thread = None
+        super().close()
+
+    def _write_dropped_count(self) -> None:
+        """Write the number of records dropped because the queue was full (if any)."""
+        with self._render_thread_lock:
+            dropped_count = self.dropped_count
+            self.dropped_count = 0
+        if dropped_count:
+            self.console.print(
+                Text(
+                    f"{dropped_count} log record{'s' if dropped_count > 1 else ''} dropped",
+                    style="logging.dropped",
+                )
+            )
+
+    def _count_traceback_repeat(
+        self,
+        record: LogRecord,
+        exc_value: BaseException,
+        exc_traceback: Optional[TracebackType],
+    ) -> int:
+        """Count a traceback which repeats an earlier traceback, within the dedupe window.
+
+        Args:
+            record (LogRecord): logging Record.
+            exc_value (BaseException): The exception.
+            exc_traceback (Optional[TracebackType]): Traceback of the exception.
+
+        Returns:
+            int: Number of times the traceback has been repeated, or 0 if it should be rendered.
+        """
+        dedupe_window = self.tracebacks_dedupe_window
+        if dedupe_window is None:
+            return 0
+        repeats = self._traceback_repeats
+        signature = _get_traceback_signature(exc_value, exc_traceback)
+        first_time, count = repeats.get(signature, (0.0, 0))
+        if count and record.created - first_time < dedupe_window:
+            repeats[signature] = (first_time, count + 1)
+            return count
+        if len(repeats) >= MAX_TRACEBACK_SIGNATURES:
+            # Forget signatures outside of the window
+            for expired_signature, (first_time, _count) in list(repeats.items()):
+                if record.created - first_time >= dedupe_window:
+                    del repeats[expired_signature]
+            if len(repeats) >= MAX_TRACEBACK_SIGNATURES:
+                repeats.clear()
+        repeats[signature] = (record.created, 1)
+        return 0
+
+    def render_repeated_traceback(
+        self, exc_type: Type[BaseException], exc_value: BaseException, count: int
+    ) -> "ConsoleRenderable":
+        """Render a traceback which repeats an earlier traceback.
+
+        Args:
+            exc_type (Type[BaseException]): Type of the exception.
+            exc_value (BaseException): The exception.
+            count (int): Number of times the traceback has been repeated.
+
+        Returns:
+            ConsoleRenderable: Renderable to display in place of the traceback.
+        """
+        exc_value_text = str(exc_value)
+        return Text.assemble(
+            (
+                f"{exc_type.__name__}{': ' if exc_value_text else ''}",
+                "traceback.exc_type",
+            ),
+            self.highlighter(exc_value_text),
+            (
+                f" (traceback repeated {count} time{'s' if count > 1 else ''})",
+                "traceback.repeated",
+            ),
+        )
+
     def render_message(self, record: LogRecord, message: str) -> "ConsoleRenderable":
         """Render message text in to Text.
 
@@ -208,14 +489,15 @@ class RichHandler(Handler):
         self,
         *,
         record: LogRecord,
-        traceback: Optional[Traceback],
+        traceback: Optional["ConsoleRenderable"],
         message_renderable: "ConsoleRenderable",
     ) -> "ConsoleRenderable":
         """Render log for display.
 
         Args:
             record (LogRecord): logging Record.
-            traceback (Optional[Traceback]): Traceback instance or None for no Traceback.
+            traceback (Optional[ConsoleRenderable]): Traceback instance (or a renderable for a repeated traceback),
+                or None for no Traceback.
             message_renderable (ConsoleRenderable): Renderable (typically Text) containing log message contents.
 
         Returns:
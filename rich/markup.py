@@ -1,9 +1,23 @@
 import re
 from ast import literal_eval
+from bisect import bisect_left
 from operator import attrgetter
-from typing import Callable, Iterable, List, Match, NamedTuple, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Match,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from . import caches
 from ._emoji_replace import _emoji_replace
+from .control import strip_control_codes
 from .emoji import EmojiVariant
 from .errors import MarkupError
 from .style import Style
@@ -16,6 +30,9 @@ RE_TAGS = re.compile(
 
 RE_HANDLER = re.compile(r"^([\w.]*?)(\(.*?\))?$")
 
+# Markup longer than this isn't cached, as it is unlikely to be rendered again
+MAX_CACHED_MARKUP_LENGTH = 1000
+
 
 class Tag(NamedTuple):
     """A tag in console markup."""
@@ -124,13 +141,37 @@ def render(
     Returns:
         Text: A test instance.
     """
-    emoji_replace = _emoji_replace
     if "[" not in markup:
         return Text(
-            emoji_replace(markup, default_variant=emoji_variant) if emoji else markup,
+            _emoji_replace(markup, default_variant=emoji_variant) if emoji else markup,
             style=style,
         )
-    text = Text(style=style)
+    parse = (
+        _parse_markup_cached
+        if len(markup) <= MAX_CACHED_MARKUP_LENGTH
+        else _parse_markup
+    )
+    plain, spans = parse(markup, emoji)
+    text = Text._from_sanitized(plain, style, None, None)
+    text._spans[:] = spans
+    return text
+
+
+def _parse_markup(markup: str, emoji: bool) -> Tuple[str, Tuple[Span, ...]]:
+    """Parse console markup in to plain text and spans.
+
+    Args:
+        markup (str): A string containing console markup.
+        emoji (bool): Also render emoji code.
+
+    Raises:
+        MarkupError: If there is a syntax error in the markup.
+
+    Returns:
+        Tuple[str, Tuple[Span, ...]]: The plain text (with control codes removed), and spans sorted by start offset.
+    """
+    emoji_replace = _emoji_replace
+    text = Text()
     append = text.append
     normalize = Style.normalize
 
@@ -200,9 +241,11 @@ def render(
                         if handler_name:
                             meta_params = (
                                 handler_name,
-                                meta_params
-                                if isinstance(meta_params, tuple)
-                                else (meta_params,),
+                                (
+                                    meta_params
+                                    if isinstance(meta_params, tuple)
+                                    else (meta_params,)
+                                ),
                             )
 
                     else:
@@ -227,8 +270,229 @@ def render(
         if style:
             append_span(_Span(start, text_length, style))
 
-    text.spans = sorted(spans[::-1], key=attrgetter("start"))
-    return text
+    return text.plain, tuple(sorted(spans[::-1], key=attrgetter("start")))
+
+
+_parse_markup_cached = caches.lru_cache("markup.parse")(_parse_markup)
+
+
+# Fields in a template are replaced with characters from the Supplementary Private Use Area-B,
+# which won't be interpreted as markup. A field at the start of a tag is prefixed with "#" (and
+# uses the upper half of the area), so that the tag is recognized.
+_FIELD_CHARACTER = 0x100000
+_TAG_FIELD_CHARACTER = 0x108000
+RE_FIELD = re.compile("#[\U00108000-\U0010fffd]|[\U00100000-\U00107fff]")
+
+
+def _get_field_index(placeholder: str) -> int:
+    """Get the index of the field replaced by a placeholder."""
+    return (ord(placeholder[-1]) - _FIELD_CHARACTER) % (
+        _TAG_FIELD_CHARACTER - _FIELD_CHARACTER
+    )
+
+
+class MarkupTemplate:
+    """Console markup containing format fields (as used by :meth:`str.format`), which is parsed once
+    and may be formatted many times. Create with :func:`compile_markup`.
+
+    Values are inserted in to the text after the markup has been parsed, so they don't need to be escaped.
+    Fields in a tag (e.g. ``[link={url}]``) are formatted in to the style. Fields aren't supported in
+    the parameters of ``@`` tags.
+
+    Tags are matched when the template is parsed, before the values are known. An opening tag which
+    is a field (e.g. ``[{0}]``) must be closed with the same field (``[/{0}]``) or with ``[/]``;
+    closing it with the name of the value (e.g. ``[/bold]``) raises a MarkupError.
+
+    Args:
+        template (str): Console markup with format fields.
+        style (Union[str, Style], optional): The style to use. Defaults to "".
+        emoji (bool, optional): Also render emoji code. Defaults to True.
+        emoji_variant (str, optional): Optional emoji variant, either "text" or "emoji". Defaults to None.
+
+    Raises:
+        MarkupError: If there is a syntax error in the markup.
+        ValueError: If there is an error in the format fields.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        style: Union[str, Style] = "",
+        emoji: bool = True,
+        emoji_variant: Optional[EmojiVariant] = None,
+    ) -> None:
+        from string import Formatter
+
+        self.template = template
+        self.style = style
+        # Each field is formatted with a format string containing just that field
+        self._fields: List[str] = []
+        field_indexes: Dict[str, int] = {}
+        markup_parts: List[str] = []
+        markup_end = ""
+        auto_number = 0
+        numbering: Optional[str] = None
+        for literal_text, field_name, format_spec, conversion in Formatter().parse(
+            template
+        ):
+            markup_parts.append(literal_text)
+            markup_end = (markup_end + literal_text)[-2:]
+            if field_name is None:
+                continue
+            first_name = re.split(r"[.[]", field_name, maxsplit=1)[0]
+            if first_name.isdigit() or not first_name:
+                field_numbering = "manual" if first_name else "automatic"
+                if numbering is not None and numbering != field_numbering:
+                    raise ValueError(
+                        "cannot switch between automatic field numbering and manual field specification"
+                    )
+                numbering = field_numbering
+                if not first_name:
+                    field_name = f"{auto_number}{field_name}"
+                    auto_number += 1
+            field = "".join(
+                [
+                    "{",
+                    field_name,
+                    f"!{conversion}" if conversion else "",
+                    f":{format_spec}" if format_spec else "",
+                    "}",
+                ]
+            )
+            if field not in field_indexes:
+                field_indexes[field] = len(self._fields)
+                self._fields.append(field)
+            if markup_end.endswith(("[", "[/")):
+                placeholder = f"#{chr(_TAG_FIELD_CHARACTER + field_indexes[field])}"
+            else:
+                placeholder = chr(_FIELD_CHARACTER + field_indexes[field])
+            markup_parts.append(placeholder)
+            markup_end = (markup_end + placeholder)[-2:]
+
+        text = render("".join(markup_parts), emoji=emoji, emoji_variant=emoji_variant)
+        plain = text.plain
+
+        # The plain text is divided in to chunks by fields
+        field_offsets: List[int] = []
+        # The number of placeholder characters before each chunk
+        placeholder_lengths = [0]
+        self._chunks: List[str] = []
+        self._chunk_fields: List[int] = []
+        position = 0
+        for match in RE_FIELD.finditer(plain):
+            offset, position_end = match.span()
+            field_offsets.append(offset)
+            placeholder_lengths.append(placeholder_lengths[-1] + position_end - offset)
+            self._chunks.append(plain[position:offset])
+            self._chunk_fields.append(_get_field_index(match.group()))
+            position = position_end
+        self._chunks.append(plain[position:])
+
+        # Span offsets are stored relative to the chunk they are in, with the number of fields before them
+        self._spans: List[Tuple[int, int, int, int, Union[str, Style], bool]] = []
+        for start, end, span_style in text._spans:
+            start_fields = bisect_left(field_offsets, start)
+            end_fields = bisect_left(field_offsets, end)
+            has_fields = isinstance(span_style, str) and bool(
+                RE_FIELD.search(span_style)
+            )
+            self._spans.append(
+                (
+                    start - placeholder_lengths[start_fields],
+                    start_fields,
+                    end - placeholder_lengths[end_fields],
+                    end_fields,
+                    span_style,
+                    has_fields,
+                )
+            )
+        self._has_style_fields = any(span[-1] for span in self._spans)
+
+    def __repr__(self) -> str:
+        return f"MarkupTemplate({self.template!r})"
+
+    def format(self, *args: Any, **kwargs: Any) -> Text:
+        """Format the template in to a Text instance.
+
+        Args:
+            *args: Positional values for the fields.
+            **kwargs: Keyword values for the fields.
+
+        Returns:
+            Text: A Text instance.
+        """
+        values = [
+            strip_control_codes(field_format.format(*args, **kwargs))
+            for field_format in self._fields
+        ]
+
+        chunks = self._chunks
+        parts = [chunks[0]]
+        # The offset of each chunk in the formatted text, less the offset in the template
+        shifts = [0]
+        shift = 0
+        for chunk, field_index in zip(chunks[1:], self._chunk_fields):
+            value = values[field_index]
+            parts += (value, chunk)
+            shift += len(value)
+            shifts.append(shift)
+
+        text = Text._from_sanitized("".join(parts), self.style, None, None)
+        _Span = Span
+        if self._has_style_fields:
+
+            def replace_field(match: Match[str]) -> str:
+                return values[_get_field_index(match.group())]
+
+            text._spans[:] = [
+                _Span(
+                    start + shifts[start_fields],
+                    end + shifts[end_fields],
+                    (
+                        RE_FIELD.sub(replace_field, str(span_style))
+                        if has_fields
+                        else span_style
+                    ),
+                )
+                for start, start_fields, end, end_fields, span_style, has_fields in self._spans
+            ]
+        else:
+            text._spans[:] = [
+                _Span(
+                    start + shifts[start_fields], end + shifts[end_fields], span_style
+                )
+                for start, start_fields, end, end_fields, span_style, _ in self._spans
+            ]
+        return text
+
+
+def compile_markup(
+    template: str,
+    style: Union[str, Style] = "",
+    emoji: bool = True,
+    emoji_variant: Optional[EmojiVariant] = None,
+) -> MarkupTemplate:
+    """Parse console markup containing format fields, so that it may be formatted many times
+    without parsing the markup again.
+
+    Example:
+        >>> template = compile_markup("[bold]{user}[/] did [cyan]{action}[/]")
+        >>> console.print(template.format(user="[admin]", action="login"))
+
+    Args:
+        template (str): Console markup with format fields (as used by :meth:`str.format`).
+        style (Union[str, Style], optional): The style to use. Defaults to "".
+        emoji (bool, optional): Also render emoji code. Defaults to True.
+        emoji_variant (str, optional): Optional emoji variant, either "text" or "emoji". Defaults to None.
+
+    Raises:
+        MarkupError: If there is a syntax error in the markup.
+        ValueError: If there is an error in the format fields.
+
+    Returns:
+        MarkupTemplate: A template with a :meth:`~MarkupTemplate.format` method.
+    """
+    return MarkupTemplate(template, style, emoji, emoji_variant)
 
 
 if __name__ == "__main__":  # pragma: no cover
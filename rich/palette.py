@@ -1,7 +1,7 @@
 from math import sqrt
-from functools import lru_cache
 from typing import Sequence, Tuple, TYPE_CHECKING
 
+from . import caches
 from .color_triplet import ColorTriplet
 
 if TYPE_CHECKING:
@@ -41,7 +41,7 @@ class Palette:
         return table
 
     # This is somewhat inefficient and needs caching
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("palette.match")
     def match(self, color: Tuple[int, int, int]) -> int:
         """Find a color from a palette that most closely matches a given color.
 
@@ -5,24 +5,30 @@ import typing
 import warnings
 from abc import ABC, abstractmethod
 from collections import deque
+from copy import copy
 from dataclasses import dataclass, field
 from datetime import timedelta
 from io import RawIOBase, UnsupportedOperation
 from math import ceil
 from mmap import mmap
 from operator import length_hint
+import os
 from os import PathLike, stat
-from threading import Event, RLock, Thread
+from threading import Event, Lock, RLock, Thread
+from time import monotonic
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
     BinaryIO,
     Callable,
     ContextManager,
     Deque,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     List,
     Literal,
@@ -41,11 +47,20 @@ if TYPE_CHECKING:
     from typing_extensions import Self  # pragma: no cover
 
 from . import filesize, get_console
-from .console import Console, Group, JustifyMethod, RenderableType
+from .console import (
+    Console,
+    ConsoleOptions,
+    Group,
+    JustifyMethod,
+    RenderableType,
+    RenderResult,
+)
 from .highlighter import Highlighter
 from .jupyter import JupyterMixin
 from .live import Live
+from .measure import Measurement
 from .progress_bar import ProgressBar
+from .segment import Segment
 from .spinner import Spinner
 from .style import StyleType
 from .table import Column, Table
@@ -57,6 +72,8 @@ ProgressType = TypeVar("ProgressType")
 
 GetTimeCallable = Callable[[], float]
 
+SpeedEstimatorFactory = Callable[[], "SpeedEstimator"]
+
 
 _I = typing.TypeVar("_I", TextIO, BinaryIO)
 
@@ -101,6 +118,215 @@ class _TrackThread(Thread):
         self.join()
 
 
+def _get_cell_key(
+    renderable: RenderableType, render_key: Optional[Hashable]
+) -> Optional[Tuple[Any, ...]]:
+    """Get a key for the output of a renderable, which changes if the output may change.
+
+    Args:
+        renderable (RenderableType): A renderable returned by a column.
+        render_key (Optional[Hashable]): The column's render key for the renderable,
+            or ``None`` if it has no render key.
+
+    Returns:
+        Optional[Tuple[Any, ...]]: A key for strings, Text instances, and renderables
+            with a render key, or ``None`` if the renderable must always be rendered.
+    """
+    if isinstance(renderable, str):
+        return ("str", renderable)
+    if type(renderable) is Text:
+        return (
+            "text",
+            renderable.plain,
+            renderable.style,
+            tuple(renderable._spans),
+            renderable.justify,
+            renderable.overflow,
+            renderable.no_wrap,
+            renderable.end,
+            renderable.tab_size,
+        )
+    if render_key is not None:
+        return ("render_key", render_key)
+    return None
+
+
+class _CachedCell:
+    """Wraps a renderable in a table cell, to cache its measurement and render.
+
+    The wrapped renderable is assumed not to change while the cell is used.
+
+    Args:
+        renderable (RenderableType): A renderable for a table cell.
+        key (Optional[Tuple[Any, ...]]): Key for the output of the renderable
+            (see :func:`_get_cell_key`), or ``None`` if the cell may not be re-used.
+    """
+
+    __slots__ = ["renderable", "key", "_measurements", "_render"]
+
+    def __init__(
+        self, renderable: RenderableType, key: Optional[Tuple[Any, ...]] = None
+    ) -> None:
+        self.renderable = renderable
+        self.key = key
+        self._measurements: Dict[Tuple[int, Optional[bool]], Measurement] = {}
+        self._render: Optional[Tuple[Tuple[Any, ...], List[Segment]]] = None
+
+    @property
+    def vertical(self) -> Optional[str]:
+        """Vertical alignment of the wrapped renderable, if set."""
+        return getattr(self.renderable, "vertical", None)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        key = (options.max_width, options.markup)
+        measurement = self._measurements.get(key)
+        if measurement is None:
+            if len(self._measurements) > 8:
+                self._measurements.clear()
+            measurement = Measurement.get(console, options, self.renderable)
+            self._measurements[key] = measurement
+        return measurement
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        key = (
+            options.min_width,
+            options.max_width,
+            options.justify,
+            options.overflow,
+            options.no_wrap,
+            options.highlight,
+            options.markup,
+            options.height,
+        )
+        if self._render is None or self._render[0] != key:
+            self._render = (key, list(console.render(self.renderable, options)))
+        return self._render[1]
+
+
+class _TasksTable(Table):
+    """A table grid for the progress display, which re-uses the lines of unchanged rows.
+
+    A row is re-rendered only if one of its cells has changed, or the column widths have changed.
+    """
+
+    row_cache: Dict[TaskID, Tuple[Tuple[Any, ...], List[Segment]]]
+    """Rendered rows from the previous refresh, keyed on task ID."""
+    row_ids: List[TaskID]
+    """Task ID of each row."""
+
+    def _measure_column(
+        self, console: Console, options: ConsoleOptions, column: Column
+    ) -> Measurement:
+        max_width = options.max_width
+        padding_width = self._get_padding_width(column._index)
+        if (
+            self.show_header
+            or self.show_footer
+            or column.width is not None
+            or max_width - padding_width < 1
+        ):
+            return super()._measure_column(console, options, column)
+        # Equivalent to measuring the padded cells, without the padding renderables
+        cell_options = options.update_width(max_width - padding_width)
+        min_widths: List[int] = []
+        max_widths: List[int] = []
+        append_min = min_widths.append
+        append_max = max_widths.append
+        cells = typing.cast(List[_CachedCell], column._cells)
+        for cell in cells:
+            _min, _max = cell.__rich_measure__(console, cell_options)
+            append_min(_min)
+            append_max(_max)
+        measurement = Measurement(
+            max(min_widths) + padding_width if min_widths else 1,
+            max(max_widths) + padding_width if max_widths else max_width,
+        ).with_maximum(max_width)
+        measurement = measurement.clamp(
+            None if column.min_width is None else column.min_width + padding_width,
+            None if column.max_width is None else column.max_width + padding_width,
+        )
+        return measurement
+
+    def _render(
+        self, console: Console, options: ConsoleOptions, widths: List[int]
+    ) -> RenderResult:
+        if self.box or self.show_header or self.show_footer or self.row_styles:
+            yield from super()._render(console, options, widths)
+            return
+        row_cache = self.row_cache
+        columns = self.columns
+        render_key = (
+            tuple(widths),
+            options.max_width,
+            options.legacy_windows,
+            options.ascii_only,
+            options.encoding,
+            options.markup,
+        )
+        for row_index, (task_id, row) in enumerate(zip(self.row_ids, self.rows)):
+            cells = tuple(column._cells[row_index] for column in columns)
+            key = (render_key, cells)
+            cached = row_cache.get(task_id)
+            if cached is None or cached[0] != key:
+                row_table = copy(self)
+                row_table.columns = [column.copy() for column in columns]
+                for column, cell in zip(row_table.columns, cells):
+                    column._cells.append(cell)
+                row_table.rows = [row]
+                segments = Table._render(row_table, console, options, widths)
+                cached = row_cache[task_id] = (
+                    key,
+                    list(typing.cast(Iterable[Segment], segments)),
+                )
+            yield from cached[1]
+
+
+def _make_track_progress(
+    description: str,
+    auto_refresh: bool,
+    console: Optional[Console],
+    transient: bool,
+    get_time: Optional[Callable[[], float]],
+    refresh_per_second: float,
+    style: StyleType,
+    complete_style: StyleType,
+    finished_style: StyleType,
+    pulse_style: StyleType,
+    disable: bool,
+    show_speed: bool,
+) -> "Progress":
+    """Make the progress instance for :func:`track` and :func:`track_async`."""
+    columns: List["ProgressColumn"] = (
+        [TextColumn("[progress.description]{task.description}")] if description else []
+    )
+    columns.extend(
+        (
+            BarColumn(
+                style=style,
+                complete_style=complete_style,
+                finished_style=finished_style,
+                pulse_style=pulse_style,
+            ),
+            TaskProgressColumn(show_speed=show_speed),
+            TimeRemainingColumn(elapsed_when_finished=True),
+        )
+    )
+    progress = Progress(
+        *columns,
+        auto_refresh=auto_refresh,
+        console=console,
+        transient=transient,
+        get_time=get_time,
+        refresh_per_second=refresh_per_second or 10,
+        disable=disable,
+    )
+    return progress
+
+
 def track(
     sequence: Iterable[ProgressType],
     description: str = "Working...",
@@ -144,29 +370,19 @@ def track(
 
     """
 
-    columns: List["ProgressColumn"] = (
-        [TextColumn("[progress.description]{task.description}")] if description else []
-    )
-    columns.extend(
-        (
-            BarColumn(
-                style=style,
-                complete_style=complete_style,
-                finished_style=finished_style,
-                pulse_style=pulse_style,
-            ),
-            TaskProgressColumn(show_speed=show_speed),
-            TimeRemainingColumn(elapsed_when_finished=True),
-        )
-    )
-    progress = Progress(
-        *columns,
+    progress = _make_track_progress(
+        description=description,
         auto_refresh=auto_refresh,
         console=console,
         transient=transient,
         get_time=get_time,
-        refresh_per_second=refresh_per_second or 10,
+        refresh_per_second=refresh_per_second,
+        style=style,
+        complete_style=complete_style,
+        finished_style=finished_style,
+        pulse_style=pulse_style,
         disable=disable,
+        show_speed=show_speed,
     )
 
     with progress:
@@ -179,6 +395,74 @@ def track(
         )
 
 
+async def track_async(
+    sequence: Union[AsyncIterable[ProgressType], Iterable[ProgressType]],
+    description: str = "Working...",
+    total: Optional[float] = None,
+    completed: int = 0,
+    auto_refresh: bool = True,
+    console: Optional[Console] = None,
+    transient: bool = False,
+    get_time: Optional[Callable[[], float]] = None,
+    refresh_per_second: float = 10,
+    style: StyleType = "bar.back",
+    complete_style: StyleType = "bar.complete",
+    finished_style: StyleType = "bar.finished",
+    pulse_style: StyleType = "bar.pulse",
+    update_period: float = 0.1,
+    disable: bool = False,
+    show_speed: bool = True,
+) -> AsyncIterator[ProgressType]:
+    """Track progress by iterating over an async iterable (or a sequence), with ``async for``.
+
+    The progress display is refreshed by the running event loop, rather than a thread.
+
+    Args:
+        sequence (Union[AsyncIterable[ProgressType], Iterable[ProgressType]]): Values you wish to iterate over and track progress.
+        description (str, optional): Description of task show next to progress bar. Defaults to "Working".
+        total: (float, optional): Total number of steps. Default is len(sequence).
+        completed (int, optional): Number of steps completed so far. Defaults to 0.
+        auto_refresh (bool, optional): Automatic refresh, disable to force a refresh after each iteration. Default is True.
+        transient: (bool, optional): Clear the progress on exit. Defaults to False.
+        console (Console, optional): Console to write to. Default creates internal Console instance.
+        refresh_per_second (float): Number of times per second to refresh the progress information. Defaults to 10.
+        style (StyleType, optional): Style for the bar background. Defaults to "bar.back".
+        complete_style (StyleType, optional): Style for the completed bar. Defaults to "bar.complete".
+        finished_style (StyleType, optional): Style for a finished bar. Defaults to "bar.finished".
+        pulse_style (StyleType, optional): Style for pulsing bars. Defaults to "bar.pulse".
+        update_period (float, optional): Minimum time (in seconds) between calls to update(). Defaults to 0.1.
+        disable (bool, optional): Disable display of progress.
+        show_speed (bool, optional): Show speed if total isn't known. Defaults to True.
+    Returns:
+        AsyncIterator[ProgressType]: An async iterator of the values in the iterable.
+
+    """
+    progress = _make_track_progress(
+        description=description,
+        auto_refresh=auto_refresh,
+        console=console,
+        transient=transient,
+        get_time=get_time,
+        refresh_per_second=refresh_per_second,
+        style=style,
+        complete_style=complete_style,
+        finished_style=finished_style,
+        pulse_style=pulse_style,
+        disable=disable,
+        show_speed=show_speed,
+    )
+
+    async with progress:
+        async for value in progress.track_async(
+            sequence,
+            total=total,
+            completed=completed,
+            description=description,
+            update_period=update_period,
+        ):
+            yield value
+
+
 class _Reader(RawIOBase, BinaryIO):
     """A reader that tracks progress while it's being read from."""
 
@@ -509,9 +793,16 @@ class ProgressColumn(ABC):
 
     max_refresh: Optional[float] = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "render" in cls.__dict__ and "get_render_key" not in cls.__dict__:
+            # A render key inherited from a base class may not apply to a new render method
+            cls.get_render_key = ProgressColumn.get_render_key  # type: ignore[method-assign]
+
     def __init__(self, table_column: Optional[Column] = None) -> None:
         self._table_column = table_column
         self._renderable_cache: Dict[TaskID, Tuple[float, RenderableType]] = {}
+        self._render_keys: Dict[TaskID, Hashable] = {}
         self._update_time: Optional[float] = None
 
     def get_table_column(self) -> Column:
@@ -537,10 +828,34 @@ class ProgressColumn(ABC):
                 if timestamp + self.max_refresh > current_time:
                     return renderable
 
+        render_key = self.get_render_key(task)
+        if render_key is not None and self._render_keys.get(task.id) == render_key:
+            try:
+                _, renderable = self._renderable_cache[task.id]
+            except KeyError:
+                pass
+            else:
+                return renderable
+
         renderable = self.render(task)
         self._renderable_cache[task.id] = (current_time, renderable)
+        self._render_keys[task.id] = render_key
         return renderable
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        """Get a key which identifies the renderable that :meth:`render` would return for a task.
+
+        If the key is the same as the previous call for the same task, the previous renderable is
+        re-used, which allows the progress display to re-use its rendered output.
+
+        Args:
+            task (Task): An object containing information regarding the task.
+
+        Returns:
+            Optional[Hashable]: A hashable key, or ``None`` to always call :meth:`render`.
+        """
+        return None
+
     @abstractmethod
     def render(self, task: "Task") -> RenderableType:
         """Should return a renderable object."""
@@ -604,6 +919,10 @@ class SpinnerColumn(ProgressColumn):
         """
         self.spinner = Spinner(spinner_name, style=spinner_style, speed=speed)
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        # The spinner is animated until the task finishes
+        return "finished" if task.finished else None
+
     def render(self, task: "Task") -> RenderableType:
         text = (
             self.finished_text
@@ -632,6 +951,9 @@ class TextColumn(ProgressColumn):
         self.highlighter = highlighter
         super().__init__(table_column=table_column or Column(no_wrap=True))
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        return self.text_format.format(task=task)
+
     def render(self, task: "Task") -> Text:
         _text = self.text_format.format(task=task)
         if self.markup:
@@ -670,6 +992,12 @@ class BarColumn(ProgressColumn):
         self.pulse_style = pulse_style
         super().__init__(table_column=table_column)
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        if task.total is None or not task.started:
+            # Pulsing bars are animated
+            return None
+        return (task.total, task.completed)
+
     def render(self, task: "Task") -> ProgressBar:
         """Gets a progress bar widget for a task."""
         return ProgressBar(
@@ -753,6 +1081,13 @@ class TaskProgressColumn(TextColumn):
         data_speed = speed / unit
         return Text(f"{data_speed:.1f}{suffix} it/s", style="progress.percentage")
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        if task.total is None:
+            if self.show_speed:
+                return None
+            return self.text_format_no_percentage.format(task=task)
+        return self.text_format.format(task=task)
+
     def render(self, task: "Task") -> Text:
         if task.total is None and self.show_speed:
             return self.render_speed(task.finished_speed or task.speed)
@@ -820,6 +1155,9 @@ class TimeRemainingColumn(ProgressColumn):
 class FileSizeColumn(ProgressColumn):
     """Renders completed filesize."""
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        return int(task.completed)
+
     def render(self, task: "Task") -> Text:
         """Show data completed."""
         data_size = filesize.decimal(int(task.completed))
@@ -829,6 +1167,9 @@ class FileSizeColumn(ProgressColumn):
 class TotalFileSizeColumn(ProgressColumn):
     """Renders total filesize."""
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        return task.total
+
     def render(self, task: "Task") -> Text:
         """Show data completed."""
         data_size = filesize.decimal(int(task.total)) if task.total is not None else ""
@@ -851,6 +1192,9 @@ class MofNCompleteColumn(ProgressColumn):
         self.separator = separator
         super().__init__(table_column=table_column)
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        return (int(task.completed), task.total)
+
     def render(self, task: "Task") -> Text:
         """Show completed/total."""
         completed = int(task.completed)
@@ -875,6 +1219,9 @@ class DownloadColumn(ProgressColumn):
         self.binary_units = binary_units
         super().__init__(table_column=table_column)
 
+    def get_render_key(self, task: "Task") -> Optional[Hashable]:
+        return (int(task.completed), task.total)
+
     def render(self, task: "Task") -> Text:
         """Calculate common unit for completed and total."""
         completed = int(task.completed)
@@ -932,6 +1279,140 @@ class ProgressSample(NamedTuple):
     """Number of steps completed."""
 
 
+class SpeedEstimator(ABC):
+    """Base class for a strategy which estimates the speed of a task.
+
+    The :class:`~Progress` class adds a sample to a task's estimator whenever the task advances.
+    Implementations should make :attr:`speed` cheap to read, as it is read by columns on every
+    refresh.
+    """
+
+    @abstractmethod
+    def add(self, timestamp: float, completed: float) -> None:
+        """Add a sample of progress, discarding samples which are too old.
+
+        Args:
+            timestamp (float): Time of the sample.
+            completed (float): Number of steps completed since the previous sample.
+        """
+
+    def expire(self, timestamp: float) -> None:
+        """Discard samples which are too old to be included in the estimate.
+
+        Args:
+            timestamp (float): The current time.
+        """
+
+    @property
+    @abstractmethod
+    def speed(self) -> Optional[float]:
+        """Optional[float]: The estimated speed in steps per second, or ``None`` if unknown."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard all samples."""
+
+
+class WindowSpeedEstimator(SpeedEstimator):
+    """Estimates speed from the samples in a window of time.
+
+    The speed is the number of steps completed after the first sample in the window, divided
+    by the time between the first and last samples. A running total of the steps in the window
+    is kept, so the speed is calculated without iterating over the samples.
+
+    Args:
+        period (float, optional): Period (in seconds) of the window. Defaults to 30.
+        max_samples (int, optional): Maximum number of samples in the window. Defaults to 1000.
+    """
+
+    def __init__(self, period: float = 30.0, max_samples: int = 1000) -> None:
+        self.period = period
+        self.max_samples = max_samples
+        self._samples: Deque[ProgressSample] = deque()
+        self._total = 0.0
+
+    def add(self, timestamp: float, completed: float) -> None:
+        samples = self._samples
+        if samples and samples[0].timestamp < timestamp - self.period:
+            self.expire(timestamp)
+        if len(samples) >= self.max_samples:
+            self._total -= samples.popleft().completed
+        samples.append(ProgressSample(timestamp, completed))
+        self._total += completed
+
+    def expire(self, timestamp: float) -> None:
+        samples = self._samples
+        old_sample_time = timestamp - self.period
+        if samples and samples[0].timestamp < old_sample_time:
+            popleft = samples.popleft
+            total = self._total
+            while samples and samples[0].timestamp < old_sample_time:
+                total -= popleft().completed
+            # Start from zero again when the window is empty, so rounding errors don't accumulate
+            self._total = total if samples else 0.0
+
+    @property
+    def speed(self) -> Optional[float]:
+        samples = self._samples
+        if not samples:
+            return None
+        first_sample = samples[0]
+        total_time = samples[-1].timestamp - first_sample.timestamp
+        if total_time == 0:
+            return None
+        return (self._total - first_sample.completed) / total_time
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._total = 0.0
+
+
+class ExponentialSpeedEstimator(SpeedEstimator):
+    """Estimates speed with an exponentially weighted moving average.
+
+    Recent progress is weighted more heavily than older progress, so the estimate follows
+    changes in speed more closely than a window, and stores no samples.
+
+    Args:
+        half_life (float, optional): Time (in seconds) for the weight of a sample to halve.
+            Defaults to 5.
+    """
+
+    def __init__(self, half_life: float = 5.0) -> None:
+        self.half_life = half_life
+        self._speed: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._pending = 0.0
+
+    def add(self, timestamp: float, completed: float) -> None:
+        last_time = self._last_time
+        if last_time is None:
+            # Like the window, the steps in the first sample happened before it was taken
+            self._last_time = timestamp
+            return
+        self._pending += completed
+        elapsed = timestamp - last_time
+        if elapsed <= 0:
+            return
+        rate = self._pending / elapsed
+        self._pending = 0.0
+        self._last_time = timestamp
+        if self._speed is None:
+            self._speed = rate
+        else:
+            weight = 0.5 ** (elapsed / self.half_life)
+            self._speed = rate + (self._speed - rate) * weight
+
+    @property
+    def speed(self) -> Optional[float]:
+        return self._speed
+
+    def reset(self) -> None:
+        self._speed = None
+        self._last_time = None
+        self._pending = 0.0
+
+
 @dataclass
 class Task:
     """Information regarding a progress task.
@@ -973,9 +1454,10 @@ class Task:
     finished_speed: Optional[float] = None
     """Optional[float]: The last speed for a finished task."""
 
-    _progress: Deque[ProgressSample] = field(
-        default_factory=lambda: deque(maxlen=1000), init=False, repr=False
+    _speed_estimator: SpeedEstimator = field(
+        default_factory=WindowSpeedEstimator, repr=False
     )
+    """Strategy which estimates the speed of the task."""
 
     _lock: RLock = field(repr=False, default_factory=RLock)
     """Thread lock."""
@@ -1025,17 +1507,7 @@ class Task:
         if self.start_time is None:
             return None
         with self._lock:
-            progress = self._progress
-            if not progress:
-                return None
-            total_time = progress[-1].timestamp - progress[0].timestamp
-            if total_time == 0:
-                return None
-            iter_progress = iter(progress)
-            next(iter_progress)
-            total_completed = sum(sample.completed for sample in iter_progress)
-            speed = total_completed / total_time
-            return speed
+            return self._speed_estimator.speed
 
     @property
     def time_remaining(self) -> Optional[float]:
@@ -1053,7 +1525,7 @@ class Task:
 
     def _reset(self) -> None:
         """Reset progress."""
-        self._progress.clear()
+        self._speed_estimator.reset()
         self.finished_time = None
         self.finished_speed = None
 
@@ -1066,12 +1538,15 @@ class Progress(JupyterMixin):
         auto_refresh (bool, optional): Enable auto refresh. If disabled, you will need to call `refresh()`.
         refresh_per_second (float, optional): Number of times per second to refresh the progress information. Defaults to 10.
         speed_estimate_period: (float, optional): Period (in seconds) used to calculate the speed estimate. Defaults to 30.
+        speed_estimator: (Callable[[], SpeedEstimator], optional): A callable that creates the speed estimator for a new task,
+            or None for a :class:`WindowSpeedEstimator` with a period of ``speed_estimate_period``. Defaults to None.
         transient: (bool, optional): Clear the progress on exit. Defaults to False.
         redirect_stdout: (bool, optional): Enable redirection of stdout, so ``print`` may be used. Defaults to True.
         redirect_stderr: (bool, optional): Enable redirection of stderr. Defaults to True.
         get_time: (Callable, optional): A callable that gets the current time, or None to use Console.get_time. Defaults to None.
         disable (bool, optional): Disable progress display. Defaults to False
         expand (bool, optional): Expand tasks table to fit width. Defaults to False.
+        diff_redraw (bool, optional): Only redraw the parts of the display which changed since the last refresh. Defaults to False.
     """
 
     def __init__(
@@ -1081,22 +1556,27 @@ class Progress(JupyterMixin):
         auto_refresh: bool = True,
         refresh_per_second: float = 10,
         speed_estimate_period: float = 30.0,
+        speed_estimator: Optional[SpeedEstimatorFactory] = None,
         transient: bool = False,
         redirect_stdout: bool = True,
         redirect_stderr: bool = True,
         get_time: Optional[GetTimeCallable] = None,
         disable: bool = False,
         expand: bool = False,
+        diff_redraw: bool = False,
     ) -> None:
         assert refresh_per_second > 0, "refresh_per_second must be > 0"
         self._lock = RLock()
         self.columns = columns or self.get_default_columns()
         self.speed_estimate_period = speed_estimate_period
+        self.speed_estimator = speed_estimator
 
         self.disable = disable
         self.expand = expand
         self._tasks: Dict[TaskID, Task] = {}
         self._task_index: TaskID = TaskID(0)
+        self._cell_cache: Dict[Tuple[TaskID, int], _CachedCell] = {}
+        self._row_cache: Dict[TaskID, Tuple[Tuple[Any, ...], List[Segment]]] = {}
         self.live = Live(
             console=console or get_console(),
             auto_refresh=auto_refresh,
@@ -1105,6 +1585,7 @@ class Progress(JupyterMixin):
             redirect_stdout=redirect_stdout,
             redirect_stderr=redirect_stderr,
             get_renderable=self.get_renderable,
+            diff_redraw=diff_redraw,
         )
         self.get_time = get_time or self.console.get_time
         self.print = self.console.print
@@ -1189,6 +1670,19 @@ class Progress(JupyterMixin):
     ) -> None:
         self.stop()
 
+    async def __aenter__(self) -> Self:
+        if not self.disable:
+            self.live._start_on_loop(refresh=True)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
     def track(
         self,
         sequence: Iterable[ProgressType],
@@ -1234,6 +1728,72 @@ class Progress(JupyterMixin):
                 advance(task_id, 1)
                 refresh()
 
+    async def track_async(
+        self,
+        sequence: Union[AsyncIterable[ProgressType], Iterable[ProgressType]],
+        total: Optional[float] = None,
+        completed: int = 0,
+        task_id: Optional[TaskID] = None,
+        description: str = "Working...",
+        update_period: float = 0.1,
+    ) -> AsyncIterator[ProgressType]:
+        """Track progress by iterating over an async iterable (or a sequence), with ``async for``.
+
+        You will need to specify ``total`` for an async iterable.
+
+        Args:
+            sequence (Union[AsyncIterable[ProgressType], Iterable[ProgressType]]): Values you want to iterate over and track progress.
+            total: (float, optional): Total number of steps. Default is len(sequence).
+            completed (int, optional): Number of steps completed so far. Defaults to 0.
+            task_id: (TaskID): Task to track. Default is new task.
+            description: (str, optional): Description of task, if new task is created.
+            update_period (float, optional): Minimum time (in seconds) between calls to update(). Defaults to 0.1.
+
+        Returns:
+            AsyncIterator[ProgressType]: An async iterator of values taken from the provided iterable.
+        """
+        if total is None:
+            total = float(length_hint(sequence)) or None
+
+        if task_id is None:
+            task_id = self.add_task(description, total=total, completed=completed)
+        else:
+            self.update(task_id, total=total, completed=completed)
+
+        values: AsyncIterator[ProgressType]
+        if isinstance(sequence, AsyncIterable):
+            values = sequence.__aiter__()
+        else:
+
+            async def iter_values() -> AsyncIterator[ProgressType]:
+                for value in sequence:
+                    yield value
+
+            values = iter_values()
+
+        auto_refresh = self.live.auto_refresh
+        get_time = self.get_time
+        advance = self.advance
+        steps = 0
+        last_update_time = get_time()
+        try:
+            async for value in values:
+                yield value
+                steps += 1
+                if not auto_refresh:
+                    advance(task_id, steps)
+                    steps = 0
+                    self.refresh()
+                elif get_time() - last_update_time >= update_period:
+                    # Advance in batches, so iterating doesn't contend for the lock
+                    advance(task_id, steps)
+                    steps = 0
+                    last_update_time = get_time()
+        finally:
+            if steps:
+                advance(task_id, steps)
+            self.refresh()
+
     def wrap_file(
         self,
         file: BinaryIO,
@@ -1457,14 +2017,10 @@ class Progress(JupyterMixin):
             update_completed = task.completed - completed_start
 
             current_time = self.get_time()
-            old_sample_time = current_time - self.speed_estimate_period
-            _progress = task._progress
-
-            popleft = _progress.popleft
-            while _progress and _progress[0].timestamp < old_sample_time:
-                popleft()
             if update_completed > 0:
-                _progress.append(ProgressSample(current_time, update_completed))
+                task._speed_estimator.add(current_time, update_completed)
+            else:
+                task._speed_estimator.expire(current_time)
             if (
                 task.total is not None
                 and task.completed >= task.total
@@ -1527,15 +2083,7 @@ class Progress(JupyterMixin):
             completed_start = task.completed
             task.completed += advance
             update_completed = task.completed - completed_start
-            old_sample_time = current_time - self.speed_estimate_period
-            _progress = task._progress
-
-            popleft = _progress.popleft
-            while _progress and _progress[0].timestamp < old_sample_time:
-                popleft()
-            while len(_progress) > 1000:
-                popleft()
-            _progress.append(ProgressSample(current_time, update_completed))
+            task._speed_estimator.add(current_time, update_completed)
             if (
                 task.total is not None
                 and task.completed >= task.total
@@ -1545,9 +2093,13 @@ class Progress(JupyterMixin):
                 task.finished_speed = task.speed
 
     def refresh(self) -> None:
-        """Refresh (render) the progress information."""
+        """Refresh (render) the progress information.
+
+        If the progress was started with ``async with``, and this is called from the event loop,
+        the refresh is scheduled to run once in the current iteration of the loop.
+        """
         if not self.disable and self.live.is_started:
-            self.live.refresh()
+            self.live._request_refresh()
 
     def get_renderable(self) -> RenderableType:
         """Get a renderable for the progress display."""
@@ -1576,20 +2128,47 @@ class Progress(JupyterMixin):
             )
             for _column in self.columns
         )
-        table = Table.grid(*table_columns, padding=(0, 1), expand=self.expand)
+        table = typing.cast(
+            _TasksTable,
+            _TasksTable.grid(*table_columns, padding=(0, 1), expand=self.expand),
+        )
+        table.row_ids = []
 
+        # Cells which render the same as the last refresh re-use their measurement and render
+        cell_cache = self._cell_cache
+        row_cache = self._row_cache
+        new_cell_cache: Dict[Tuple[TaskID, int], _CachedCell] = {}
+        new_row_cache: Dict[TaskID, Tuple[Tuple[Any, ...], List[Segment]]] = {}
         for task in tasks:
             if task.visible:
-                table.add_row(
-                    *(
-                        (
-                            column.format(task=task)
-                            if isinstance(column, str)
-                            else column(task)
+                if task.id in row_cache:
+                    new_row_cache[task.id] = row_cache[task.id]
+                table.row_ids.append(task.id)
+                row: List[_CachedCell] = []
+                for column_index, column in enumerate(self.columns):
+                    if isinstance(column, str):
+                        renderable: RenderableType = column.format(task=task)
+                        render_key: Optional[Hashable] = None
+                    else:
+                        renderable = column(task)
+                        render_key = column._render_keys.get(task.id)
+                    key = _get_cell_key(renderable, render_key)
+                    cell = cell_cache.get((task.id, column_index))
+                    # A render key only applies to the renderable the column re-used
+                    if (
+                        cell is None
+                        or key is None
+                        or cell.key != key
+                        or (
+                            key[0] == "render_key" and cell.renderable is not renderable
                         )
-                        for column in self.columns
-                    )
-                )
+                    ):
+                        cell = _CachedCell(renderable, key)
+                    new_cell_cache[(task.id, column_index)] = cell
+                    row.append(cell)
+                table.add_row(*row)
+        self._cell_cache = new_cell_cache
+        self._row_cache = table.row_cache = new_row_cache
         return table
 
     def __rich__(self) -> RenderableType:
@@ -1604,6 +2183,7 @@ class Progress(JupyterMixin):
         total: Optional[float] = 100.0,
         completed: int = 0,
         visible: bool = True,
+        speed_estimator: Optional[SpeedEstimatorFactory] = None,
         **fields: Any,
     ) -> TaskID:
         """Add a new 'task' to the Progress display.
@@ -1616,11 +2196,15 @@ class Progress(JupyterMixin):
                 Set to None to render a pulsing animation. Defaults to 100.
             completed (int, optional): Number of steps completed so far. Defaults to 0.
             visible (bool, optional): Enable display of the task. Defaults to True.
+            speed_estimator (Callable[[], SpeedEstimator], optional): A callable that creates the
+                speed estimator for this task, or None to use the ``speed_estimator`` of the Progress.
+                Defaults to None.
             **fields (str): Additional data fields required for rendering.
 
         Returns:
             TaskID: An ID you can use when calling `update`.
         """
+        speed_estimator = speed_estimator or self.speed_estimator
         with self._lock:
             task = Task(
                 self._task_index,
@@ -1630,6 +2214,11 @@ class Progress(JupyterMixin):
                 visible=visible,
                 fields=fields,
                 _get_time=self.get_time,
+                _speed_estimator=(
+                    WindowSpeedEstimator(self.speed_estimate_period)
+                    if speed_estimator is None
+                    else speed_estimator()
+                ),
                 _lock=self._lock,
             )
             self._tasks[self._task_index] = task
@@ -1640,6 +2229,23 @@ class Progress(JupyterMixin):
         self.refresh()
         return new_task_index
 
+    def proxy(self, update_period: float = 0.1) -> "ProgressProxy":
+        """Get a proxy which updates tasks from other processes.
+
+        The proxy may be passed to worker processes (for instance with ``multiprocessing`` or a
+        ``ProcessPoolExecutor``), which call ``advance`` or ``update`` on the proxy. Updates are
+        sent to this process in batches, and applied to the tasks.
+
+        Args:
+            update_period (float, optional): Minimum time (in seconds) between sending updates
+                from a process. Defaults to 0.1.
+
+        Returns:
+            ProgressProxy: A proxy, which should be closed (or used as a context manager) when
+                the worker processes have exited.
+        """
+        return ProgressProxy(self, update_period=update_period)
+
     def remove_task(self, task_id: TaskID) -> None:
         """Delete a task if it exists.
 
@@ -1651,6 +2257,324 @@ class Progress(JupyterMixin):
             del self._tasks[task_id]
 
 
+class _ProxySender(Thread):
+    """A thread to send the updates of progress proxies in a process to the parent process."""
+
+    def __init__(self, address: Any, authkey: bytes, update_period: float) -> None:
+        self.address = address
+        self.authkey = authkey
+        self.update_period = update_period
+        self.pid = os.getpid()
+        self.done = Event()
+        self.lock = Lock()
+        self.pending: Dict[TaskID, Dict[str, Any]] = {}
+        self._connection: Any = None
+        self._broken = False
+        super().__init__(daemon=True)
+
+    def run(self) -> None:
+        wait = self.done.wait
+        update_period = self.update_period
+        while not wait(update_period):
+            self.flush()
+
+    def add(self, task_id: TaskID, update: Dict[str, Any]) -> None:
+        """Merge an update with the pending updates for a task.
+
+        Args:
+            task_id (TaskID): ID of task.
+            update (Dict[str, Any]): Arguments for :meth:`Progress.update`.
+        """
+        with self.lock:
+            pending = self.pending.setdefault(task_id, {})
+            advance = update.pop("advance", None)
+            if "completed" in update:
+                # Progress.update sets completed after advancing, so a pending advance is overwritten
+                pending.pop("advance", None)
+            elif advance is not None:
+                if "completed" in pending:
+                    pending["completed"] += advance
+                else:
+                    pending["advance"] = pending.get("advance", 0) + advance
+            pending.update(update)
+
+    def flush(self) -> None:
+        """Send pending updates to the parent process."""
+        with self.lock:
+            pending = self.pending
+            if not pending or self._broken:
+                pending.clear()
+                return
+            self.pending = {}
+            try:
+                if self._connection is None:
+                    from multiprocessing.connection import Client
+
+                    self._connection = Client(self.address, authkey=self.authkey)
+                self._connection.send(list(pending.items()))
+            except (OSError, EOFError):
+                # The parent process has closed the proxy, so updates are discarded
+                self._broken = True
+
+    def close(self) -> None:
+        """Send pending updates, and close the connection."""
+        self.done.set()
+        self.flush()
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._broken = True
+
+
+# Senders in this process, keyed on the address of the proxy
+_proxy_senders: Dict[Any, _ProxySender] = {}
+_proxy_senders_lock = Lock()
+
+
+def _get_proxy_sender(
+    address: Any, authkey: bytes, update_period: float
+) -> _ProxySender:
+    """Get the sender for a proxy in the current process, or start one."""
+    with _proxy_senders_lock:
+        sender = _proxy_senders.get(address)
+        if sender is None or sender.pid != os.getpid():
+            from multiprocessing.util import Finalize
+
+            sender = _ProxySender(address, authkey, update_period)
+            _proxy_senders[address] = sender
+            sender.start()
+            # Send the final updates when the process exits
+            Finalize(sender, sender.close, exitpriority=10)
+        return sender
+
+
+class _ProxyReader(Thread):
+    """A thread to apply the updates received from a process to a progress instance."""
+
+    def __init__(self, proxy: "ProgressProxy", connection: Any) -> None:
+        self.proxy = proxy
+        self.connection = connection
+        super().__init__(daemon=True)
+
+    def run(self) -> None:
+        proxy = self.proxy
+        progress = proxy._progress
+        assert progress is not None
+        update = progress.update
+        with self.connection as connection:
+            while True:
+                try:
+                    updates = connection.recv()
+                except (OSError, EOFError):
+                    break
+                if proxy._closed:
+                    break
+                for task_id, task_update in updates:
+                    try:
+                        update(task_id, **task_update)
+                    except KeyError:
+                        # The task was removed
+                        pass
+
+
+class _ProxyListener(Thread):
+    """A thread to accept connections from processes which update a proxy."""
+
+    def __init__(self, proxy: "ProgressProxy", listener: Any) -> None:
+        self.proxy = proxy
+        self.listener = listener
+        self.readers: List[_ProxyReader] = []
+        super().__init__(daemon=True)
+
+    def run(self) -> None:
+        from multiprocessing import AuthenticationError
+
+        while True:
+            try:
+                connection = self.listener.accept()
+            except AuthenticationError:
+                # The proxy connects with the wrong key to stop the thread
+                if self.proxy._stopping:
+                    break
+                continue
+            except OSError:
+                break
+            reader = _ProxyReader(self.proxy, connection)
+            self.readers.append(reader)
+            reader.start()
+
+
+class ProgressProxy:
+    """Updates the tasks of a :class:`Progress` from other processes.
+
+    A proxy may be pickled, and passed to worker processes (for example with
+    ``multiprocessing`` or a ``ProcessPoolExecutor``). Updates in a worker are merged, and sent to
+    the parent process in a batch every ``update_period`` seconds, and when the worker exits.
+
+    Create a proxy with :meth:`Progress.proxy`, and close it when the workers have exited.
+
+    Args:
+        progress (Progress): Progress instance to update.
+        update_period (float, optional): Minimum time (in seconds) between sending updates
+            from a process. Defaults to 0.1.
+    """
+
+    def __init__(self, progress: "Progress", update_period: float = 0.1) -> None:
+        from multiprocessing.connection import Listener
+
+        self._progress: Optional[Progress] = progress
+        self._pid: Optional[int] = os.getpid()
+        self.update_period = update_period
+        self._authkey = os.urandom(32)
+        self._stopping = False
+        self._closed = False
+        self._listener = Listener(authkey=self._authkey)
+        self.address = self._listener.address
+        self._listener_thread: Optional[_ProxyListener] = _ProxyListener(
+            self, self._listener
+        )
+        self._listener_thread.start()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "authkey": self._authkey,
+            "update_period": self.update_period,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.address = state["address"]
+        self._authkey = state["authkey"]
+        self.update_period = state["update_period"]
+        self._progress = None
+        self._pid = None
+        self._stopping = False
+        self._closed = False
+        self._listener_thread = None
+
+    def _get_progress(self) -> Optional["Progress"]:
+        """Get the Progress, if this is the process which created the proxy.
+
+        A forked process inherits the Progress without pickling the proxy, so the process ID is
+        checked as well.
+        """
+        if self._pid != os.getpid():
+            return None
+        return self._progress
+
+    def __enter__(self) -> "ProgressProxy":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def update(
+        self,
+        task_id: TaskID,
+        *,
+        total: Optional[float] = None,
+        completed: Optional[float] = None,
+        advance: Optional[float] = None,
+        description: Optional[str] = None,
+        visible: Optional[bool] = None,
+        **fields: Any,
+    ) -> None:
+        """Update information associated with a task (see :meth:`Progress.update`).
+
+        Args:
+            task_id (TaskID): Task id (returned by add_task).
+            total (float, optional): Updates task.total if not None.
+            completed (float, optional): Updates task.completed if not None.
+            advance (float, optional): Add a value to task.completed if not None.
+            description (str, optional): Change task description if not None.
+            visible (bool, optional): Set visible flag if not None.
+            **fields (Any): Additional data fields required for rendering.
+        """
+        update: Dict[str, Any] = fields
+        if total is not None:
+            update["total"] = total
+        if completed is not None:
+            update["completed"] = completed
+        if advance is not None:
+            update["advance"] = advance
+        if description is not None:
+            update["description"] = description
+        if visible is not None:
+            update["visible"] = visible
+        progress = self._get_progress()
+        if progress is not None:
+            progress.update(task_id, **update)
+        else:
+            _get_proxy_sender(self.address, self._authkey, self.update_period).add(
+                task_id, update
+            )
+
+    def advance(self, task_id: TaskID, advance: float = 1) -> None:
+        """Advance task by a number of steps.
+
+        Args:
+            task_id (TaskID): ID of task.
+            advance (float): Number of steps to advance. Default is 1.
+        """
+        progress = self._get_progress()
+        if progress is not None:
+            progress.advance(task_id, advance)
+        else:
+            _get_proxy_sender(self.address, self._authkey, self.update_period).add(
+                task_id, {"advance": advance}
+            )
+
+    def flush(self) -> None:
+        """Send pending updates from this process now, rather than at the next update period."""
+        sender = _proxy_senders.get(self.address)
+        if sender is not None and sender.pid == os.getpid():
+            sender.flush()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Close the proxy.
+
+        In the parent process, this stops accepting connections and waits for the processes
+        which sent updates to close their connections (which they do when they exit). In other
+        processes, this sends pending updates.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) to wait for processes to close
+                their connections, or None to wait indefinitely. Defaults to 5.
+        """
+        with _proxy_senders_lock:
+            sender = _proxy_senders.get(self.address)
+            if sender is not None and sender.pid == os.getpid():
+                del _proxy_senders[self.address]
+            else:
+                sender = None
+        if sender is not None:
+            sender.close()
+        listener_thread = self._listener_thread
+        if listener_thread is None or self._pid != os.getpid():
+            return
+        self._listener_thread = None
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Client
+
+        self._stopping = True
+        try:
+            Client(self.address, authkey=b"")
+        except (AuthenticationError, OSError, EOFError):
+            pass
+        listener_thread.join()
+        deadline = None if timeout is None else monotonic() + timeout
+        for reader in listener_thread.readers:
+            reader.join(None if deadline is None else max(0, deadline - monotonic()))
+        self._closed = True
+        self._listener.close()
+
+
 if __name__ == "__main__":  # pragma: no coverage
     import random
     import time
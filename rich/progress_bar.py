@@ -1,8 +1,8 @@
 import math
-from functools import lru_cache
 from time import monotonic
 from typing import Iterable, List, Optional
 
+from . import caches
 from .color import Color, blend_rgb
 from .color_triplet import ColorTriplet
 from .console import Console, ConsoleOptions, RenderResult
@@ -66,12 +66,12 @@ class ProgressBar(JupyterMixin):
         completed = min(100, max(0.0, completed))
         return completed
 
-    @lru_cache(maxsize=16)
+    @caches.lru_cache("progress_bar.pulse_segments")
     def _get_pulse_segments(
         self,
         fore_style: Style,
         back_style: Style,
-        color_system: str,
+        color_system: Optional[str],
         no_color: bool,
         ascii: bool = False,
     ) -> List[Segment]:
@@ -1,5 +1,4 @@
 from enum import IntEnum
-from functools import lru_cache
 from itertools import filterfalse
 from logging import getLogger
 from operator import attrgetter
@@ -16,6 +15,7 @@ from typing import (
     Union,
 )
 
+from . import caches
 from .cells import (
     _is_single_cell_widths,
     cached_cell_len,
@@ -107,7 +107,7 @@ class Segment(NamedTuple):
         return self.control is not None
 
     @classmethod
-    @lru_cache(1024 * 16)
+    @caches.lru_cache("segment.split_cells")
     def _split_cells(cls, segment: "Segment", cut: int) -> Tuple["Segment", "Segment"]:
         """Split a segment in to two at a given cell position.
 
@@ -0,0 +1,608 @@
+"""Compact storage for large amounts of rendered output.
+
+A list of :class:`~rich.segment.Segment` objects requires a tuple per piece of text. A
+:class:`SegmentBuffer` stores the text of all its segments in a single string, with arrays of
+offsets in to that string and of indexes in to a table of distinct styles. Segments are
+created only when the buffer is converted back in to a list, or iterated over.
+
+"""
+
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .cells import cell_len, set_cell_size
+from .color import ColorSystem
+from .segment import ControlCode, Segment
+from .style import Style
+
+if TYPE_CHECKING:
+    from .console import Console, ConsoleOptions, RenderResult
+
+
+class StyleTable:
+    """Assigns an index to each distinct style, so that styles may be stored in an array.
+
+    Index 0 is reserved for segments without a style.
+    """
+
+    __slots__ = ["styles", "_indexes"]
+
+    def __init__(self) -> None:
+        self.styles: List[Optional[Style]] = [None]
+        self._indexes: Dict[Optional[Style], int] = {None: 0}
+
+    def __len__(self) -> int:
+        return len(self.styles)
+
+    def add(self, style: Optional[Style]) -> int:
+        """Get the index of a style, adding it to the table if required.
+
+        Args:
+            style (Optional[Style]): A style, or ``None`` for no style.
+
+        Returns:
+            int: Index of the style.
+        """
+        index = self._indexes.get(style)
+        if index is None:
+            index = self._indexes[style] = len(self.styles)
+            self.styles.append(style)
+        return index
+
+
+class SegmentBuffer:
+    """A sequence of segments, stored as a single string with arrays of offsets and style indexes.
+
+    Args:
+        text (str, optional): The text of all segments, joined together.
+        offsets (array, optional): Offset in to text where each segment starts, followed by the length of text.
+        style_ids (array, optional): Index of each segment's style in the style table.
+        style_table (StyleTable, optional): The styles referred to by ``style_ids``.
+        controls (Dict[int, Sequence[ControlCode]], optional): Control codes of control segments, keyed by
+            segment index.
+    """
+
+    __slots__ = ["text", "offsets", "style_ids", "style_table", "controls"]
+
+    def __init__(
+        self,
+        text: str = "",
+        offsets: Optional["array[int]"] = None,
+        style_ids: Optional["array[int]"] = None,
+        style_table: Optional[StyleTable] = None,
+        controls: Optional[Dict[int, Sequence[ControlCode]]] = None,
+    ) -> None:
+        self.text = text
+        self.offsets = array("I", [0]) if offsets is None else offsets
+        self.style_ids = array("I") if style_ids is None else style_ids
+        self.style_table = StyleTable() if style_table is None else style_table
+        self.controls = {} if controls is None else controls
+
+    @classmethod
+    def from_segments(
+        cls, segments: Iterable[Segment], style_table: Optional[StyleTable] = None
+    ) -> "SegmentBuffer":
+        """Create a buffer from segments.
+
+        Args:
+            segments (Iterable[Segment]): Segments to store.
+            style_table (StyleTable, optional): Table to add styles to, or ``None`` for a new table.
+
+        Returns:
+            SegmentBuffer: A new buffer.
+        """
+        builder = _Builder(StyleTable() if style_table is None else style_table)
+        builder.extend(segments)
+        return builder.build()
+
+    def __repr__(self) -> str:
+        return f"<segment buffer segments={len(self)} text_length={len(self.text)}>"
+
+    def __len__(self) -> int:
+        return len(self.style_ids)
+
+    def __bool__(self) -> bool:
+        return bool(self.style_ids)
+
+    def __getitem__(self, index: int) -> Segment:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        offsets = self.offsets
+        return Segment(
+            self.text[offsets[index] : offsets[index + 1]],
+            self.style_table.styles[self.style_ids[index]],
+            self.controls.get(index),
+        )
+
+    def __iter__(self) -> Iterator[Segment]:
+        text = self.text
+        offsets = self.offsets
+        styles = self.style_table.styles
+        get_control = self.controls.get
+        _Segment = Segment
+        for index, style_id in enumerate(self.style_ids):
+            yield _Segment(
+                text[offsets[index] : offsets[index + 1]],
+                styles[style_id],
+                get_control(index),
+            )
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        yield from self
+
+    def to_segments(self) -> List[Segment]:
+        """Convert to a list of segments.
+
+        Returns:
+            List[Segment]: Segments in the buffer.
+        """
+        return list(self)
+
+    @property
+    def cell_length(self) -> int:
+        """The number of cells required to display the segments (excluding control segments).
+
+        Returns:
+            int: A number of cells.
+        """
+        return _cell_length(self, 0, len(self))
+
+    def simplify(self) -> "SegmentBuffer":
+        """Combine contiguous segments with the same style.
+
+        Returns:
+            SegmentBuffer: A buffer which renders the same way, with possibly fewer segments.
+        """
+        offsets = self.offsets
+        style_ids = self.style_ids
+        controls = self.controls
+        new_offsets = array("I", [0])
+        new_style_ids = array("I")
+        new_controls: Dict[int, Sequence[ControlCode]] = {}
+        previous_style_id = -1
+        for index, style_id in enumerate(style_ids):
+            control = controls.get(index) if controls else None
+            if control is None and style_id == previous_style_id:
+                # Joining the segments only requires removing the offset between them
+                new_offsets[-1] = offsets[index + 1]
+                continue
+            if control is not None:
+                new_controls[len(new_style_ids)] = control
+                previous_style_id = -1
+            else:
+                previous_style_id = style_id
+            new_offsets.append(offsets[index + 1])
+            new_style_ids.append(style_id)
+        return SegmentBuffer(
+            self.text, new_offsets, new_style_ids, self.style_table, new_controls
+        )
+
+    def split_lines(self) -> "SegmentBufferLines":
+        """Split the buffer in to lines at each new line character.
+
+        Returns:
+            SegmentBufferLines: Lines, without new line characters.
+        """
+        text = self.text
+        offsets = self.offsets
+        controls = self.controls
+        builder = _Builder(self.style_table)
+        add = builder.add
+        add_range = builder.add_range
+        line_offsets = array("I", [0])
+        find = text.find
+        run_start = 0
+        for index, style_id in enumerate(self.style_ids):
+            start = offsets[index]
+            end = offsets[index + 1]
+            if find("\n", start, end) == -1 or (controls and index in controls):
+                continue
+            add_range(self, run_start, index)
+            run_start = index + 1
+            position = start
+            while position < end:
+                new_line = find("\n", position, end)
+                if new_line == -1:
+                    add(text[position:end], style_id)
+                    break
+                if new_line > position:
+                    add(text[position:new_line], style_id)
+                line_offsets.append(len(builder))
+                position = new_line + 1
+        add_range(self, run_start, len(self))
+        if len(builder) > line_offsets[-1]:
+            line_offsets.append(len(builder))
+        return SegmentBufferLines(builder.build(), line_offsets)
+
+    def split_and_crop_lines(
+        self, length: int, style: Optional[Style] = None, pad: bool = True
+    ) -> "SegmentBufferLines":
+        """Split the buffer in to lines, and crop lines greater than a given length.
+
+        Args:
+            length (int): Desired line length.
+            style (Style, optional): Style to use for any padding.
+            pad (bool): Enable padding of lines that are less than `length`.
+
+        Returns:
+            SegmentBufferLines: Lines, without new line characters.
+        """
+        return self.split_lines().adjust_line_length(length, style=style, pad=pad)
+
+    def divide(self, cuts: Iterable[int]) -> List["SegmentBuffer"]:
+        """Divide the buffer in to portions, in the same way as :meth:`Segment.divide`.
+
+        Args:
+            cuts (Iterable[int]): Cell positions where to divide.
+
+        Returns:
+            List[SegmentBuffer]: A buffer for each portion.
+        """
+        style_table = self.style_table
+        portions: List[SegmentBuffer] = []
+        iter_cuts = iter(cuts)
+        while True:
+            cut = next(iter_cuts, -1)
+            if cut == -1:
+                return portions
+            if cut != 0:
+                break
+            portions.append(SegmentBuffer(style_table=style_table))
+
+        text = self.text
+        offsets = self.offsets
+        styles = style_table.styles
+        get_control = self.controls.get
+        builder = _Builder(style_table)
+        pos = 0
+        for index, style_id in enumerate(self.style_ids):
+            segment_text = text[offsets[index] : offsets[index + 1]]
+            control = get_control(index)
+            while segment_text:
+                end_pos = pos if control else pos + cell_len(segment_text)
+                if end_pos < cut:
+                    builder.add(segment_text, style_id, control)
+                    pos = end_pos
+                    break
+
+                if end_pos == cut:
+                    builder.add(segment_text, style_id, control)
+                    portions.append(builder.build())
+                    builder = _Builder(style_table)
+                    pos = end_pos
+                    cut = next(iter_cuts, -1)
+                    if cut == -1:
+                        return portions
+                    break
+
+                before, after = Segment(
+                    segment_text, styles[style_id], control
+                ).split_cells(cut - pos)
+                builder.add(before.text, style_id, control)
+                portions.append(builder.build())
+                builder = _Builder(style_table)
+                segment_text = after.text
+                pos = cut
+
+                cut = next(iter_cuts, -1)
+                if cut == -1:
+                    return portions
+
+        portions.append(builder.build())
+        return portions
+
+    def render(
+        self,
+        color_system: Optional[ColorSystem] = ColorSystem.TRUECOLOR,
+        legacy_windows: bool = False,
+        not_terminal: bool = False,
+    ) -> str:
+        """Render the segments to a string, in the same way as the console renders a list of segments.
+
+        Args:
+            color_system (Optional[ColorSystem], optional): Color system to render to. Defaults to ColorSystem.TRUECOLOR.
+            legacy_windows (bool, optional): Disable hyperlinks for legacy Windows. Defaults to False.
+            not_terminal (bool, optional): Strip unstyled control segments. Defaults to False.
+
+        Returns:
+            str: Rendered output.
+        """
+        if not self.controls and (color_system is None or len(self.style_table) == 1):
+            return self.text
+        text = self.text
+        offsets = self.offsets
+        controls = self.controls
+        # The codes before and after the text of each style, rendered on first use
+        wrappers: List[Optional[Sequence[str]]] = [None] * len(self.style_table)
+        styles = self.style_table.styles
+        output: List[str] = []
+        append = output.append
+        for index, style_id in enumerate(self.style_ids):
+            segment_text = text[offsets[index] : offsets[index + 1]]
+            style = styles[style_id]
+            if style:
+                if not segment_text:
+                    continue
+                wrapper = wrappers[style_id]
+                if wrapper is None:
+                    wrapper = wrappers[style_id] = style.render(
+                        "\0", color_system=color_system, legacy_windows=legacy_windows
+                    ).split("\0")
+                append(wrapper[0])
+                append(segment_text)
+                append(wrapper[1])
+            elif not (not_terminal and index in controls):
+                append(segment_text)
+        return "".join(output)
+
+
+class SegmentBufferLines:
+    """Lines of segments, stored in a single :class:`SegmentBuffer`.
+
+    Args:
+        buffer (SegmentBuffer): The segments of every line (without new line characters).
+        line_offsets (array): Index of the first segment of each line in the buffer, followed by the number of segments.
+    """
+
+    __slots__ = ["buffer", "line_offsets"]
+
+    def __init__(self, buffer: SegmentBuffer, line_offsets: "array[int]") -> None:
+        self.buffer = buffer
+        self.line_offsets = line_offsets
+
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[List[Segment]], style_table: Optional[StyleTable] = None
+    ) -> "SegmentBufferLines":
+        """Create lines from lists of segments.
+
+        Args:
+            lines (Iterable[List[Segment]]): Lines of segments (without new line characters).
+            style_table (StyleTable, optional): Table to add styles to, or ``None`` for a new table.
+
+        Returns:
+            SegmentBufferLines: New lines.
+        """
+        builder = _Builder(StyleTable() if style_table is None else style_table)
+        line_offsets = array("I", [0])
+        for line in lines:
+            builder.extend(line)
+            line_offsets.append(len(builder))
+        return cls(builder.build(), line_offsets)
+
+    def __repr__(self) -> str:
+        return f"<segment buffer lines lines={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def __getitem__(self, index: int) -> SegmentBuffer:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        builder = _Builder(self.buffer.style_table)
+        builder.add_range(
+            self.buffer, self.line_offsets[index], self.line_offsets[index + 1]
+        )
+        return builder.build()
+
+    def __iter__(self) -> Iterator[SegmentBuffer]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        new_line = Segment.line()
+        for line in self.to_lines():
+            yield from line
+            yield new_line
+
+    def to_lines(self) -> List[List[Segment]]:
+        """Convert to lists of segments.
+
+        Returns:
+            List[List[Segment]]: A list of segments for each line.
+        """
+        segments = self.buffer.to_segments()
+        line_offsets = self.line_offsets
+        return [
+            segments[line_offsets[index] : line_offsets[index + 1]]
+            for index in range(len(self))
+        ]
+
+    def get_shape(self) -> Tuple[int, int]:
+        """Get the shape (enclosing rectangle) of the lines.
+
+        Returns:
+            Tuple[int, int]: Width and height in characters.
+        """
+        buffer = self.buffer
+        line_offsets = self.line_offsets
+        width = max(
+            (
+                _cell_length(buffer, line_offsets[index], line_offsets[index + 1])
+                for index in range(len(self))
+            ),
+            default=0,
+        )
+        return (width, len(self))
+
+    def adjust_line_length(
+        self, length: int, style: Optional[Style] = None, pad: bool = True
+    ) -> "SegmentBufferLines":
+        """Adjust every line to a given width (cropping or padding as required),
+        in the same way as :meth:`Segment.adjust_line_length`.
+
+        Args:
+            length (int): The desired width of the lines.
+            style (Style, optional): The style of padding if used (space on the end). Defaults to None.
+            pad (bool, optional): Pad lines with spaces if they are shorter than `length`. Defaults to True.
+
+        Returns:
+            SegmentBufferLines: New lines with the desired length.
+        """
+        buffer = self.buffer
+        text = buffer.text
+        offsets = buffer.offsets
+        style_ids = buffer.style_ids
+        controls = buffer.controls
+        style_table = buffer.style_table
+        builder = _Builder(style_table)
+        add = builder.add
+        add_range = builder.add_range
+        pad_style_id = style_table.add(style)
+        line_offsets = self.line_offsets
+        new_line_offsets = array("I", [0])
+        for line_index in range(len(self)):
+            start = line_offsets[line_index]
+            end = line_offsets[line_index + 1]
+            line_length = _cell_length(buffer, start, end)
+            if line_length <= length:
+                add_range(buffer, start, end)
+                if pad and line_length < length:
+                    add(" " * (length - line_length), pad_style_id)
+            else:
+                line_length = 0
+                for index in range(start, end):
+                    segment_text = text[offsets[index] : offsets[index + 1]]
+                    control = controls.get(index) if controls else None
+                    segment_length = 0 if control else cell_len(segment_text)
+                    if line_length + segment_length < length or control:
+                        add(segment_text, style_ids[index], control)
+                        line_length += segment_length
+                    else:
+                        add(
+                            set_cell_size(segment_text, length - line_length),
+                            style_ids[index],
+                        )
+                        break
+            new_line_offsets.append(len(builder))
+        return SegmentBufferLines(builder.build(), new_line_offsets)
+
+    def render(
+        self,
+        color_system: Optional[ColorSystem] = ColorSystem.TRUECOLOR,
+        legacy_windows: bool = False,
+        not_terminal: bool = False,
+    ) -> str:
+        """Render the lines to a string, with a new line after each line.
+
+        Args:
+            color_system (Optional[ColorSystem], optional): Color system to render to. Defaults to ColorSystem.TRUECOLOR.
+            legacy_windows (bool, optional): Disable hyperlinks for legacy Windows. Defaults to False.
+            not_terminal (bool, optional): Strip unstyled control segments. Defaults to False.
+
+        Returns:
+            str: Rendered output.
+        """
+        builder = _Builder(self.buffer.style_table)
+        line_offsets = self.line_offsets
+        for index in range(len(self)):
+            builder.add_range(self.buffer, line_offsets[index], line_offsets[index + 1])
+            builder.add("\n", 0)
+        return builder.build().render(color_system, legacy_windows, not_terminal)
+
+
+def _cell_length(buffer: SegmentBuffer, start: int, end: int) -> int:
+    """Get the cell length of a range of segments in a buffer, excluding control segments."""
+    offsets = buffer.offsets
+    controls = buffer.controls
+    if not controls or not any(start <= index < end for index in controls):
+        return cell_len(buffer.text[offsets[start] : offsets[end]])
+    text = buffer.text
+    return sum(
+        cell_len(text[offsets[index] : offsets[index + 1]])
+        for index in range(start, end)
+        if index not in controls
+    )
+
+
+class _Builder:
+    """Accumulates the contents of a new SegmentBuffer."""
+
+    __slots__ = ["style_table", "pieces", "offsets", "style_ids", "controls", "length"]
+
+    def __init__(self, style_table: StyleTable) -> None:
+        self.style_table = style_table
+        self.pieces: List[str] = []
+        self.offsets = array("I", [0])
+        self.style_ids = array("I")
+        self.controls: Dict[int, Sequence[ControlCode]] = {}
+        self.length = 0
+
+    def __len__(self) -> int:
+        return len(self.style_ids)
+
+    def add(
+        self,
+        text: str,
+        style_id: int,
+        control: Optional[Sequence[ControlCode]] = None,
+    ) -> None:
+        """Add a single segment."""
+        if control is not None:
+            self.controls[len(self.style_ids)] = control
+        self.pieces.append(text)
+        self.length += len(text)
+        self.offsets.append(self.length)
+        self.style_ids.append(style_id)
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        """Add segments, adding their styles to the style table."""
+        add_style = self.style_table.add
+        pieces_append = self.pieces.append
+        offsets_append = self.offsets.append
+        style_ids = self.style_ids
+        style_ids_append = style_ids.append
+        controls = self.controls
+        length = self.length
+        for text, style, control in segments:
+            if control is not None:
+                controls[len(style_ids)] = control
+            pieces_append(text)
+            length += len(text)
+            offsets_append(length)
+            style_ids_append(add_style(style))
+        self.length = length
+
+    def add_range(self, buffer: SegmentBuffer, start: int, end: int) -> None:
+        """Add a range of segments from another buffer (which must share the style table)."""
+        if start >= end:
+            return
+        offsets = buffer.offsets
+        text_start = offsets[start]
+        if buffer.controls:
+            count = len(self.style_ids)
+            for index, control in buffer.controls.items():
+                if start <= index < end:
+                    self.controls[count + index - start] = control
+        self.pieces.append(buffer.text[text_start : offsets[end]])
+        shift = self.length - text_start
+        self.offsets.extend([offset + shift for offset in offsets[start + 1 : end + 1]])
+        self.style_ids.extend(buffer.style_ids[start:end])
+        self.length = self.offsets[-1]
+
+    def build(self) -> SegmentBuffer:
+        """Create a buffer from the segments added."""
+        return SegmentBuffer(
+            "".join(self.pieces),
+            self.offsets,
+            self.style_ids,
+            self.style_table,
+            self.controls,
+        )
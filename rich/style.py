@@ -1,11 +1,10 @@
 import sys
-from functools import lru_cache
+from itertools import count
 from operator import attrgetter
-from pickle import dumps, loads
 from random import randint
-from typing import Any, Dict, Iterable, List, Optional, Type, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
 
-from . import errors
+from . import caches, errors
 from .color import Color, ColorParseError, ColorSystem, blend_rgb
 from .repr import Result, rich_repr
 from .terminal_theme import DEFAULT_TERMINAL_THEME, TerminalTheme
@@ -67,6 +66,7 @@ class Style:
     _hash: Optional[int]
     _null: bool
     _meta: Optional[bytes]
+    _id: int
 
     __slots__ = [
         "_color",
@@ -80,6 +80,7 @@ class Style:
         "_hash",
         "_null",
         "_meta",
+        "_id",
     ]
 
     # maps bits on to SGR parameter
@@ -145,7 +146,7 @@ class Style:
         link: Optional[str] = None,
         meta: Optional[Dict[str, Any]] = None,
     ):
-        self._ansi: Optional[str] = None
+        self._ansi: Optional[Tuple[ColorSystem, str]] = None
         self._style_definition: Optional[str] = None
 
         def _make_color(color: Union[Color, str]) -> Color:
@@ -193,12 +194,18 @@ class Style:
         )
 
         self._link = link
-        self._meta = None if meta is None else dumps(meta)
+        if meta is None:
+            self._meta = None
+        else:
+            from pickle import dumps
+
+            self._meta = dumps(meta)
         self._link_id = (
             f"{randint(0, 999999)}{hash(self._meta)}" if (link or meta) else ""
         )
         self._hash: Optional[int] = None
         self._null = not (self._set_attributes or color or bgcolor or link or meta)
+        self._id = 0
 
     @classmethod
     def null(cls) -> "Style":
@@ -227,6 +234,7 @@ class Style:
         style._meta = None
         style._null = not (color or bgcolor)
         style._hash = None
+        style._id = 0
         return style
 
     @classmethod
@@ -236,6 +244,8 @@ class Style:
         Returns:
             meta (Optional[Dict[str, Any]]): A dictionary of meta data. Defaults to None.
         """
+        from pickle import dumps
+
         style: Style = cls.__new__(Style)
         style._ansi = None
         style._style_definition = None
@@ -248,6 +258,7 @@ class Style:
         style._link_id = f"{randint(0, 999999)}{hash(style._meta)}"
         style._hash = None
         style._null = not (meta)
+        style._id = 0
         return style
 
     @classmethod
@@ -346,8 +357,13 @@ class Style:
         Returns:
             str: String containing codes.
         """
-
-        if self._ansi is None:
+        ansi = self._ansi
+        if ansi is not None and ansi[0] is color_system:
+            return ansi[1]
+        interner = _style_interner
+        key = (self._id or interner.get_id(self), color_system)
+        codes = interner.ansi_codes.get(key)
+        if codes is None:
             sgr: List[str] = []
             append = sgr.append
             _style_map = self._style_map
@@ -377,11 +393,13 @@ class Style:
                         foreground=False
                     )
                 )
-            self._ansi = ";".join(sgr)
-        return self._ansi
+            codes = ";".join(sgr)
+            interner.store(interner.ansi_codes, key, codes)
+        self._ansi = (color_system, codes)
+        return codes
 
     @classmethod
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("style.normalize")
     def normalize(cls, style: str) -> str:
         """Normalize a style definition so that styles with the same effect have the same string
         representation.
@@ -440,6 +458,22 @@ class Style:
         self._hash = hash(_hash_getter(self))
         return self._hash
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name) for name in self.__slots__}
+        # IDs are only meaningful within the process that assigned them
+        state["_id"] = 0
+        return state
+
+    def __setstate__(
+        self, state: Union[Dict[str, Any], Tuple[None, Dict[str, Any]]]
+    ) -> None:
+        if isinstance(state, tuple):
+            # Styles pickled by earlier versions have the default state of a class with slots
+            _, state = state
+        self._id = 0
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def color(self) -> Optional[Color]:
         """The foreground color or None if it is not set."""
@@ -468,7 +502,11 @@ class Style:
     @property
     def meta(self) -> Dict[str, Any]:
         """Get meta information (can not be changed after construction)."""
-        return {} if self._meta is None else cast(Dict[str, Any], loads(self._meta))
+        if self._meta is None:
+            return {}
+        from pickle import loads
+
+        return cast(Dict[str, Any], loads(self._meta))
 
     @property
     def without_color(self) -> "Style":
@@ -487,10 +525,11 @@ class Style:
         style._null = False
         style._meta = None
         style._hash = None
+        style._id = 0
         return style
 
     @classmethod
-    @lru_cache(maxsize=4096)
+    @caches.lru_cache("style.parse")
     def parse(cls, style_definition: str) -> "Style":
         """Parse a style definition.
 
@@ -556,7 +595,7 @@ class Style:
         style = Style(color=color, bgcolor=bgcolor, link=link, **attributes)
         return style
 
-    @lru_cache(maxsize=1024)
+    @caches.lru_cache("style.get_html_style")
     def get_html_style(self, theme: Optional[TerminalTheme] = None) -> str:
         """Get a CSS style rule."""
         theme = theme or DEFAULT_TERMINAL_THEME
@@ -639,9 +678,10 @@ class Style:
         style._hash = self._hash
         style._null = False
         style._meta = self._meta
+        style._id = self._id
         return style
 
-    @lru_cache(maxsize=128)
+    @caches.lru_cache("style.clear_meta_and_links")
     def clear_meta_and_links(self) -> "Style":
         """Get a copy of this style with link and meta information removed.
 
@@ -662,6 +702,7 @@ class Style:
         style._hash = None
         style._null = False
         style._meta = None
+        style._id = 0
         return style
 
     def update_link(self, link: Optional[str] = None) -> "Style":
@@ -685,6 +726,7 @@ class Style:
         style._hash = None
         style._null = False
         style._meta = self._meta
+        style._id = 0
         return style
 
     def render(
@@ -705,7 +747,12 @@ class Style:
         """
         if not text or color_system is None:
             return text
-        attrs = self._ansi or self._make_ansi_codes(color_system)
+        ansi = self._ansi
+        attrs = (
+            ansi[1]
+            if ansi is not None and ansi[0] is color_system
+            else self._make_ansi_codes(color_system)
+        )
         rendered = f"\x1b[{attrs}m{text}\x1b[0m" if attrs else text
         if self._link and not legacy_windows:
             rendered = (
@@ -725,12 +772,21 @@ class Style:
         text = text or str(self)
         sys.stdout.write(f"{self.render(text)}\n")
 
-    @lru_cache(maxsize=1024)
     def _add(self, style: Optional["Style"]) -> "Style":
         if style is None or style._null:
             return self
         if self._null:
             return style
+        interner = _style_interner
+        key = (self._id or interner.get_id(self), style._id or interner.get_id(style))
+        combined_style = interner.combined.get(key)
+        if combined_style is None:
+            combined_style = self._combine(style)
+            interner.store(interner.combined, key, combined_style)
+        return combined_style
+
+    def _combine(self, style: "Style") -> "Style":
+        """Combine with another (non-null) style, without using the interner."""
         new_style: Style = self.__new__(Style)
         new_style._ansi = None
         new_style._style_definition = None
@@ -744,16 +800,92 @@ class Style:
         new_style._link_id = style._link_id or self._link_id
         new_style._null = style._null
         if self._meta and style._meta:
+            from pickle import dumps
+
             new_style._meta = dumps({**self.meta, **style.meta})
         else:
             new_style._meta = self._meta or style._meta
         new_style._hash = None
+        new_style._id = 0
         return new_style
 
     def __add__(self, style: Optional["Style"]) -> "Style":
-        combined_style = self._add(style)
-        return combined_style.copy() if combined_style.link else combined_style
+        if style is None or style._null:
+            combined_style = self
+        elif self._null:
+            combined_style = style
+        else:
+            # Inlined look up of combined styles, as this is a hot path
+            interner = _style_interner
+            combined_style = interner.combined.get(
+                (
+                    self._id or interner.get_id(self),
+                    style._id or interner.get_id(style),
+                )
+            ) or self._add(style)
+        return combined_style.copy() if combined_style._link else combined_style
+
 
+class _StyleInterner:
+    """Gives each distinct style a small integer ID, so that operations on styles may be
+    memoized in tables keyed by ID, rather than by hashing styles.
+
+    IDs are never re-used, so an ID stored on a style remains valid when the tables are cleared.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries in each table, before it is cleared.
+    """
+
+    __slots__ = ["maxsize", "ids", "combined", "ansi_codes", "_new_id"]
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.ids: Dict[Style, int] = {}
+        self.combined: Dict[Tuple[int, int], Style] = {}
+        self.ansi_codes: Dict[Tuple[int, ColorSystem], str] = {}
+        self._new_id = count(1).__next__
+
+    def get_id(self, style: Style) -> int:
+        """Get the ID of a style, and store it on the style.
+
+        Args:
+            style (Style): A style.
+
+        Returns:
+            int: ID shared by all equal styles.
+        """
+        style_id = self.ids.get(style)
+        if style_id is None:
+            style_id = self._new_id()
+            self.store(self.ids, style, style_id)
+        style._id = style_id
+        return style_id
+
+    def store(self, table: Dict[Any, Any], key: Any, value: Any) -> None:
+        """Store a value in one of the tables, clearing the table if it is full."""
+        if len(table) >= self.maxsize:
+            table.clear()
+        table[key] = value
+
+    def resize(self, maxsize: int) -> None:
+        """Set the maximum size of the tables, and clear them."""
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self) -> None:
+        """Clear all tables."""
+        self.ids.clear()
+        self.combined.clear()
+        self.ansi_codes.clear()
+
+
+_style_interner = _StyleInterner()
+_style_interner.maxsize = caches.register(
+    "style.interner",
+    lambda: (None, None, len(_style_interner.ids)),
+    _style_interner.resize,
+    _style_interner.clear,
+)
 
 NULL_STYLE = Style()
 
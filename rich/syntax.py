@@ -41,6 +41,7 @@ from pygments.util import ClassNotFound
 from rich.containers import Lines
 from rich.padding import Padding, PaddingDimensions
 
+from ._lexed_code import get_lexed_code
 from ._loop import loop_first
 from .cells import cell_len
 from .color import Color, blend_rgb
@@ -478,6 +479,25 @@ class Syntax(JupyterMixin):
         Returns:
             Text: A text instance containing highlighted syntax.
         """
+        text, _line_offset = self._highlight(code, line_range)
+        return text
+
+    def _highlight(
+        self,
+        code: str,
+        line_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        crop: bool = False,
+    ) -> Tuple[Text, int]:
+        """Highlight code, optionally cropping lines before the line range.
+
+        Args:
+            code (str): Code to highlight.
+            line_range(Tuple[int, int], optional): Optional line range to highlight.
+            crop (bool, optional): Remove lines before the start of the line range. Defaults to False.
+
+        Returns:
+            Tuple[Text, int]: A text instance containing highlighted syntax, and the number of lines removed.
+        """
 
         base_style = self._get_base_style()
         justify: JustifyMethod = (
@@ -493,45 +513,68 @@ class Syntax(JupyterMixin):
         _get_theme_style = self._theme.get_style_for_token
 
         lexer = self.lexer or self.default_lexer
+        line_offset = 0
 
         if lexer is None:
             text.append(code)
         else:
+            lexed_code = get_lexed_code(lexer, code)
             if line_range:
                 # More complicated path to only stylize a portion of the code
                 # This speeds up further operations as there are less spans to process
                 line_start, line_end = line_range
+                _line_start = line_start - 1 if line_start else 0
+                crop_lines = (
+                    max(0, _line_start)
+                    if crop and (line_end is None or line_end >= 0)
+                    else 0
+                )
+
+                line_no = 0
+                if lexed_code is None:
+                    tokens: Iterable[Tuple[Any, str]] = lexer.get_tokens(code)
+                else:
+                    # Lex from the last checkpoint before the line range
+                    checkpoint, tokens = lexed_code.get_tokens(
+                        max(0, _line_start),
+                        line_end if line_end and line_end > 0 else None,
+                    )
+                    line_no = checkpoint.line
+                    if not crop_lines:
+                        text.append(lexed_code.text[: checkpoint.position])
 
                 def line_tokenize() -> Iterable[Tuple[Any, str]]:
                     """Split tokens to one per line."""
-                    assert lexer  # required to make MyPy happy - we know lexer is not None at this point
-
-                    for token_type, token in lexer.get_tokens(code):
+                    for token_type, token in tokens:
                         while token:
                             line_token, new_line, token = token.partition("\n")
                             yield token_type, line_token + new_line
 
                 def tokens_to_spans() -> Iterable[Tuple[str, Optional[Style]]]:
                     """Convert tokens to spans."""
+                    nonlocal line_offset
                     tokens = iter(line_tokenize())
-                    line_no = 0
-                    _line_start = line_start - 1 if line_start else 0
+                    _line_no = line_no
 
                     # Skip over tokens until line start
-                    while line_no < _line_start:
+                    while _line_no < _line_start:
                         try:
                             _token_type, token = next(tokens)
                         except StopIteration:
                             break
-                        yield (token, None)
+                        if _line_no >= crop_lines:
+                            yield (token, None)
                         if token.endswith("\n"):
-                            line_no += 1
+                            _line_no += 1
+                    if crop_lines:
+                        # The lines which were skipped (the code may have fewer lines)
+                        line_offset = _line_no
                     # Generate spans until line end
                     for token_type, token in tokens:
                         yield (token, _get_theme_style(token_type))
                         if token.endswith("\n"):
-                            line_no += 1
-                            if line_end and line_no >= line_end:
+                            _line_no += 1
+                            if line_end and _line_no >= line_end:
                                 break
 
                 text.append_tokens(tokens_to_spans())
@@ -539,15 +582,19 @@ class Syntax(JupyterMixin):
             else:
                 text.append_tokens(
                     (token, _get_theme_style(token_type))
-                    for token_type, token in lexer.get_tokens(code)
+                    for token_type, token in (
+                        lexer.get_tokens(code)
+                        if lexed_code is None
+                        else lexed_code.get_tokens()[1]
+                    )
                 )
             if self.background_color is not None:
                 text.stylize(f"on {self.background_color}")
 
         if self._stylized_ranges:
-            self._apply_stylized_ranges(text)
+            self._apply_stylized_ranges(text, line_offset)
 
-        return text
+        return text, line_offset
 
     def stylize_range(
         self,
@@ -670,7 +717,7 @@ class Syntax(JupyterMixin):
         code_width = max(0, code_width)
 
         ends_on_nl, processed_code = self._process_code(self.code)
-        text = self.highlight(processed_code, self.line_range)
+        text, line_offset = self._highlight(processed_code, self.line_range, crop=True)
 
         if not self.line_numbers and not self.word_wrap and not self.line_range:
             if not ends_on_nl:
@@ -702,14 +749,25 @@ class Syntax(JupyterMixin):
             return
 
         start_line, end_line = self.line_range or (None, None)
-        line_offset = 0
+        # Lines before the line range may have been cropped by _highlight
+        cropped_lines = line_offset
         if start_line:
             line_offset = max(0, start_line - 1)
         lines: Union[List[Text], Lines] = text.split("\n", allow_blank=ends_on_nl)
+        if cropped_lines and not text.plain and not ends_on_nl:
+            lines = []
         if self.line_range:
-            if line_offset > len(lines):
+            if line_offset > cropped_lines + len(lines):
                 return
-            lines = lines[line_offset:end_line]
+            if cropped_lines:
+                lines = lines[
+                    line_offset
+                    - cropped_lines : (
+                        None if end_line is None else max(0, end_line - cropped_lines)
+                    )
+                ]
+            else:
+                lines = lines[line_offset:end_line]
 
         if self.indent_guides and not options.ascii_only:
             style = (
@@ -784,13 +842,14 @@ class Syntax(JupyterMixin):
                     yield from wrapped_line
                     yield new_line
 
-    def _apply_stylized_ranges(self, text: Text) -> None:
+    def _apply_stylized_ranges(self, text: Text, line_offset: int = 0) -> None:
         """
         Apply stylized ranges to a text instance,
         using the given code to determine the right portion to apply the style to.
 
         Args:
             text (Text): Text instance to apply the style to.
+            line_offset (int, optional): Number of lines removed from the start of the code. Defaults to 0.
         """
         code = text.plain
         newlines_offsets = [
@@ -805,12 +864,26 @@ class Syntax(JupyterMixin):
         ]
 
         for stylized_range in self._stylized_ranges:
+            start_position = stylized_range.start
+            end_position = stylized_range.end
+            if line_offset:
+                # Make positions relative to the first line in the text
+                end_line, end_column = end_position
+                if end_line >= 1:
+                    if end_line <= line_offset:
+                        continue
+                    end_position = (end_line - line_offset, end_column)
+                start_line, start_column = start_position
+                if start_line >= 1:
+                    start_position = (
+                        (start_line - line_offset, start_column)
+                        if start_line > line_offset
+                        else (1, 0)
+                    )
             start = _get_code_index_for_syntax_position(
-                newlines_offsets, stylized_range.start
-            )
-            end = _get_code_index_for_syntax_position(
-                newlines_offsets, stylized_range.end
+                newlines_offsets, start_position
             )
+            end = _get_code_index_for_syntax_position(newlines_offsets, end_position)
             if start is not None and end is not None:
                 if stylized_range.style_before:
                     text.stylize_before(stylized_range.style, start, end)
@@ -1,7 +1,12 @@
+from copy import copy
 from dataclasses import dataclass, field, replace
+from itertools import chain, islice
+from math import ceil
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
+    Hashable,
     Iterable,
     List,
     NamedTuple,
@@ -139,6 +144,35 @@ class Row:
     """Indicated end of section, which will force a line beneath the row."""
 
 
+# Number of cached measurements per cell, before the cache is cleared
+_MEASUREMENTS_PER_CELL = 4
+
+
+def _get_measurement_key(
+    renderable: "RenderableType", max_width: int
+) -> Optional[Hashable]:
+    """Get a key for a cell's measurement, if it may be cached.
+
+    Strings and Text are measured by their content, so editing a cell (or replacing it) changes the key.
+
+    Args:
+        renderable (RenderableType): A cell renderable, optionally with padding.
+        max_width (int): Maximum width of the cell.
+
+    Returns:
+        Optional[Hashable]: A key, or ``None`` if the measurement may not be cached.
+    """
+    padding_width = 0
+    if type(renderable) is Padding:
+        padding_width = renderable.left + renderable.right
+        renderable = renderable.renderable
+    if type(renderable) is str:
+        return (renderable, padding_width, max_width)
+    if type(renderable) is Text:
+        return (Text, renderable.plain, padding_width, max_width)
+    return None
+
+
 class _Cell(NamedTuple):
     """A single cell in a table."""
 
@@ -241,6 +275,10 @@ class Table(JupyterMixin):
         self.caption_justify: "JustifyMethod" = caption_justify
         self.highlight = highlight
         self.row_styles: Sequence[StyleType] = list(row_styles or [])
+        self._measurements: Dict[Hashable, Measurement] = {}
+        self._measurements_context: Optional[Tuple[Any, ...]] = None
+        # (first row, last row) flags used to pad the cells of each row (including the header and footer)
+        self._cell_edges: Optional[List[Tuple[bool, bool]]] = None
         append_column = self.columns.append
         for header in headers:
             if isinstance(header, str):
@@ -683,7 +721,18 @@ class Table(JupyterMixin):
 
         if any_padding:
             _Padding = Padding
-            for first, last, (style, renderable) in loop_first_last(raw_cells):
+            cell_edges = self._cell_edges
+            padded_cells: Iterable[
+                Tuple[bool, bool, Tuple[StyleType, "RenderableType"]]
+            ] = (
+                loop_first_last(raw_cells)
+                if cell_edges is None
+                else (
+                    (first, last, raw_cell)
+                    for (first, last), raw_cell in zip(cell_edges, raw_cells)
+                )
+            )
+            for first, last, (style, renderable) in padded_cells:
                 yield _Cell(
                     style,
                     _Padding(renderable, get_padding(first, last)),
@@ -713,6 +762,34 @@ class Table(JupyterMixin):
 
         return pad_left + pad_right
 
+    def _get_measurements(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Dict[Hashable, Measurement]:
+        """Get the cache of cell measurements, which is cleared if it may be out of date or too large."""
+        # These change the text that markup strings are converted to
+        context = (
+            options.markup,
+            console._markup,
+            console._emoji,
+            console._emoji_variant,
+        )
+        measurements = self._measurements
+        if context != self._measurements_context or len(measurements) > (
+            _MEASUREMENTS_PER_CELL * (len(self.rows) + 2) * len(self.columns)
+        ):
+            measurements.clear()
+            self._measurements_context = context
+        return measurements
+
+    def _adopt_measurements(self, table: "Table") -> None:
+        """Adopt the cell measurement cache of a copy of this table, after it was measured.
+
+        Args:
+            table (Table): A copy of this table, made with ``_copy_table``.
+        """
+        self._measurements = table._measurements
+        self._measurements_context = table._measurements_context
+
     def _measure_column(
         self,
         console: "Console",
@@ -737,8 +814,19 @@ class Table(JupyterMixin):
         append_min = min_widths.append
         append_max = max_widths.append
         get_render_width = Measurement.get
+        measurements = self._get_measurements(console, options)
         for cell in self._get_cells(console, column._index, column):
-            _min, _max = get_render_width(console, options, cell.renderable)
+            renderable = cell.renderable
+            key = _get_measurement_key(renderable, max_width)
+            if key is None:
+                _min, _max = get_render_width(console, options, renderable)
+            else:
+                measurement = measurements.get(key)
+                if measurement is None:
+                    measurement = measurements[key] = get_render_width(
+                        console, options, renderable
+                    )
+                _min, _max = measurement
             append_min(_min)
             append_max(_max)
 
@@ -935,6 +1023,363 @@ class Table(JupyterMixin):
             yield new_line
 
 
+def _copy_table(
+    table: Table,
+    cells: List[List["RenderableType"]],
+    rows: List[Row],
+    *,
+    first_row: int = 0,
+    widths: Optional[List[int]] = None,
+) -> Table:
+    """Copy a table with different rows.
+
+    Args:
+        table (Table): Table to copy.
+        cells (List[List[RenderableType]]): Cells for each column.
+        rows (List[Row]): Rows for the cells.
+        first_row (int, optional): Index of the first row in the original table, for alternating row styles.
+        widths (List[int], optional): Widths of columns (including padding) to fix, or ``None`` to measure.
+
+    Returns:
+        Table: A new table.
+    """
+    table_copy = copy(table)
+    table_copy.columns = [column.copy() for column in table.columns]
+    for column, column_cells in zip(table_copy.columns, cells):
+        column._cells = column_cells
+    table_copy.rows = rows
+    row_styles = table.row_styles
+    if first_row and row_styles:
+        # Keep the alternating row styles in step with the original table
+        first = first_row % len(row_styles)
+        table_copy.row_styles = [*row_styles[first:], *row_styles[:first]]
+    if widths is not None:
+        get_padding_width = table_copy._get_padding_width
+        for column, width in zip(table_copy.columns, widths):
+            column.width = max(0, width - get_padding_width(column._index))
+            column.min_width = column.max_width = column.ratio = None
+    return table_copy
+
+
+class TableView(JupyterMixin):
+    """A window on to the rows of a :class:`Table`, which renders only the rows that fit in the given height.
+
+    Column widths are calculated from a sample of evenly spaced rows rather than every row, so the cost of
+    rendering doesn't grow with the number of rows in the table. Cells outside of the sample which are wider
+    than their column will wrap (or overflow) as usual.
+
+    Args:
+        table (Table): The table to view.
+        offset (int, optional): Index of the first row to show. Defaults to 0.
+        height (int, optional): Maximum height in lines (including borders, headers, title, and caption), or ``None``
+            to use the height of the console options. If there is no height, every row from ``offset`` is shown.
+            Defaults to None.
+        sample_size (int, optional): Maximum number of rows to measure when calculating column widths.
+            Defaults to 1000.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        *,
+        offset: int = 0,
+        height: Optional[int] = None,
+        sample_size: int = 1000,
+    ) -> None:
+        self.table = table
+        self.offset = offset
+        self.height = height
+        self.sample_size = sample_size
+
+    def _get_window(
+        self, rows: Sequence[int], widths: Optional[List[int]] = None
+    ) -> Table:
+        """Get a copy of the table with only the given rows.
+
+        Args:
+            rows (Sequence[int]): Indices of rows to include.
+            widths (List[int], optional): Widths of columns (including padding) to fix, or ``None`` to measure.
+
+        Returns:
+            Table: A new table which shares cells with the original.
+        """
+        table = self.table
+        table_rows = table.rows
+        return _copy_table(
+            table,
+            [[column._cells[index] for index in rows] for column in table.columns],
+            [table_rows[index] for index in rows],
+            first_row=rows[0] if rows else 0,
+            widths=widths,
+        )
+
+    def _get_sample(self) -> Table:
+        """Get a copy of the table with evenly spaced rows, to calculate column widths."""
+        row_count = len(self.table.rows)
+        step = max(1, ceil(row_count / max(1, self.sample_size)))
+        return self._get_window(range(0, row_count, step))
+
+    def __rich_measure__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Measurement:
+        sample = self._get_sample()
+        measurement = sample.__rich_measure__(console, options)
+        self.table._adopt_measurements(sample)
+        return measurement
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        table = self.table
+        if not table.columns:
+            yield Segment("\n")
+            return
+
+        sample = self._get_sample()
+        max_width = options.max_width if table.width is None else table.width
+        widths = sample._calculate_column_widths(
+            console, options.update_width(max_width - sample._extra_width)
+        )
+        table._adopt_measurements(sample)
+
+        row_count = len(table.rows)
+        offset = max(0, min(self.offset, row_count))
+        height = self.height if self.height is not None else options.height
+        render_options = options.update(height=None)
+
+        def render_rows(row_count: int) -> List[List[Segment]]:
+            window = self._get_window(range(offset, offset + row_count), widths)
+            return console.render_lines(window, render_options, pad=False)
+
+        if height is None:
+            lines = render_rows(row_count - offset)
+        else:
+            # Borders, headers, title, and caption
+            chrome_height = len(render_rows(0))
+            # Every row is at least one line high, so this many rows will fill the height
+            max_rows = min(row_count - offset, max(0, height - chrome_height))
+            show_rows = max_rows
+            lines = render_rows(show_rows)
+            while len(lines) > height and show_rows:
+                excess = len(lines) - height
+                average_height = max(1, len(lines) - chrome_height) / show_rows
+                show_rows = max(0, show_rows - max(1, ceil(excess / average_height)))
+                lines = render_rows(show_rows)
+                # Rows may differ in height, so there may be room for more
+                while len(lines) < height and show_rows < max_rows:
+                    more_lines = render_rows(show_rows + 1)
+                    if len(more_lines) > height:
+                        break
+                    show_rows += 1
+                    lines = more_lines
+            del lines[height:]
+
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class TableStream(JupyterMixin):
+    """Renders a table from an iterable of rows, one row at a time, so that rows needn't be kept in memory.
+
+    Column widths are calculated from the first ``sample_size`` rows (unless every column has a fixed width),
+    and the rows are rendered as they are produced. Later rows which are wider than their column will wrap
+    (or overflow) as usual. See :meth:`~rich.console.Console.print_table_stream` to write each row as
+    soon as it is rendered.
+
+    Args:
+        table (Table): A table with the columns and style to render. Any rows in the table are ignored.
+        rows (Iterable[Sequence[Optional[RenderableType]]]): An iterable of rows, where each row is a sequence
+            of cells (renderables, or ``None`` for a blank cell).
+        sample_size (int, optional): Number of rows to measure before rendering. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        rows: Iterable[Sequence[Optional["RenderableType"]]],
+        *,
+        sample_size: int = 100,
+    ) -> None:
+        self.table = table
+        self.rows = rows
+        self.sample_size = sample_size
+
+    def _get_cells(
+        self, renderables: Sequence[Optional["RenderableType"]]
+    ) -> List["RenderableType"]:
+        """Check a row, and replace ``None`` with an empty cell."""
+        column_count = len(self.table.columns)
+        if len(renderables) > column_count:
+            raise ValueError(
+                f"row has {len(renderables)} cells, but the table has {column_count} columns"
+            )
+        cells: List["RenderableType"] = []
+        for renderable in renderables:
+            if renderable is None:
+                cells.append("")
+            elif is_renderable(renderable):
+                cells.append(renderable)
+            else:
+                raise errors.NotRenderableError(
+                    f"unable to render {type(renderable).__name__}; a string or other renderable object is required"
+                )
+        cells.extend([""] * (column_count - len(cells)))
+        return cells
+
+    def render_chunks(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Iterable[List[Segment]]:
+        """Render the table in chunks: the title and header, each row, then the footer and caption.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            Iterable[List[Segment]]: Segments for each chunk.
+        """
+        table = self.table
+        if not table.columns:
+            yield [Segment("\n")]
+            return
+        get_cells = self._get_cells
+        iter_rows = iter(self.rows)
+        fixed_widths = all(column.width is not None for column in table.columns)
+        sample = [
+            get_cells(row)
+            for row in islice(iter_rows, 1 if fixed_widths else self.sample_size)
+        ]
+
+        def copy_table(
+            table: Table,
+            rows: List[List["RenderableType"]],
+            first_row: int = 0,
+            widths: Optional[List[int]] = None,
+            cell_edges: Optional[List[Tuple[bool, bool]]] = None,
+        ) -> Table:
+            cells = [list(column_cells) for column_cells in zip(*rows)]
+            table_copy = _copy_table(
+                table,
+                cells or [[] for _ in table.columns],
+                [Row() for _ in rows],
+                first_row=first_row,
+                widths=widths,
+            )
+            table_copy._cell_edges = cell_edges
+            return table_copy
+
+        sample_table = copy_table(table, sample)
+        max_width = options.max_width if table.width is None else table.width
+        widths = sample_table._calculate_column_widths(
+            console, options.update_width(max_width - sample_table._extra_width)
+        )
+        render_options = options.update(height=None)
+        new_line = Segment.line()
+
+        def render(
+            table: Table, start: int = 0, end: Optional[int] = None
+        ) -> List[Segment]:
+            lines = console.render_lines(table, render_options, pad=False)
+            segments: List[Segment] = []
+            for line in lines[start:end]:
+                segments.extend(line)
+                segments.append(new_line)
+            return segments
+
+        if not sample:
+            yield render(copy_table(table, [], widths=widths))
+            return
+
+        # Rows are rendered between a blank header (and row), which are then removed
+        bottom_height = 1 if table.box and table.show_edge else 0
+        body_table = copy(table)
+        body_table.columns = [column.copy() for column in table.columns]
+        body_table.title = body_table.caption = None
+        body_table.show_header = True
+        body_table.show_footer = False
+        if table.box and not table.show_header:
+            body_table.box = table.box.get_plain_headed_box()
+        for column in body_table.columns:
+            column.header = ""
+        tail_table = copy(body_table)
+        tail_table.show_footer = table.show_footer
+        tail_table.caption = table.caption
+        blank_row: List[List["RenderableType"]] = [[""] * len(table.columns)]
+        # Padding depends on whether a cell is in the first or last row of the full table, so each
+        # cell is padded with the flags it would have there. The blank header and row are never
+        # first or last, so they are the same height in every chunk.
+        blank_edges = (False, False)
+        # Number of lines before and after a row rendered in the body table
+        before_height = (
+            len(
+                console.render_lines(
+                    copy_table(body_table, [], widths=widths, cell_edges=[blank_edges]),
+                    render_options,
+                )
+            )
+            - bottom_height
+        )
+        after_height = (
+            len(
+                console.render_lines(
+                    copy_table(
+                        body_table,
+                        blank_row,
+                        widths=widths,
+                        cell_edges=[blank_edges, blank_edges],
+                    ),
+                    render_options,
+                )
+            )
+            - before_height
+        )
+
+        head_table = copy(table)
+        head_table.caption = None
+        head_table.show_footer = False
+        yield render(
+            copy_table(head_table, [], widths=widths, cell_edges=[(True, False)]),
+            end=-bottom_height or None,
+        )
+
+        row_index = 0
+        previous_cells = sample[0]
+        for cells in chain(sample[1:], map(get_cells, iter_rows)):
+            row_edges = (row_index == 0 and not table.show_header, False)
+            yield render(
+                copy_table(
+                    body_table,
+                    [previous_cells, *blank_row],
+                    row_index,
+                    widths,
+                    [blank_edges, row_edges, blank_edges],
+                ),
+                before_height,
+                -after_height,
+            )
+            row_index += 1
+            previous_cells = cells
+        row_edges = (row_index == 0 and not table.show_header, not table.show_footer)
+        yield render(
+            copy_table(
+                tail_table,
+                [previous_cells],
+                row_index,
+                widths,
+                [blank_edges, row_edges, (False, True)],
+            ),
+            before_height,
+        )
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> "RenderResult":
+        for chunk in self.render_chunks(console, options):
+            yield from chunk
+
+
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
     from rich.highlighter import ReprHighlighter
@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_left, bisect_right
 from functools import partial, reduce
 from math import gcd
 from operator import itemgetter
@@ -18,6 +19,7 @@ from typing import (
 
 from ._loop import loop_last
 from ._pick import pick_bool
+from ._span_index import SpanIndex
 from ._wrap import divide_line
 from .align import AlignMethod
 from .cells import cell_len, set_cell_size
@@ -34,6 +36,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 DEFAULT_JUSTIFY: "JustifyMethod" = "default"
 DEFAULT_OVERFLOW: "OverflowMethod" = "fold"
+# Number of spans at which Text will use an index to find the spans at an offset
+SPAN_INDEX_THRESHOLD = 16
 
 
 _re_whitespace = re.compile(r"\s+$")
@@ -139,6 +143,7 @@ class Text(JupyterMixin):
         "tab_size",
         "_spans",
         "_length",
+        "_span_index",
     ]
 
     def __init__(
@@ -163,6 +168,7 @@ class Text(JupyterMixin):
         self.tab_size = tab_size
         self._spans: List[Span] = spans or []
         self._length: int = len(sanitized_text)
+        self._span_index: Optional[SpanIndex] = None
 
     def __len__(self) -> int:
         return self._length
@@ -198,15 +204,21 @@ class Text(JupyterMixin):
     def __getitem__(self, slice: Union[int, slice]) -> "Text":
         def get_text_at(offset: int) -> "Text":
             _Span = Span
-            text = Text(
-                self.plain[offset],
-                spans=[
+            if offset < 0:
+                offset += len(self)
+            spans = self._spans
+            if self._span_index is not None or len(spans) >= SPAN_INDEX_THRESHOLD:
+                character_spans = [
+                    _Span(0, 1, spans[span_index].style)
+                    for span_index in self._get_span_index().get_spans_at(offset)
+                ]
+            else:
+                character_spans = [
                     _Span(0, 1, style)
-                    for start, end, style in self._spans
+                    for start, end, style in spans
                     if end > offset >= start
-                ],
-                end="",
-            )
+                ]
+            text = Text(self.plain[offset], spans=character_spans, end="")
             return text
 
         if isinstance(slice, int):
@@ -420,6 +432,8 @@ class Text(JupyterMixin):
     @property
     def spans(self) -> List[Span]:
         """Get a reference to the internal list of spans."""
+        # The list may be modified by the caller
+        self._span_index = None
         return self._spans
 
     @spans.setter
@@ -440,6 +454,29 @@ class Text(JupyterMixin):
         )
         return copy_self
 
+    @classmethod
+    def _from_sanitized(
+        cls,
+        text: str,
+        style: Union[str, Style],
+        justify: Optional["JustifyMethod"],
+        overflow: Optional["OverflowMethod"],
+    ) -> "Text":
+        """Create a Text instance from a string with no control codes (such as a slice of another Text),
+        without stripping control codes again."""
+        new_text = cls.__new__(cls)
+        new_text._text = [text]
+        new_text.style = style
+        new_text.justify = justify
+        new_text.overflow = overflow
+        new_text.no_wrap = None
+        new_text.end = "\n"
+        new_text.tab_size = None
+        new_text._spans = []
+        new_text._length = len(text)
+        new_text._span_index = None
+        return new_text
+
     def copy(self) -> "Text":
         """Return a copy of this instance."""
         copy_self = Text(
@@ -505,6 +542,7 @@ class Text(JupyterMixin):
                 # Span not in text or not valid
                 return
             self._spans.insert(0, Span(start, min(length, end), style))
+            self._span_index = None
 
     def apply_meta(
         self, meta: Dict[str, Any], start: int = 0, end: Optional[int] = None
@@ -559,16 +597,34 @@ class Text(JupyterMixin):
         Returns:
             Style: A Style instance.
         """
-        # TODO: This is a little inefficient, it is only used by full justify
         if offset < 0:
             offset = len(self) + offset
         get_style = console.get_style
         style = get_style(self.style).copy()
-        for start, end, span_style in self._spans:
+        spans = self._spans
+        if self._span_index is not None or len(spans) >= SPAN_INDEX_THRESHOLD:
+            for span_index in self._get_span_index().get_spans_at(offset):
+                style += get_style(spans[span_index].style, default="")
+            return style
+        for start, end, span_style in spans:
             if end > offset >= start:
                 style += get_style(span_style, default="")
         return style
 
+    def _get_span_index(self) -> SpanIndex:
+        """Get an index of the spans, creating or updating it if required."""
+        spans = self._spans
+        span_index = self._span_index
+        if (
+            span_index is None
+            or span_index.spans is not spans
+            or span_index.count > len(spans)
+        ):
+            span_index = self._span_index = SpanIndex(spans)
+        elif span_index.count < len(spans):
+            span_index.update()
+        return span_index
+
     def extend_style(self, spaces: int) -> None:
         """Extend the Text given number of spaces where the spaces have the same style as the last character.
 
@@ -581,6 +637,7 @@ class Text(JupyterMixin):
         new_spaces = " " * spaces
         if spans:
             end_offset = len(self)
+            self._span_index = None
             self._spans[:] = [
                 span.extend(spaces) if span.end >= end_offset else span
                 for span in spans
@@ -615,19 +672,24 @@ class Text(JupyterMixin):
         plain = self.plain
         if isinstance(re_highlight, str):
             re_highlight = re.compile(re_highlight)
+        # Group numbers and styles, in the order of the group names
+        group_styles = [
+            (group, f"{style_prefix}{name}")
+            for name, group in re_highlight.groupindex.items()
+        ]
         for match in re_highlight.finditer(plain):
-            get_span = match.span
             if style:
-                start, end = get_span()
+                start, end = match.span()
                 match_style = style(plain[start:end]) if callable(style) else style
                 if match_style is not None and end > start:
                     append_span(_Span(start, end, match_style))
 
             count += 1
-            for name in match.groupdict().keys():
-                start, end = get_span(name)
+            regs = match.regs
+            for group, group_style in group_styles:
+                start, end = regs[group]
                 if start != -1 and end > start:
-                    append_span(_Span(start, end, f"{style_prefix}{name}"))
+                    append_span(_Span(start, end, group_style))
         return count
 
     def highlight_words(
@@ -735,6 +797,15 @@ class Text(JupyterMixin):
             return
         get_style = partial(console.get_style, default=Style.null())
 
+        if self._span_index is not None or len(self._spans) >= SPAN_INDEX_THRESHOLD:
+            span_index = self._get_span_index()
+            boundaries = span_index.boundaries
+            if boundaries[0] >= 0 and boundaries[-1] <= len(text):
+                yield from self._render_indexed(span_index, text, get_style)
+                if end:
+                    yield _Segment(end)
+                return
+
         enumerated_spans = list(enumerate(self._spans, 1))
         style_map = {index: get_style(span.style) for index, span in enumerated_spans}
         style_map[0] = get_style(self.style)
@@ -751,18 +822,19 @@ class Text(JupyterMixin):
         stack_append = stack.append
         stack_pop = stack.remove
 
-        style_cache: Dict[Tuple[Style, ...], Style] = {}
+        # Keyed on the indexes of the spans, which avoids hashing styles
+        style_cache: Dict[Tuple[int, ...], Style] = {}
         style_cache_get = style_cache.get
         combine = Style.combine
 
         def get_current_style() -> Style:
             """Construct current style from stack."""
-            styles = tuple(style_map[_style_id] for _style_id in sorted(stack))
-            cached_style = style_cache_get(styles)
+            style_ids = tuple(sorted(stack))
+            cached_style = style_cache_get(style_ids)
             if cached_style is not None:
                 return cached_style
-            current_style = combine(styles)
-            style_cache[styles] = current_style
+            current_style = combine(style_map[_style_id] for _style_id in style_ids)
+            style_cache[style_ids] = current_style
             return current_style
 
         for (offset, leaving, style_id), (next_offset, _, _) in zip(spans, spans[1:]):
@@ -775,6 +847,47 @@ class Text(JupyterMixin):
         if end:
             yield _Segment(end)
 
+    def _render_indexed(
+        self,
+        span_index: SpanIndex,
+        text: str,
+        get_style: Callable[[Union[str, Style]], Style],
+    ) -> Iterable["Segment"]:
+        """Render the text with an index of spans which are all within the text.
+
+        Args:
+            span_index (SpanIndex): Index of spans.
+            text (str): The plain text.
+            get_style (Callable[[Union[str, Style]], Style]): Callable to get a style.
+
+        Returns:
+            Iterable[Segment]: Segments for the text.
+        """
+        _Segment = Segment
+        spans = self._spans
+        base_style = get_style(self.style)
+        style_cache: Dict[Tuple[int, ...], Style] = {(): base_style}
+        combine = Style.combine
+
+        def get_active_style(active: Tuple[int, ...]) -> Style:
+            """Combine the base style with the styles of the active spans."""
+            style = style_cache.get(active)
+            if style is None:
+                style = style_cache[active] = combine(
+                    [base_style, *(get_style(spans[index].style) for index in active)]
+                )
+            return style
+
+        position = 0
+        current: Tuple[int, ...] = ()
+        for offset, active in zip(span_index.boundaries, span_index.active):
+            if offset > position:
+                yield _Segment(text[position:offset], get_active_style(current))
+                position = offset
+            current = active
+        if len(text) > position:
+            yield _Segment(text[position:], get_active_style(current))
+
     def join(self, lines: Iterable["Text"]) -> "Text":
         """Join text together with this instance as the separator.
 
@@ -854,6 +967,7 @@ class Text(JupyterMixin):
 
         self._text = [result.plain]
         self._length = len(self.plain)
+        self._span_index = None
         self._spans[:] = result._spans
 
     def truncate(
@@ -887,6 +1001,7 @@ class Text(JupyterMixin):
         """Remove or modify any spans that are over the end of the text."""
         max_offset = len(self.plain)
         _Span = Span
+        self._span_index = None
         self._spans[:] = [
             (
                 span
@@ -909,6 +1024,7 @@ class Text(JupyterMixin):
             pad_characters = character * count
             self.plain = f"{pad_characters}{self.plain}{pad_characters}"
             _Span = Span
+            self._span_index = None
             self._spans[:] = [
                 _Span(start + count, end + count, style)
                 for start, end, style in self._spans
@@ -925,6 +1041,7 @@ class Text(JupyterMixin):
         if count:
             self.plain = f"{character * count}{self.plain}"
             _Span = Span
+            self._span_index = None
             self._spans[:] = [
                 _Span(start + count, end + count, style)
                 for start, end, style in self._spans
@@ -1118,65 +1235,34 @@ class Text(JupyterMixin):
             return Lines([self.copy()])
 
         text = self.plain
-        text_length = len(text)
-        divide_offsets = [0, *_offsets, text_length]
-        line_ranges = list(zip(divide_offsets, divide_offsets[1:]))
+        line_starts = [0, *_offsets]
+        line_ends = [*_offsets, len(text)]
 
         style = self.style
         justify = self.justify
         overflow = self.overflow
-        _Text = Text
+        new_text = Text._from_sanitized
         new_lines = Lines(
-            _Text(
-                text[start:end],
-                style=style,
-                justify=justify,
-                overflow=overflow,
-            )
-            for start, end in line_ranges
+            [
+                new_text(text[start:end], style, justify, overflow)
+                for start, end in zip(line_starts, line_ends)
+            ]
         )
         if not self._spans:
             return new_lines
 
         _line_appends = [line._spans.append for line in new_lines._lines]
-        line_count = len(line_ranges)
         _Span = Span
 
         for span_start, span_end, style in self._spans:
-            lower_bound = 0
-            upper_bound = line_count
-            start_line_no = (lower_bound + upper_bound) // 2
-
-            while True:
-                line_start, line_end = line_ranges[start_line_no]
-                if span_start < line_start:
-                    upper_bound = start_line_no - 1
-                elif span_start > line_end:
-                    lower_bound = start_line_no + 1
-                else:
-                    break
-                start_line_no = (lower_bound + upper_bound) // 2
-
-            if span_end < line_end:
-                end_line_no = start_line_no
-            else:
-                end_line_no = lower_bound = start_line_no
-                upper_bound = line_count
-
-                while True:
-                    line_start, line_end = line_ranges[end_line_no]
-                    if span_end < line_start:
-                        upper_bound = end_line_no - 1
-                    elif span_end > line_end:
-                        lower_bound = end_line_no + 1
-                    else:
-                        break
-                    end_line_no = (lower_bound + upper_bound) // 2
-
-            for line_no in range(start_line_no, end_line_no + 1):
-                line_start, line_end = line_ranges[line_no]
+            # The span starts on the last line which starts before (or at) the span start,
+            # and ends on the last line which starts before the span end
+            start_line_no = max(0, bisect_right(line_starts, span_start) - 1)
+            end_line_no = bisect_left(line_starts, span_end)
+            for line_no in range(start_line_no, end_line_no):
+                line_start = line_starts[line_no]
                 new_start = max(0, span_start - line_start)
-                new_end = min(span_end - line_start, line_end - line_start)
+                new_end = min(span_end, line_ends[line_no]) - line_start
                 if new_end > new_start:
                     _line_appends[line_no](_Span(new_start, new_end, style))
 
@@ -1186,6 +1272,7 @@ class Text(JupyterMixin):
         """Remove a number of characters from the end of the text."""
         max_offset = len(self.plain) - amount
         _Span = Span
+        self._span_index = None
         self._spans[:] = [
             (
                 span
@@ -1236,7 +1323,7 @@ class Text(JupyterMixin):
                     continue
                 new_lines = Lines([line])
             else:
-                offsets = divide_line(str(line), width, fold=wrap_overflow == "fold")
+                offsets = divide_line(line.plain, width, fold=wrap_overflow == "fold")
                 new_lines = line.divide(offsets)
                 for line in new_lines:
                     line.rstrip_end(width)
@@ -10,6 +10,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -27,6 +28,7 @@ from pygments.token import Token
 from pygments.util import ClassNotFound
 
 from . import pretty
+from .caches import LRUCache
 from ._loop import loop_first_last, loop_last
 from .columns import Columns
 from .console import (
@@ -40,8 +42,10 @@ from .console import (
 )
 from .constrain import Constrain
 from .highlighter import RegexHighlighter, ReprHighlighter
+from .measure import Measurement
 from .panel import Panel
 from .scope import render_scope
+from .segment import Segment
 from .style import Style
 from .syntax import Syntax, SyntaxPosition
 from .text import Text
@@ -255,6 +259,51 @@ class Trace:
     stacks: List[Stack]
 
 
+# The syntax for the code around a frame, keyed on the file, the frame, and the traceback options
+_frame_syntaxes: "LRUCache[Syntax]" = LRUCache("traceback.syntax")
+# The segments of a rendered frame syntax, keyed on the frame syntax and the render options
+_frame_segments: "LRUCache[List[Segment]]" = LRUCache("traceback.segments")
+
+
+class _FrameSyntax:
+    """The syntax for the code around a frame, which caches the segments it renders.
+
+    Args:
+        syntax (Syntax): Syntax to render.
+        key (Hashable): Key which identifies the syntax.
+    """
+
+    def __init__(self, syntax: Syntax, key: Hashable) -> None:
+        self.syntax = syntax
+        self.key = key
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement.get(console, options, self.syntax)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        key = (
+            self.key,
+            options.min_width,
+            options.max_width,
+            options.legacy_windows,
+            options.ascii_only,
+            options.justify,
+            options.overflow,
+            options.no_wrap,
+            console.color_system,
+            console.get_style("traceback.error_range", default="none"),
+        )
+        segments = _frame_segments.get(key)
+        if segments is None:
+            segments = list(console.render(self.syntax, options))
+            _frame_segments.set(key, segments)
+        yield from segments
+
+
 class PathHighlighter(RegexHighlighter):
     highlights = [r"(?P<dim>.*/)(?P<bold>.+)"]
 
@@ -326,6 +375,7 @@ class Traceback:
         self.code_width = code_width
         self.extra_lines = extra_lines
         self.theme = Syntax.get_theme(theme or "ansi_dark")
+        self._theme_key: Hashable = theme or "ansi_dark"
         self.word_wrap = word_wrap
         self.show_locals = show_locals
         self.indent_guides = indent_guides
@@ -767,7 +817,6 @@ class Traceback:
     @group()
     def _render_stack(self, stack: Stack) -> RenderResult:
         path_highlighter = PathHighlighter()
-        theme = self.theme
 
         def render_locals(frame: Frame) -> Iterable[ConsoleRenderable]:
             if frame.locals:
@@ -831,68 +880,114 @@ class Traceback:
                 yield from render_locals(frame)
                 continue
             if not suppressed:
-                try:
-                    code_lines = linecache.getlines(frame.filename)
-                    code = "".join(code_lines)
-                    if not code:
-                        # code may be an empty string if the file doesn't exist, OR
-                        # if the traceback filename is generated dynamically
-                        continue
-                    lexer_name = self._guess_lexer(frame.filename, code)
-                    syntax = Syntax(
-                        code,
-                        lexer_name,
-                        theme=theme,
-                        line_numbers=True,
-                        line_range=(
-                            frame.lineno - self.extra_lines,
-                            frame.lineno + self.extra_lines,
-                        ),
-                        highlight_lines={frame.lineno},
-                        word_wrap=self.word_wrap,
-                        code_width=self.code_width,
-                        indent_guides=self.indent_guides,
-                        dedent=False,
-                    )
-                    yield ""
-                except Exception as error:
-                    yield Text.assemble(
-                        (f"\n{error}", "traceback.error"),
-                    )
-                else:
-                    if frame.last_instruction is not None:
-                        start, end = frame.last_instruction
-
-                        # Stylize a line at a time
-                        # So that indentation isn't underlined (which looks bad)
-                        for line1, column1, column2 in _iter_syntax_lines(start, end):
-                            try:
-                                if column1 == 0:
-                                    line = code_lines[line1 - 1]
-                                    column1 = len(line) - len(line.lstrip())
-                                if column2 == -1:
-                                    column2 = len(code_lines[line1 - 1])
-                            except IndexError:
-                                # Being defensive here
-                                # If last_instruction reports a line out-of-bounds, we don't want to crash
-                                continue
-
-                            syntax.stylize_range(
-                                style="traceback.error_range",
-                                start=(line1, column1),
-                                end=(line1, column2),
-                            )
-                    yield (
-                        Columns(
-                            [
-                                syntax,
-                                *render_locals(frame),
-                            ],
-                            padding=1,
+                syntax_key = self._get_frame_syntax_key(frame)
+                syntax = _frame_syntaxes.get(syntax_key)
+                if syntax is None:
+                    try:
+                        syntax = self._get_frame_syntax(frame)
+                    except Exception as error:
+                        yield Text.assemble(
+                            (f"\n{error}", "traceback.error"),
                         )
-                        if frame.locals
-                        else syntax
+                        continue
+                    if syntax is None:
+                        continue
+                    _frame_syntaxes.set(syntax_key, syntax)
+                yield ""
+                frame_syntax = _FrameSyntax(syntax, syntax_key)
+                yield (
+                    Columns(
+                        [
+                            frame_syntax,
+                            *render_locals(frame),
+                        ],
+                        padding=1,
                     )
+                    if frame.locals
+                    else frame_syntax
+                )
+
+    def _get_frame_syntax_key(self, frame: Frame) -> Hashable:
+        """Get a key which identifies the syntax for the code around a frame.
+
+        Args:
+            frame (Frame): A frame.
+
+        Returns:
+            Hashable: A key, which changes if the file is modified.
+        """
+        try:
+            stat = os.stat(frame.filename)
+        except (OSError, ValueError):
+            file_key: Optional[Tuple[int, int]] = None
+        else:
+            file_key = (stat.st_mtime_ns, stat.st_size)
+        return (
+            frame.filename,
+            file_key,
+            frame.lineno,
+            frame.last_instruction,
+            self.extra_lines,
+            self._theme_key,
+            self.word_wrap,
+            self.code_width,
+            self.indent_guides,
+        )
+
+    def _get_frame_syntax(self, frame: Frame) -> Optional[Syntax]:
+        """Get the syntax for the code around a frame.
+
+        Args:
+            frame (Frame): A frame.
+
+        Returns:
+            Optional[Syntax]: Syntax, or ``None`` if the code isn't available.
+        """
+        code_lines = linecache.getlines(frame.filename)
+        code = "".join(code_lines)
+        if not code:
+            # code may be an empty string if the file doesn't exist, OR
+            # if the traceback filename is generated dynamically
+            return None
+        lexer_name = self._guess_lexer(frame.filename, code)
+        syntax = Syntax(
+            code,
+            lexer_name,
+            theme=self.theme,
+            line_numbers=True,
+            line_range=(
+                frame.lineno - self.extra_lines,
+                frame.lineno + self.extra_lines,
+            ),
+            highlight_lines={frame.lineno},
+            word_wrap=self.word_wrap,
+            code_width=self.code_width,
+            indent_guides=self.indent_guides,
+            dedent=False,
+        )
+        if frame.last_instruction is not None:
+            start, end = frame.last_instruction
+
+            # Stylize a line at a time
+            # So that indentation isn't underlined (which looks bad)
+            for line1, column1, column2 in _iter_syntax_lines(start, end):
+                try:
+                    if column1 == 0:
+                        line = code_lines[line1 - 1]
+                        column1 = len(line) - len(line.lstrip())
+                    if column2 == -1:
+                        column2 = len(code_lines[line1 - 1])
+                except IndexError:
+                    # Being defensive here
+                    # If last_instruction reports a line out-of-bounds, we don't want to crash
+                    continue
+
+                syntax.stylize_range(
+                    style="traceback.error_range",
+                    start=(line1, column1),
+                    end=(line1, column2),
+                )
+        return syntax
 
 
 if __name__ == "__main__":  # pragma: no cover
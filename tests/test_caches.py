@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from rich import caches, cells, segment
+from rich.caches import CACHE_SIZES, CacheInfo
+from rich.color import Color
+from rich.style import Style, _style_interner
+
+
+@pytest.fixture(autouse=True)
+def restore_sizes():
+    yield
+    for name, (maxsize, _entry_size) in CACHE_SIZES.items():
+        caches.resize(name, maxsize)
+
+
+def test_cache_info():
+    caches.clear("style.parse")
+    Style.parse("bold magenta on yellow")
+    Style.parse("bold magenta on yellow")
+    (info,) = caches.cache_info(["style.parse"])
+    assert info == CacheInfo("style.parse", 1, 1, 4096, 1)
+    assert info.hit_rate == 0.5
+    assert [info.name for info in caches.cache_info()] == sorted(CACHE_SIZES)
+
+
+def test_cache_info_interner():
+    (info,) = caches.cache_info(["style.interner"])
+    assert info.hits is None and info.misses is None
+    assert info.hit_rate is None
+    assert info.currsize == len(_style_interner.ids)
+
+
+def test_resize_method():
+    parse = Style.parse
+    caches.resize("color.parse", 2)
+    assert Color.parse.cache_info().maxsize == 2
+    for color in ("red", "green", "blue"):
+        assert Color.parse(color).name == color
+    assert caches.cache_info(["color.parse"])[0].currsize == 2
+    caches.resize("style.parse", 10)
+    assert Style.parse is not parse
+    assert Style.parse("bold") == Style(bold=True)
+    assert caches.cache_info(["style.parse"])[0].maxsize == 10
+
+
+def test_resize_function():
+    caches.resize("cells.cached_cell_len", 3)
+    assert cells.cached_cell_len.cache_info().maxsize == 3
+    # The function was imported in to segment
+    assert segment.cached_cell_len is cells.cached_cell_len
+    assert cells.cached_cell_len("foo") == 3
+
+
+def test_resize_interner():
+    caches.resize("style.interner", 10)
+    assert _style_interner.maxsize == 10
+    assert not _style_interner.ids
+
+
+def test_resize_invalid():
+    with pytest.raises(ValueError):
+        caches.resize("style.parse", 0)
+    with pytest.raises(KeyError):
+        caches.resize("foo", 10)
+
+
+def test_clear():
+    Style.parse("italic")
+    caches.clear()
+    assert all(
+        info.currsize == 0 for info in caches.cache_info() if info.hits is not None
+    )
+
+
+def test_set_memory_budget():
+    default_memory = caches.estimate_memory()
+    caches.set_memory_budget(default_memory // 4)
+    assert caches.estimate_memory() <= default_memory // 4
+    assert caches.cache_info(["style.parse"])[0].maxsize == 1024
+    caches.set_memory_budget(default_memory * 2)
+    assert caches.cache_info(["style.parse"])[0].maxsize == 8192
+
+
+def test_budget_maxsizes_minimum(monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(caches, "CACHE_SIZES", {"small": (1000, 10), "large": (2, 1000)})
+        # The large cache keeps one entry, and the small cache is scaled to fit the rest of the budget
+        assert caches._budget_maxsizes(3000) == {"small": 200, "large": 1}
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [("1000", 1000), ("8K", 8 * 1024), ("1.5mb", 1536 * 1024), ("2G", 2 * 1024**3)],
+)
+def test_parse_size(size, expected):
+    assert caches._parse_size(size) == expected
+
+
+def test_memory_budget_environment():
+    code = "from rich import caches; import rich.style; print(caches.estimate_memory())"
+    env = {**os.environ, "RICH_CACHE_MEMORY": "1M"}
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    ).stdout
+    assert int(output) <= 1024 * 1024
@@ -1127,3 +1127,108 @@ def test_tty_compatible() -> None:
     assert not console.is_terminal
     # Should not have auto-detected
     assert not console.file.called_isatty
+
+
+def test_import_defers_modules() -> None:
+    """Importing the console should not import modules that are only needed for some features."""
+    deferred = [
+        "configparser",
+        "html",
+        "pickle",
+        "rich._emoji_codes",
+        "rich.pager",
+        "rich.pretty",
+        "rich.scope",
+        "rich.screen",
+        "rich.table",
+    ]
+    code = f"import sys, rich.console; print([name for name in {deferred!r} if name in sys.modules])"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_deferred_imports() -> None:
+    import rich.console
+    from rich.pretty import Pretty
+    from rich.styled import Styled
+
+    assert rich.console.Pretty is Pretty
+    assert rich.console.Styled is Styled
+    with pytest.raises(AttributeError):
+        rich.console.does_not_exist
+
+
+class WriteCountingIO(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"style": "bold on red"},
+        {"crop": False},
+        {"new_line_start": True},
+        {"soft_wrap": True},
+    ],
+)
+def test_print_stream(kwargs) -> None:
+    text = Text()
+    for index in range(3000):
+        text.append(f"word{index}", style="italic" if index % 2 else "red")
+        text.append("\n" if index % 30 == 29 else " ")
+    outputs = []
+    for stream in (False, True):
+        console = Console(
+            file=WriteCountingIO(), width=50, force_terminal=True, record=True
+        )
+        console.print(text, stream=stream, **kwargs)
+        outputs.append((console.file.getvalue(), console.export_text(styles=True)))
+        if stream:
+            assert console.file.writes > 1
+        else:
+            assert console.file.writes == 1
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [("foo", "foo\n"), ("foo\n", "foo\n\n"), ("foo\nbar", "\nfoo\nbar\n")],
+)
+def test_print_stream_new_line_start(text: str, expected: str) -> None:
+    console = Console(file=io.StringIO())
+    console.print(text, end="", new_line_start=True, stream=True)
+    console.print()
+    assert console.file.getvalue() == expected
+
+
+def test_print_stream_capture() -> None:
+    console = Console(file=WriteCountingIO(), width=50)
+    with console.capture() as capture:
+        console.print("foo\n" * 2000, stream=True)
+    assert capture.get() == "foo\n" * 2000 + "\n"
+    assert console.file.getvalue() == ""
+
+
+def test_record_max_lines() -> None:
+    console = Console(file=io.StringIO(), width=20, record=True, record_max_lines=3)
+    for number in range(10):
+        console.print(f"[bold]Line {number}")
+    assert console.export_text() == "Line 7\nLine 8\nLine 9\n"
+    assert console.export_text() == ""
+    console.print("foo")
+    assert "foo" in console.export_html()
+
+
+def test_record_max_bytes() -> None:
+    console = Console(file=io.StringIO(), width=20, record=True, record_max_bytes=10)
+    console.print("foo\nbar\nbaz\nqux")
+    assert console.export_text() == "baz\nqux\n"
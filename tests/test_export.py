@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from rich.console import Console
+from rich.export import HTMLStreamExporter, TextStreamExporter
+from rich.segment import Segment
+from rich.style import Style
+
+
+def test_text_stream_exporter() -> None:
+    console = Console(file=io.StringIO(), width=40, record=True)
+    export_file = io.StringIO()
+    with console.stream_export(TextStreamExporter(export_file)):
+        console.print("[bold]Hello[/bold], World!")
+        assert export_file.getvalue() == "Hello, World!\n"
+        console.print("[red]foo")
+    console.print("not exported")
+    assert export_file.getvalue() == "Hello, World!\nfoo\n"
+    assert console.export_text() == "Hello, World!\nfoo\nnot exported\n"
+
+
+def test_text_stream_exporter_styles() -> None:
+    console = Console(file=io.StringIO(), width=40, record=True)
+    export_file = io.StringIO()
+    with console.stream_export(TextStreamExporter(export_file, styles=True)):
+        console.print("[bold]Hello[/bold], World!")
+    assert export_file.getvalue() == console.export_text(styles=True)
+
+
+def test_html_stream_exporter() -> None:
+    console = Console(file=io.StringIO(), width=40, record=True)
+    export_file = io.StringIO()
+    with console.stream_export(HTMLStreamExporter(export_file)):
+        console.print("[bold]<Hello>[/bold], [link=https://example.org]World[/]!")
+        console.print("[red]foo")
+    assert export_file.getvalue() == console.export_html(inline_styles=True)
+
+
+def test_html_stream_exporter_nothing_written() -> None:
+    export_file = io.StringIO()
+    exporter = HTMLStreamExporter(export_file, code_format="<pre>{code}</pre>")
+    exporter.close()
+    exporter.close()
+    exporter.write([Segment("foo", Style(bold=True))])
+    assert export_file.getvalue() == "<pre></pre>"
+
+
+def test_html_stream_exporter_code_format() -> None:
+    with pytest.raises(ValueError):
+        HTMLStreamExporter(io.StringIO(), code_format="<pre></pre>")
+
+
+def test_stream_export_in_capture() -> None:
+    console = Console(file=io.StringIO(), width=40)
+    export_file = io.StringIO()
+    with console.stream_export(TextStreamExporter(export_file)):
+        with console.capture():
+            console.print("captured")
+        console.print("printed")
+    assert export_file.getvalue() == "printed\n"
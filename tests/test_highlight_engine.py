@@ -0,0 +1,85 @@
+import re
+
+from rich._highlight_engine import HighlightRegexes, analyze, split_alternatives
+from rich.highlighter import ISO8601Highlighter, JSONHighlighter, ReprHighlighter
+
+
+def test_split_alternatives():
+    assert split_alternatives(r"foo|(bar|baz)|[|]|\|") == [
+        "foo",
+        "(bar|baz)",
+        "[|]",
+        r"\|",
+    ]
+    assert split_alternatives(r"[]|]|a") == ["[]|]", "a"]
+    # Alternatives which may depend on each other aren't split
+    assert split_alternatives(r"(?i)foo|bar") == [r"(?i)foo|bar"]
+    assert split_alternatives(r"(a)|\1") == [r"(a)|\1"]
+
+
+def test_analyze():
+    assert analyze(r"\bfoo\d+") == (frozenset(["foo"]), frozenset("f"))
+    assert analyze(r"(?P<x>[ab])\.") == (frozenset(["."]), frozenset("ab"))
+    assert analyze(r"a*") == (None, None)
+    assert analyze(r"a?b") == (frozenset(["b"]), frozenset("ab"))
+    assert analyze(r"(?i)foo") == (None, None)
+    # \d matches any Unicode decimal digit, unless the ASCII flag is set
+    assert analyze(r"\d+") == (None, None)
+    assert analyze(r"(?a)\d+") == (frozenset("0123456789"), frozenset("0123456789"))
+
+
+def test_get_patterns():
+    highlight_regexes = HighlightRegexes([r"(?P<a>foo)|(?P<b>bar)", r"baz"])
+    patterns = highlight_regexes.get_patterns("foo baz")
+    assert len(patterns) == 2
+    assert patterns[0].search("bar") is None
+    assert patterns[0].search("foo").lastgroup == "a"
+    assert highlight_regexes.get_patterns("nothing") == []
+    assert highlight_regexes.get_patterns("foo baz") is patterns
+
+
+def test_get_patterns_unicode_digits():
+    highlight_regexes = HighlightRegexes([r"(?P<a>\d+)|(?P<b>zz)"])
+    patterns = highlight_regexes.get_patterns("\u0663\u0663")
+    assert [pattern.search("\u0663\u0663").lastgroup for pattern in patterns] == ["a"]
+
+
+def _get_group_spans(pattern, text):
+    return [
+        {
+            name: match.span(name)
+            for name, value in match.groupdict().items()
+            if value is not None
+        }
+        for match in re.finditer(pattern, text)
+    ]
+
+
+def test_get_patterns_matches():
+    texts = [
+        "",
+        "foo",
+        "<Foo bar=1 baz='2'> {'a': [1, 2.5, None, True]} 0x1F 192.168.0.1",
+        "https://example.org/path?x=1 /usr/bin/python 2.3e-4 ...",
+        "12:34:56 2022-01-01T10:00:00Z 2022-W01-1 b'bytes' 1+2j 'string'",
+        "a2:f1:c3:d4:e5:f6 fe80::1 UUID('31b2c2d0-45a7-4a1e-9bfa-a5fd4ef0e1d8')",
+        '{"key": "value", "other": [null, false]}',
+    ]
+    for highlights in (
+        ReprHighlighter.highlights,
+        ISO8601Highlighter.highlights,
+        JSONHighlighter.highlights,
+    ):
+        highlight_regexes = HighlightRegexes(highlights)
+        for text in texts:
+            expected = [
+                _get_group_spans(regex, text)
+                for regex in highlights
+                if re.search(regex, text)
+            ]
+            result = [
+                _get_group_spans(pattern, text)
+                for pattern in highlight_regexes.get_patterns(text)
+                if pattern.search(text)
+            ]
+            assert result == expected
@@ -0,0 +1,92 @@
+import pytest
+from pygments.lexers import CLexer, JavascriptLexer, JsonLexer, PythonLexer
+
+from rich import _lexed_code
+from rich._lexed_code import (
+    Checkpoint,
+    LexedCode,
+    can_checkpoint,
+    get_lexed_code,
+)
+
+CODE = '''\
+def foo(x):
+    """A docstring
+    which spans lines.
+    """
+    return x + 1  # comment
+
+
+class Bar:
+    value = "string"
+''' * 10
+
+
+@pytest.fixture(autouse=True)
+def small_checkpoints(monkeypatch):
+    monkeypatch.setattr(_lexed_code, "CHECKPOINT_LINES", 4)
+
+
+def test_can_checkpoint():
+    assert can_checkpoint(PythonLexer())
+    # Lexers which customize lexing
+    assert not can_checkpoint(JsonLexer())
+    assert not can_checkpoint(CLexer())
+
+
+def test_get_tokens():
+    lexer = PythonLexer()
+    lexed_code = LexedCode(lexer, CODE)
+    checkpoint, tokens = lexed_code.get_tokens()
+    assert checkpoint == Checkpoint(0, 0, ("root",))
+    assert list(tokens) == list(lexer.get_tokens(CODE))
+    assert lexed_code.complete
+    # Checkpoints are never inside the docstring
+    lines = CODE.splitlines(keepends=True)
+    for checkpoint in lexed_code.checkpoints:
+        assert "".join(lines[: checkpoint.line]) == CODE[: checkpoint.position]
+        assert not lines[checkpoint.line - 1].strip().startswith("which")
+
+
+def test_get_tokens_from_line():
+    lexer = PythonLexer()
+    lexed_code = LexedCode(lexer, CODE)
+    checkpoint, tokens = lexed_code.get_tokens(50, 60)
+    assert checkpoint.line <= 50
+    assert not lexed_code.complete
+    text = "".join(token for _, token in tokens)
+    lines = CODE.splitlines(keepends=True)
+    assert text.startswith("".join(lines[checkpoint.line : 60]))
+    expected = list(lexer.get_tokens(CODE))
+    tokens = list(lexed_code.get_tokens(50)[1])
+    assert tokens == expected[len(expected) - len(tokens) :]
+
+
+def test_edited_code():
+    _lexed_code._lexed_codes.clear()
+    lexer = JavascriptLexer()
+    lines = [f"var x{number} = {number};" for number in range(40)]
+    # An unterminated string, which is a string once a quote is added after it
+    lines[3] = 'var s = "open;'
+    code = "\n".join(lines)
+    lines[30] = 'var t = 1; "'
+    edited_code = "\n".join(lines)
+    lexed_code = get_lexed_code(lexer, code)
+    assert lexed_code is not None
+    list(lexed_code.get_tokens()[1])
+    edited = get_lexed_code(lexer, edited_code)
+    assert edited is not None
+    assert list(edited.get_tokens(24)[1]) == list(
+        LexedCode(lexer, edited_code).get_tokens(24)[1]
+    )
+    assert list(edited.get_tokens()[1]) == list(lexer.get_tokens(edited_code))
+
+
+def test_get_lexed_code():
+    _lexed_code._lexed_codes.clear()
+    lexer = PythonLexer()
+    lexed_code = get_lexed_code(lexer, CODE)
+    assert lexed_code is not None
+    assert get_lexed_code(PythonLexer(), CODE) is lexed_code
+    assert get_lexed_code(PythonLexer(tabsize=8), CODE) is not lexed_code
+    assert get_lexed_code(JsonLexer(), "{}") is None
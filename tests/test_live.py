@@ -1,6 +1,10 @@
 # encoding=utf-8
+import asyncio
+import re
+import threading
 import time
-from typing import Optional
+import unicodedata
+from typing import List, Optional
 
 # import pytest
 from rich.console import Console
@@ -185,3 +189,138 @@ def test_live_empty() -> None:
     print(repr(result))
     assert "\n" not in result
     assert result == "\x1b[?25l\r\x1b[2K\x1b[?25h\r"
+
+
+def emulate_terminal(output: str, width: int) -> List[str]:
+    """Interpret output as a (very basic) terminal, and return the lines on screen."""
+    screen: List[List[str]] = [[]]
+    x = y = 0
+
+    def write(character: str) -> None:
+        nonlocal x
+        line = screen[y]
+        line.extend(" " * (x + 1 - len(line)))
+        line[x] = character
+        x += 1
+
+    for match in re.finditer(r"\x1b\[(\??)(\d*)([A-Za-z])|(.)", output, re.DOTALL):
+        private, parameter, command, character = match.groups()
+        if character == "\n":
+            x = 0
+            y += 1
+            screen.extend([] for _ in range(y + 1 - len(screen)))
+        elif character == "\r":
+            x = 0
+        elif character is not None and unicodedata.combining(character):
+            screen[y][x - 1] += character
+        elif character is not None:
+            write(character)
+            if unicodedata.east_asian_width(character) == "W":
+                write("")
+        elif private:
+            continue
+        elif command == "A":
+            y -= int(parameter)
+        elif command == "B":
+            y += int(parameter)
+        elif command == "G":
+            x = int(parameter) - 1
+        elif command == "K":
+            del screen[y][0 if parameter == "2" else x :]
+    return ["".join(line).rstrip() for line in screen]
+
+
+def test_diff_redraw() -> None:
+    frames = [
+        "Hello\nWorld",
+        "Hello\nWorld!",
+        "Hello\nWorld!\nThree lines",
+        "Help\nWorld!\nThree lines\n\nFive",
+        "Help\nWorld?\nThree lines",
+        "日本語\ncafé\nThree lines",
+        "日本人\ncafe\nThree lines",
+        "",
+        "foo",
+        "[bold]foo[/bold] bar",
+        "[bold]foo[/bold] bar\n" + "x" * 60,
+        "[bold]foo[/bold] baz\n" + "y" * 60,
+    ]
+    outputs = []
+    for diff_redraw in (False, True):
+        console = create_capture_console()
+        output = ""
+        screens = []
+        console.begin_capture()
+        with Live(console=console, auto_refresh=False, diff_redraw=diff_redraw) as live:
+            for frame in frames:
+                live.update(frame, refresh=True)
+                output += console.end_capture()
+                screens.append(emulate_terminal(output, console.width))
+                console.begin_capture()
+        output += console.end_capture()
+        screens.append(emulate_terminal(output, console.width))
+        outputs.append((output, screens))
+
+    (full_output, full_screens), (diff_output, diff_screens) = outputs
+    assert diff_screens == full_screens
+    assert len(diff_output) < len(full_output)
+
+
+def test_diff_redraw_console_print() -> None:
+    console = create_capture_console()
+    console.begin_capture()
+    with Live(console=console, auto_refresh=False, diff_redraw=True) as live:
+        live.update("foo\nbar", refresh=True)
+        console.print("Hello")
+        live.update("foo\nbaz", refresh=True)
+    output = console.end_capture()
+    assert emulate_terminal(output, console.width) == ["Hello", "foo", "baz", ""]
+
+
+def test_diff_redraw_restart() -> None:
+    screens = []
+    for diff_redraw in (False, True):
+        console = create_capture_console()
+        console.begin_capture()
+        live = Live(console=console, auto_refresh=False, diff_redraw=diff_redraw)
+        live.start()
+        live.update("foo\nbar", refresh=True)
+        live.stop()
+        console.print("Hello")
+        live.update("foo\nbaz")
+        live.start(refresh=True)
+        live.stop()
+        output = console.end_capture()
+        screens.append(emulate_terminal(output, console.width))
+    full_screen, diff_screen = screens
+    assert diff_screen == full_screen
+
+
+def test_live_async() -> None:
+    console = create_capture_console()
+    console.begin_capture()
+
+    async def run() -> None:
+        async with Live("foo", console=console, refresh_per_second=100) as live:
+            assert live.is_started
+            # Refreshes are scheduled on the event loop, without a thread
+            assert live._refresh_thread is None
+            assert live._refresh_task is not None
+            refresh_task = live._refresh_task
+            for text in ("bar", "baz"):
+                live.update(text, refresh=True)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0.05)
+        assert live._refresh_task is None
+        await asyncio.wait([refresh_task], timeout=1)
+        assert refresh_task.done()
+
+    threads = threading.active_count()
+    asyncio.run(run())
+    assert threading.active_count() == threads
+    output = console.end_capture()
+    print(repr(output))
+    # Both updates were requested in the same iteration of the loop, so they were combined
+    assert "bar" not in output
+    assert output.startswith("\x1b[?25lfoo\r\x1b[2Kbaz")
+    assert output.endswith("baz\n\x1b[?25h")
@@ -3,8 +3,15 @@
 
 import io
 import re
+from datetime import datetime
 
+import pytest
+
+from rich._log_render import LogRender
 from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+from rich.theme import Theme
 
 re_link_ids = re.compile(r"id=[\d\.\-]*?;.*?\x1b")
 
@@ -37,7 +44,7 @@ def render_log():
 
 def test_log():
     expected = replace_link_ids(
-        "\x1b[2;36m[TIME]\x1b[0m\x1b[2;36m \x1b[0m                                                           \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m32\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m      \x1b[0m\x1b[2;36m \x1b[0mHello from \x1b[1m<\x1b[0m\x1b[1;95mconsole\x1b[0m\x1b[39m \x1b[0m\x1b[33mwidth\x1b[0m\x1b[39m=\x1b[0m\x1b[1;36m80\x1b[0m\x1b[39m ColorSystem.TRUECOLOR\x1b[0m\x1b[1m>\x1b[0m !      \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m33\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m      \x1b[0m\x1b[2;36m \x1b[0m\x1b[1m[\x1b[0m\x1b[1;36m1\x1b[0m, \x1b[1;36m2\x1b[0m, \x1b[1;36m3\x1b[0m\x1b[1m]\x1b[0m                                                  \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m34\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m       \x1b[0m\x1b[34m╭─\x1b[0m\x1b[34m─────────────────────\x1b[0m\x1b[34m \x1b[0m\x1b[3;34mlocals\x1b[0m\x1b[34m \x1b[0m\x1b[34m─────────────────────\x1b[0m\x1b[34m─╮\x1b[0m     \x1b[2m              \x1b[0m\n\x1b[2;36m       \x1b[0m\x1b[34m│\x1b[0m \x1b[3;33mconsole\x1b[0m\x1b[31m =\x1b[0m \x1b[1m<\x1b[0m\x1b[1;95mconsole\x1b[0m\x1b[39m \x1b[0m\x1b[33mwidth\x1b[0m\x1b[39m=\x1b[0m\x1b[1;36m80\x1b[0m\x1b[39m ColorSystem.TRUECOLOR\x1b[0m\x1b[1m>\x1b[0m \x1b[34m│\x1b[0m     \x1b[2m              \x1b[0m\n\x1b[2;36m       \x1b[0m\x1b[34m╰────────────────────────────────────────────────────╯\x1b[0m     \x1b[2m              \x1b[0m\n"
+        "\x1b[2;36m[TIME]\x1b[0m\x1b[2;36m \x1b[0m                                                           \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m39\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m      \x1b[0m\x1b[2;36m \x1b[0mHello from \x1b[1m<\x1b[0m\x1b[1;95mconsole\x1b[0m\x1b[39m \x1b[0m\x1b[33mwidth\x1b[0m\x1b[39m=\x1b[0m\x1b[1;36m80\x1b[0m\x1b[39m ColorSystem.TRUECOLOR\x1b[0m\x1b[1m>\x1b[0m !      \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m40\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m      \x1b[0m\x1b[2;36m \x1b[0m\x1b[1m[\x1b[0m\x1b[1;36m1\x1b[0m, \x1b[1;36m2\x1b[0m, \x1b[1;36m3\x1b[0m\x1b[1m]\x1b[0m                                                  \x1b]8;id=0;foo\x1b\\\x1b[2msource.py\x1b[0m\x1b]8;;\x1b\\\x1b[2m:\x1b[0m\x1b]8;id=0;foo\x1b\\\x1b[2m41\x1b[0m\x1b]8;;\x1b\\\n\x1b[2;36m       \x1b[0m\x1b[34m╭─\x1b[0m\x1b[34m─────────────────────\x1b[0m\x1b[34m \x1b[0m\x1b[3;34mlocals\x1b[0m\x1b[34m \x1b[0m\x1b[34m─────────────────────\x1b[0m\x1b[34m─╮\x1b[0m     \x1b[2m              \x1b[0m\n\x1b[2;36m       \x1b[0m\x1b[34m│\x1b[0m \x1b[3;33mconsole\x1b[0m\x1b[31m =\x1b[0m \x1b[1m<\x1b[0m\x1b[1;95mconsole\x1b[0m\x1b[39m \x1b[0m\x1b[33mwidth\x1b[0m\x1b[39m=\x1b[0m\x1b[1;36m80\x1b[0m\x1b[39m ColorSystem.TRUECOLOR\x1b[0m\x1b[1m>\x1b[0m \x1b[34m│\x1b[0m     \x1b[2m              \x1b[0m\n\x1b[2;36m       \x1b[0m\x1b[34m╰────────────────────────────────────────────────────╯\x1b[0m     \x1b[2m              \x1b[0m\n"
     )
     rendered = render_log()
     print(repr(rendered))
@@ -59,6 +66,63 @@ def test_justify():
     assert result == "                 foo\n"
 
 
+@pytest.mark.parametrize("width", [3, 10, 30, 80])
+@pytest.mark.parametrize("level_width", [8, None])
+def test_log_render_matches_grid(width, level_width):
+    log_render = LogRender(show_level=True, level_width=level_width)
+    messages = [
+        [Text("Hello, World")],
+        [Text("A much longer message, which wraps over several lines " * 3)],
+        [Text("Line 1\nLine 2"), Panel("Panel")],
+        [],
+    ]
+    for message in messages:
+        for path, line_no in [("foo.py", 12), (None, None)]:
+            log_line = log_render(
+                Console(),
+                message,
+                log_time=datetime(2021, 10, 27, 12, 0, 0),
+                level=Text("INFO", style="logging.level.info"),
+                path=path,
+                line_no=line_no,
+                link_path="/foo.py",
+            )
+            renders = []
+            for renderable in (log_line, log_line.get_table()):
+                console = Console(
+                    file=io.StringIO(),
+                    width=width,
+                    force_terminal=True,
+                    color_system="truecolor",
+                    legacy_windows=False,
+                )
+                console.print(renderable)
+                renders.append(replace_link_ids(console.file.getvalue()))
+            assert renders[0] == renders[1]
+
+
+def test_log_render_theme():
+    console = Console(
+        file=io.StringIO(),
+        width=40,
+        force_terminal=True,
+        color_system="truecolor",
+        log_time_format="[TIME]",
+        log_path=False,
+        legacy_windows=False,
+        _environ={},
+    )
+    console.log("foo")
+    with console.use_theme(Theme({"log.time": "red"})):
+        console.log("bar")
+    console.log("baz")
+    assert console.file.getvalue() == (
+        "\x1b[2;36m[TIME]\x1b[0m\x1b[2;36m \x1b[0mfoo                              \n"
+        "\x1b[31m      \x1b[0m\x1b[31m \x1b[0mbar                              \n"
+        "\x1b[2;36m      \x1b[0m\x1b[2;36m \x1b[0mbaz                              \n"
+    )
+
+
 if __name__ == "__main__":
     render = render_log()
     print(render)
@@ -1,6 +1,7 @@
 import io
 import os
 import logging
+import re
 from typing import Optional
 
 import pytest
@@ -160,3 +161,148 @@ def test_markup_and_highlight():
     render_plain = handler.console.file.getvalue()
     assert "FORMATTER" in render_plain
     assert log_message in render_plain
+
+
+def test_tracebacks_dedupe_window():
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=140,
+        color_system=None,
+        _environ={},
+    )
+    handler_dedupe = RichHandler(
+        console=console,
+        enable_link_path=False,
+        rich_tracebacks=True,
+        tracebacks_dedupe_window=60,
+    )
+    dedupe_log = logging.getLogger("rich.dedupe")
+    dedupe_log.propagate = False
+    dedupe_log.addHandler(handler_dedupe)
+
+    def divide(divisor):
+        return 1 / divisor
+
+    try:
+        for _ in range(3):
+            try:
+                divide(0)
+            except ZeroDivisionError:
+                dedupe_log.exception("message")
+        try:
+            divide("0")
+        except TypeError:
+            dedupe_log.exception("message")
+    finally:
+        dedupe_log.removeHandler(handler_dedupe)
+
+    render = handler_dedupe.console.file.getvalue()
+    print(render)
+    assert render.count("Traceback") == 2
+    assert "ZeroDivisionError: division by zero (traceback repeated 1 time)" in render
+    assert "ZeroDivisionError: division by zero (traceback repeated 2 times)" in render
+    assert "TypeError" in render
+
+
+def test_background():
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=140,
+        color_system=None,
+        _environ={},
+    )
+    handler_background = RichHandler(
+        console=console,
+        enable_link_path=False,
+        rich_tracebacks=True,
+        background=True,
+    )
+    background_log = logging.getLogger("rich.background")
+    background_log.propagate = False
+    background_log.addHandler(handler_background)
+    try:
+        for index in range(100):
+            background_log.error("message %d", index)
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            background_log.exception("failed")
+        handler_background.flush()
+        render = console.file.getvalue()
+        assert handler_background._render_thread is not None
+        assert handler_background._render_thread.is_alive()
+    finally:
+        background_log.removeHandler(handler_background)
+        handler_background.close()
+
+    print(render)
+    assert handler_background._render_thread is None
+    assert re.findall(r"message (\d+)", render) == [str(index) for index in range(100)]
+    assert "ZeroDivisionError: division by zero" in render
+
+
+def test_background_render_error():
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=140,
+        color_system=None,
+        _environ={},
+    )
+    handler_error = RichHandler(console=console, markup=True, background=True)
+    errors = []
+    handler_error.handleError = errors.append
+    error_log = logging.getLogger("rich.background_error")
+    error_log.propagate = False
+    error_log.addHandler(handler_error)
+    try:
+        error_log.error("[/bold] broken")
+        error_log.error("working")
+        handler_error.flush()
+    finally:
+        error_log.removeHandler(handler_error)
+        handler_error.close()
+
+    assert [record.msg for record in errors] == ["[/bold] broken"]
+    assert "working" in console.file.getvalue()
+
+
+def test_background_queue_full_drop():
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=140,
+        color_system=None,
+        _environ={},
+    )
+    handler_drop = RichHandler(
+        console=console,
+        background=True,
+        queue_size=1,
+        queue_full="drop",
+    )
+    # Block the render thread, so the queue fills
+    console._lock.acquire()
+    drop_log = logging.getLogger("rich.drop")
+    drop_log.propagate = False
+    drop_log.addHandler(handler_drop)
+    try:
+        for index in range(10):
+            drop_log.error("message %d", index)
+        assert handler_drop.dropped_count
+    finally:
+        console._lock.release()
+        drop_log.removeHandler(handler_drop)
+        handler_drop.close()
+
+    render = console.file.getvalue()
+    print(render)
+    assert "log records dropped" in render
+    assert handler_drop.dropped_count == 0
+
+
+def test_queue_full_invalid():
+    with pytest.raises(ValueError):
+        RichHandler(queue_full="wait")
@@ -2,7 +2,7 @@ import pytest
 
 from rich.console import Console
 from rich.errors import MarkupError
-from rich.markup import RE_TAGS, Tag, _parse, escape, render
+from rich.markup import RE_TAGS, Tag, _parse, compile_markup, escape, render
 from rich.text import Span, Text
 
 
@@ -217,3 +217,52 @@ def test_render_meta():
 
     text = render("foo[@click=(1, 2, 3)]bar[/]baz")
     assert text.get_style_at_offset(console, 3).meta == {"@click": (1, 2, 3)}
+
+
+def test_render_cached():
+    text = render("[bold]Hello[/bold] World")
+    text.stylize("red")
+    # Modifying the text doesn't change the cached result
+    assert render("[bold]Hello[/bold] World").spans == [Span(0, 5, "bold")]
+
+
+@pytest.mark.parametrize(
+    "template,args,kwargs",
+    [
+        (
+            "[bold]{user}[/] did [cyan]{action}[/]",
+            (),
+            {"user": "will", "action": "login"},
+        ),
+        ("{} and [b]{}[/b] {x!r:>{width}}", ("foo", 2), {"x": "y", "width": 6}),
+        ("[{0}]Hello[/{0}] [link={1}]{1}[/link]", ("red", "https://example.org"), {}),
+        ("{{[i]{0}[/i]}} {0}", ("", 1), {}),
+        ("\\[{0}] [{0} :smiley:", ("bold",), {}),
+    ],
+)
+def test_compile_markup(template, args, kwargs):
+    text = compile_markup(template).format(*args, **kwargs)
+    expected = render(template.format(*args, **kwargs))
+    assert text.plain == expected.plain
+    assert text.spans == expected.spans
+
+
+def test_compile_markup_values_not_parsed():
+    template = compile_markup("[bold]{user}[/] did [cyan]{action}[/]", style="dim")
+    assert repr(template) == "MarkupTemplate('[bold]{user}[/] did [cyan]{action}[/]')"
+    text = template.format(user="[red]will[/red]", action="\x07:smiley:")
+    assert text.plain == "[red]will[/red] did :smiley:"
+    assert text.style == "dim"
+    assert text.spans == [Span(0, 15, "bold"), Span(20, 28, "cyan")]
+
+
+def test_compile_markup_errors():
+    with pytest.raises(MarkupError):
+        compile_markup("[/bold]{foo}")
+    # Tags are matched before the values are known
+    with pytest.raises(MarkupError):
+        compile_markup("[{0}]x[/bold]")
+    with pytest.raises(ValueError):
+        compile_markup("{} {0}")
+    with pytest.raises(KeyError):
+        compile_markup("{foo}").format(bar=1)
@@ -1,21 +1,29 @@
 # encoding=utf-8
 
+import asyncio
 import io
+import multiprocessing
 import os
+import pickle
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from types import SimpleNamespace
+from typing import Hashable, Optional
 
 import pytest
 
 import rich.progress
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, RenderResult
 from rich.highlighter import NullHighlighter
 from rich.progress import (
     BarColumn,
     DownloadColumn,
+    ExponentialSpeedEstimator,
     FileSizeColumn,
     MofNCompleteColumn,
     Progress,
+    ProgressColumn,
+    ProgressProxy,
     RenderableColumn,
     SpinnerColumn,
     Task,
@@ -26,8 +34,10 @@ from rich.progress import (
     TimeRemainingColumn,
     TotalFileSizeColumn,
     TransferSpeedColumn,
+    WindowSpeedEstimator,
     _TrackThread,
     track,
+    track_async,
 )
 from rich.progress_bar import ProgressBar
 from rich.text import Text
@@ -484,7 +494,84 @@ def test_reset() -> None:
     assert task.visible == False
     assert task.description == "bar"
     assert task.fields == {"example": "egg"}
-    assert not task._progress
+    assert task.speed is None
+
+
+def test_window_speed_estimator() -> None:
+    estimator = WindowSpeedEstimator(period=10, max_samples=4)
+    assert estimator.speed is None
+    estimator.add(0, 5)
+    assert estimator.speed is None
+    estimator.add(1, 2)
+    estimator.add(2, 4)
+    assert estimator.speed == 3
+    # Samples over the maximum are discarded
+    estimator.add(3, 6)
+    estimator.add(4, 8)
+    assert estimator.speed == (4 + 6 + 8) / 3
+    # Samples older than the period are discarded
+    estimator.expire(13)
+    assert estimator.speed == 8
+    estimator.expire(14)
+    assert estimator.speed is None
+    estimator.expire(100)
+    assert estimator.speed is None
+    estimator.add(100, 1)
+    estimator.add(102, 4)
+    assert estimator.speed == 2
+    estimator.reset()
+    assert estimator.speed is None
+
+
+def test_exponential_speed_estimator() -> None:
+    estimator = ExponentialSpeedEstimator(half_life=1)
+    assert estimator.speed is None
+    estimator.add(0, 5)
+    assert estimator.speed is None
+    estimator.add(1, 2)
+    assert estimator.speed == 2
+    # Samples at the same time are combined with the next sample
+    estimator.add(1, 2)
+    assert estimator.speed == 2
+    estimator.add(2, 8)
+    assert estimator.speed == 6
+    estimator.add(4, 16)
+    assert estimator.speed == 7.5
+    estimator.reset()
+    assert estimator.speed is None
+
+
+def test_progress_speed_estimator() -> None:
+    clock = MockClock(auto=False)
+    progress = Progress(get_time=clock, speed_estimate_period=5)
+    window_task_id = progress.add_task("window")
+    exponential_task_id = progress.add_task(
+        "exponential", speed_estimator=lambda: ExponentialSpeedEstimator(half_life=1)
+    )
+    window_task = progress.tasks[window_task_id]
+    assert isinstance(window_task._speed_estimator, WindowSpeedEstimator)
+    assert window_task._speed_estimator.period == 5
+    exponential_task = progress.tasks[exponential_task_id]
+    assert isinstance(exponential_task._speed_estimator, ExponentialSpeedEstimator)
+    assert "speed_estimator" not in exponential_task.fields
+
+    for advance in (1, 2, 4):
+        progress.advance(window_task_id, advance)
+        progress.update(exponential_task_id, advance=advance)
+        clock.tick()
+    assert window_task.speed == 3
+    assert exponential_task.speed == 3
+    assert window_task.time_remaining == 31
+
+    clock.tick(10)
+    progress.update(window_task_id)
+    assert window_task.speed is None
+
+    progress = Progress(get_time=clock, speed_estimator=ExponentialSpeedEstimator)
+    task_id = progress.add_task("foo")
+    assert isinstance(
+        progress.tasks[task_id]._speed_estimator, ExponentialSpeedEstimator
+    )
 
 
 def test_progress_max_refresh() -> None:
@@ -684,6 +771,280 @@ def test_task_progress_column_speed() -> None:
     assert speed_text.plain == "8.9×10⁶ it/s"
 
 
+def test_make_tasks_table_reuses_unchanged_rows() -> None:
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=60,
+        color_system="truecolor",
+        legacy_windows=False,
+        _environ={},
+    )
+    progress = Progress(
+        console=console, auto_refresh=False, get_time=MockClock(auto=False)
+    )
+    task1 = progress.add_task("foo", total=10)
+    task2 = progress.add_task("bar", total=10)
+    console.print(progress)
+    rendered = dict(progress._row_cache)
+
+    progress.advance(task1, 5)
+    with console.capture() as capture:
+        console.print(progress)
+    assert progress._row_cache[task1] is not rendered[task1]
+    assert progress._row_cache[task2] is rendered[task2]
+
+    # Without the cached cells and rows, the output is the same
+    progress._cell_cache.clear()
+    progress._row_cache.clear()
+    with console.capture() as uncached_capture:
+        console.print(progress)
+    assert capture.get() == uncached_capture.get()
+
+    progress.update(task2, visible=False)
+    console.print(progress)
+    assert list(progress._row_cache) == [task1]
+
+
+def test_column_renderable_changed_in_place() -> None:
+    class Counter:
+        def __init__(self) -> None:
+            self.count = 0
+
+        def __rich_console__(
+            self, console: Console, options: ConsoleOptions
+        ) -> RenderResult:
+            yield f"count {self.count}"
+
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=60,
+        color_system="truecolor",
+        legacy_windows=False,
+        _environ={},
+    )
+    text = Text("step 0")
+    counter = Counter()
+    progress = Progress(
+        RenderableColumn(text),
+        RenderableColumn(counter),
+        console=console,
+        auto_refresh=False,
+        get_time=MockClock(auto=False),
+    )
+    progress.add_task("foo")
+    for step in range(1, 3):
+        text.plain = f"step {step}"
+        counter.count = step
+        with console.capture() as capture:
+            console.print(progress)
+        assert f"step {step}" in capture.get()
+        assert f"count {step}" in capture.get()
+
+
+def test_column_render_key() -> None:
+    class CountingColumn(ProgressColumn):
+        def __init__(self) -> None:
+            self.renders = 0
+            super().__init__()
+
+        def get_render_key(self, task: Task) -> Optional[Hashable]:
+            return int(task.completed) // 10
+
+        def render(self, task: Task) -> Text:
+            self.renders += 1
+            return Text(str(int(task.completed) // 10))
+
+    column = CountingColumn()
+    task = Task(1, "test", 100, 0, _get_time=lambda: 1.0)
+    text = column(task)
+    assert column(task) is text
+    task.completed = 5
+    assert column(task) is text
+    assert column.renders == 1
+    task.completed = 15
+    assert column(task).plain == "1"
+    assert column.renders == 2
+
+    class CustomTextColumn(TextColumn):
+        def render(self, task: Task) -> Text:
+            return Text(str(task.completed))
+
+    # Subclasses which override render without get_render_key are always rendered
+    assert CustomTextColumn("{task.description}").get_render_key(task) is None
+
+
+def test_task_progress_column_no_percentage_format() -> None:
+    column = TaskProgressColumn(text_format_no_percentage="{task.completed} done")
+    task = Task(1, "test", None, 0, _get_time=lambda: 1.0)
+    assert column(task).plain == "0 done"
+    task.completed = 3
+    assert column(task).plain == "3 done"
+
+
+def _advance_proxy(proxy: ProgressProxy, task_id: int, steps: int) -> int:
+    for _ in range(steps):
+        proxy.advance(task_id)
+    proxy.update(task_id, status="done")
+    return steps
+
+
+def test_progress_proxy() -> None:
+    progress = Progress(console=Console(file=io.StringIO()), auto_refresh=False)
+    task_id = progress.add_task("foo", total=None)
+    with progress.proxy() as proxy:
+        # A proxy in the parent process updates the progress directly
+        proxy.advance(task_id, 2)
+        assert progress.tasks[0].completed == 2
+        # An unpickled proxy sends updates through a connection
+        worker_proxy = pickle.loads(pickle.dumps(proxy))
+        worker_proxy.advance(task_id, 2)
+        worker_proxy.update(task_id, completed=10)
+        worker_proxy.advance(task_id, 3)
+        worker_proxy.update(task_id, description="bar", status="ok")
+        assert progress.tasks[0].completed == 2
+        worker_proxy.close()
+    task = progress.tasks[0]
+    assert task.completed == 13
+    assert task.description == "bar"
+    assert task.fields == {"status": "ok"}
+
+
+def test_progress_proxy_processes() -> None:
+    progress = Progress(console=Console(file=io.StringIO()), auto_refresh=False)
+    task_id = progress.add_task("foo", total=4000)
+    with progress.proxy() as proxy:
+        with ProcessPoolExecutor(2) as executor:
+            results = list(
+                executor.map(_advance_proxy, [proxy] * 4, [task_id] * 4, [1000] * 4)
+            )
+    assert results == [1000] * 4
+    task = progress.tasks[0]
+    assert task.completed == 4000
+    assert task.finished
+    assert task.fields == {"status": "done"}
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+def test_progress_proxy_fork() -> None:
+    progress = Progress(console=Console(file=io.StringIO()), auto_refresh=False)
+    task_id = progress.add_task("foo", total=200)
+    context = multiprocessing.get_context("fork")
+    with progress.proxy() as proxy:
+        # A forked process inherits the proxy without pickling it
+        processes = [
+            context.Process(target=_advance_proxy, args=(proxy, task_id, 100))
+            for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    assert [process.exitcode for process in processes] == [0, 0]
+    task = progress.tasks[0]
+    assert task.completed == 200
+    assert task.fields == {"status": "done"}
+
+
+def test_progress_async() -> None:
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=60,
+        color_system="truecolor",
+        legacy_windows=False,
+        _environ={},
+    )
+    refreshes = 0
+
+    async def run() -> Progress:
+        nonlocal refreshes
+        async with Progress(console=console, auto_refresh=False) as progress:
+            live_refresh = progress.live.refresh
+
+            def refresh() -> None:
+                nonlocal refreshes
+                refreshes += 1
+                live_refresh()
+
+            progress.live.refresh = refresh  # type: ignore[method-assign]
+
+            async def work(task_id: TaskID) -> None:
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                    progress.update(task_id, advance=1, refresh=True)
+
+            task_ids = [
+                progress.add_task(f"task {index}", total=10) for index in range(10)
+            ]
+            await asyncio.gather(*(work(task_id) for task_id in task_ids))
+        return progress
+
+    progress = asyncio.run(run())
+    assert progress.finished
+    # Refreshes requested in the same iteration of the event loop are combined
+    assert refreshes <= 12
+
+
+async def _async_values(values):
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+def test_track_async() -> None:
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        width=60,
+        color_system="truecolor",
+        legacy_windows=False,
+        _environ={},
+    )
+
+    async def run():
+        return [
+            value
+            async for value in track_async(
+                _async_values(["foo", "bar", "baz"]),
+                "test",
+                total=3,
+                console=console,
+                get_time=MockClock(auto=True),
+            )
+        ]
+
+    assert asyncio.run(run()) == ["foo", "bar", "baz"]
+    result = console.file.getvalue()
+    print(repr(result))
+    assert "100%" in result
+
+
+def test_progress_track_async() -> None:
+    progress = Progress(
+        console=Console(file=io.StringIO()), auto_refresh=False, get_time=MockClock()
+    )
+
+    async def run():
+        async with progress:
+            values = []
+            async for value in progress.track_async(range(5), description="test"):
+                values.append(value)
+                if value == 2:
+                    break
+            return values
+
+    assert asyncio.run(run()) == [0, 1, 2]
+    task = progress.tasks[0]
+    assert task.total == 5
+    # As with track, a value is counted when the next value is requested
+    assert task.completed == 2
+
+
 if __name__ == "__main__":
     _render = render_progress()
     print(_render)
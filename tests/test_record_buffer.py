@@ -0,0 +1,87 @@
+import pytest
+
+from rich._record_buffer import RecordBuffer
+from rich.segment import ControlType, Segment
+from rich.style import Style
+
+BOLD = Style(bold=True)
+
+
+def test_unlimited() -> None:
+    buffer = RecordBuffer()
+    segments = [
+        Segment("foo"),
+        Segment("bar\nbaz\n\n", BOLD),
+        Segment("\x1b[1A", None, [(ControlType.CURSOR_UP, 1)]),
+        Segment("qux"),
+    ]
+    buffer.extend(segments)
+    assert "".join(segment.text for segment in buffer) == "foobar\nbaz\n\n\x1b[1Aqux"
+    assert list(buffer) == [
+        Segment("foo"),
+        Segment("bar\n", BOLD),
+        Segment("baz\n", BOLD),
+        Segment("\n", BOLD),
+        segments[2],
+        Segment("qux"),
+    ]
+    assert len(buffer) == 4
+    assert buffer.size == 19
+    buffer.clear()
+    assert list(buffer) == []
+    assert len(buffer) == 0
+    assert buffer.size == 0
+
+
+def test_max_lines() -> None:
+    buffer = RecordBuffer(max_lines=2)
+    buffer.extend([Segment("1\n2\n3\n")])
+    assert "".join(segment.text for segment in buffer) == "2\n3\n"
+    buffer.extend([Segment("4")])
+    assert "".join(segment.text for segment in buffer) == "3\n4"
+    buffer.extend([Segment("5\n6"), Segment("7\n")])
+    assert "".join(segment.text for segment in buffer) == "45\n67\n"
+    assert len(buffer) == 2
+
+
+def test_max_bytes() -> None:
+    buffer = RecordBuffer(max_bytes=10)
+    buffer.extend([Segment("foo\n"), Segment("bär\n"), Segment("baz\n")])
+    assert "".join(segment.text for segment in buffer) == "bär\nbaz\n"
+    assert buffer.size == 9
+    # The start of an incomplete line is discarded if it doesn't fit
+    buffer.extend([Segment("x" * 20)])
+    assert "".join(segment.text for segment in buffer) == "x" * 10
+    assert buffer.size == 10
+    assert len(buffer) == 1
+
+
+def test_max_bytes_incomplete_line() -> None:
+    buffer = RecordBuffer(max_bytes=10)
+    # Progress output rewrites a line without ever ending it
+    for step in range(100):
+        buffer.extend([Segment(f"\rstep {step}", BOLD)])
+        assert buffer.size <= 10
+    assert list(buffer) == [Segment("98", BOLD), Segment("\rstep 99", BOLD)]
+    # Control codes are discarded whole
+    erase = Segment("\x1b[2K", None, [(ControlType.ERASE_IN_LINE, 2)])
+    buffer.extend([erase, Segment("abcdefg")])
+    assert list(buffer) == [Segment("abcdefg")]
+    assert buffer.size == 7
+    buffer.extend([Segment("\nfoo")])
+    assert "".join(segment.text for segment in buffer) == "foo"
+
+
+def test_max_bytes_split_character() -> None:
+    buffer = RecordBuffer(max_bytes=5)
+    buffer.extend([Segment("äöü")])
+    # The character split by the cut is discarded
+    assert list(buffer) == [Segment("öü")]
+    assert buffer.size == 4
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        RecordBuffer(max_lines=0)
+    with pytest.raises(ValueError):
+        RecordBuffer(max_bytes=0)
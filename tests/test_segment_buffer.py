@@ -0,0 +1,143 @@
+from io import StringIO
+from typing import List
+
+import pytest
+
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.segment import ControlType, Segment
+from rich.segment_buffer import SegmentBuffer, SegmentBufferLines, StyleTable
+from rich.style import Style
+from rich.table import Table
+
+BOLD = Style(bold=True)
+RED = Style(color="red")
+LINK = Style(link="https://example.org")
+
+SEGMENTS = [
+    Segment("Hello, "),
+    Segment("World!", BOLD),
+    Segment("\n"),
+    Segment("foo", RED),
+    Segment("bar", RED),
+    Segment("\x1b[1A", None, [(ControlType.CURSOR_UP, 1)]),
+    Segment("baz\nqux\n\n", BOLD),
+    Segment("💩 and 😽 and ", RED),
+    Segment("link", LINK),
+    Segment(""),
+    Segment("end", Style()),
+]
+
+
+def render_table() -> List[Segment]:
+    table = Table(title="Movies", header_style="bold magenta")
+    table.add_column("Released", style="cyan")
+    table.add_column("Title", style="bold green")
+    table.add_row("Dec 20, 2019", "[b]Star Wars[/]: The [i]Rise[/i] of Skywalker")
+    table.add_row("May 25, 2018", "Solo: A [red][b]Star Wars[/] Story[/]")
+    console = Console(file=StringIO(), width=40)
+    return list(console.render(table))
+
+
+@pytest.mark.parametrize("segments", [SEGMENTS, render_table(), []])
+def test_from_segments(segments: List[Segment]) -> None:
+    buffer = SegmentBuffer.from_segments(segments)
+    assert len(buffer) == len(segments)
+    assert buffer.to_segments() == segments
+    assert buffer.text == "".join(segment.text for segment in segments)
+    assert buffer.cell_length == sum(segment.cell_length for segment in segments)
+    if segments:
+        assert buffer[1] == segments[1]
+        assert buffer[-1] == segments[-1]
+    with pytest.raises(IndexError):
+        buffer[len(segments)]
+
+
+def test_style_table() -> None:
+    style_table = StyleTable()
+    assert style_table.add(None) == 0
+    assert style_table.add(BOLD) == 1
+    assert style_table.add(Style.parse("bold")) == 1
+    assert style_table.add(RED) == 2
+    assert len(style_table) == 3
+    buffer = SegmentBuffer.from_segments(SEGMENTS, style_table)
+    assert buffer.style_table is style_table
+    assert len(style_table) == 5
+
+
+@pytest.mark.parametrize("segments", [SEGMENTS, render_table()])
+def test_simplify(segments: List[Segment]) -> None:
+    simplified = SegmentBuffer.from_segments(segments).simplify()
+    assert simplified.text == "".join(segment.text for segment in segments)
+    assert [(segment.text, segment.style) for segment in simplified] == [
+        (segment.text, segment.style) for segment in Segment.simplify(segments)
+    ]
+
+
+@pytest.mark.parametrize("segments", [SEGMENTS, render_table()])
+def test_split_lines(segments: List[Segment]) -> None:
+    lines = SegmentBuffer.from_segments(segments).split_lines()
+    expected = list(Segment.split_lines(segments))
+    assert len(lines) == len(expected)
+    assert lines.to_lines() == expected
+    assert [line.to_segments() for line in lines] == expected
+    assert lines.get_shape() == Segment.get_shape(expected)
+
+
+@pytest.mark.parametrize("length", [0, 3, 8, 20, 40])
+@pytest.mark.parametrize("pad", [False, True])
+def test_split_and_crop_lines(length: int, pad: bool) -> None:
+    lines = SegmentBuffer.from_segments(SEGMENTS).split_and_crop_lines(
+        length, style=BOLD, pad=pad
+    )
+    expected = [
+        Segment.adjust_line_length(line, length, style=BOLD, pad=pad)
+        for line in Segment.split_lines(SEGMENTS)
+    ]
+    assert lines.to_lines() == expected
+
+
+@pytest.mark.parametrize(
+    "cuts", [[], [0], [0, 5], [4, 20], [1, 2, 3, 30], [5, 10, 12, 100, 200]]
+)
+def test_divide(cuts: List[int]) -> None:
+    segments = [segment for segment in SEGMENTS if "\n" not in segment.text]
+    portions = SegmentBuffer.from_segments(segments).divide(cuts)
+    expected = list(Segment.divide(segments, cuts))
+    assert [portion.to_segments() for portion in portions] == expected
+
+
+@pytest.mark.parametrize(
+    "color_system", [None, ColorSystem.STANDARD, ColorSystem.TRUECOLOR]
+)
+@pytest.mark.parametrize("not_terminal", [False, True])
+def test_render(color_system: ColorSystem, not_terminal: bool) -> None:
+    for segments in (SEGMENTS, render_table()):
+        expected = []
+        for text, style, control in segments:
+            if style:
+                expected.append(style.render(text, color_system=color_system))
+            elif not (not_terminal and control):
+                expected.append(text)
+        buffer = SegmentBuffer.from_segments(segments)
+        assert buffer.render(color_system, not_terminal=not_terminal) == "".join(
+            expected
+        )
+
+
+def test_lines_render() -> None:
+    segments = render_table()
+    lines = SegmentBufferLines.from_lines(Segment.split_lines(segments))
+    assert lines.render(ColorSystem.TRUECOLOR) == "".join(
+        segment.style.render(segment.text) if segment.style else segment.text
+        for segment in segments
+    )
+
+
+def test_print() -> None:
+    segments = render_table()
+    console = Console(file=StringIO(), width=40, force_terminal=True)
+    console.print(SegmentBuffer.from_segments(segments), end="")
+    console.print(SegmentBuffer.from_segments(segments).split_lines(), end="")
+    expected = console._render_buffer(segments)
+    assert console.file.getvalue() == expected * 2
@@ -0,0 +1,192 @@
+import io
+import re
+from typing import List, Optional, Tuple
+
+import pytest
+
+from rich._sgr_renderer import (
+    NULL_STATE,
+    get_sgr_state,
+    get_sgr_transition,
+    sgr_render,
+)
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.segment import ControlType, Segment
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+RE_ESCAPE = re.compile(r"\x1b\[([0-9;]*)m|\x1b\]8;(.*?);(.*?)\x1b\\")
+
+RESETS = {
+    "22": {"1", "2"},
+    "23": {"3"},
+    "24": {"4", "21"},
+    "25": {"5", "6"},
+    "27": {"7"},
+    "28": {"8"},
+    "29": {"9"},
+    "54": {"51", "52"},
+    "55": {"53"},
+}
+
+
+def simulate(output: str) -> List[Tuple[str, frozenset, str, str, Optional[str]]]:
+    """Interpret output as a terminal would, and return each character with its state."""
+    attributes: set = set()
+    color = bgcolor = ""
+    link: Optional[str] = None
+    cells = []
+    position = 0
+    for match in RE_ESCAPE.finditer(output):
+        for character in output[position : match.start()]:
+            cells.append((character, frozenset(attributes), color, bgcolor, link))
+        position = match.end()
+        sgr, link_params, url = match.groups()
+        if sgr is None:
+            # Link ids are random, so only the URL is compared
+            link = url or None
+            continue
+        codes = iter(sgr.split(";"))
+        for code in codes:
+            if code == "0":
+                attributes.clear()
+                color = bgcolor = ""
+            elif code in RESETS:
+                attributes -= RESETS[code]
+            elif code in ("38", "48"):
+                mode = next(codes)
+                values = [next(codes) for _ in range(1 if mode == "5" else 3)]
+                value = ";".join([code, mode, *values])
+                if code == "38":
+                    color = value
+                else:
+                    bgcolor = value
+            elif code == "39":
+                color = ""
+            elif code == "49":
+                bgcolor = ""
+            elif 30 <= int(code) <= 37 or 90 <= int(code) <= 97:
+                color = code
+            elif 40 <= int(code) <= 47 or 100 <= int(code) <= 107:
+                bgcolor = code
+            else:
+                attributes.add(code)
+    for character in output[position:]:
+        cells.append((character, frozenset(attributes), color, bgcolor, link))
+    return cells
+
+
+def render_both(renderable, **kwargs) -> Tuple[str, str]:
+    outputs = []
+    for optimize_sgr in (False, True):
+        console = Console(
+            file=io.StringIO(),
+            force_terminal=True,
+            width=60,
+            legacy_windows=False,
+            optimize_sgr=optimize_sgr,
+            **kwargs,
+        )
+        console.print(renderable)
+        outputs.append(console.file.getvalue())
+    return outputs[0], outputs[1]
+
+
+def make_styles() -> List[Style]:
+    return [
+        Style(bold=True, color="red"),
+        Style(bold=True, color="blue", bgcolor="white"),
+        Style(dim=True, color="red"),
+        Style(bold=True, dim=True, italic=True),
+        Style(italic=True),
+        Style(underline2=True, strike=True),
+        Style(underline=True),
+        Style(frame=True, overline=True),
+        Style(encircle=True),
+        Style(reverse=True, blink=True),
+        Style(blink2=True, conceal=True),
+        Style(color="#ff0000", bgcolor="#00ff00"),
+        Style(color="color(200)", bgcolor="color(17)"),
+        Style(bgcolor="red"),
+        Style(color="default", bgcolor="default"),
+        Style(),
+    ]
+
+
+@pytest.mark.parametrize("color_system", ["standard", "256", "truecolor"])
+def test_equivalent_output(color_system: str) -> None:
+    text = Text()
+    for index, style in enumerate(make_styles() * 2):
+        text.append(f"word{index} ", style=style)
+    text.append("link", style="bold link https://example.org")
+    text.append(" more ", style="bold")
+    text.append("another", style="link https://example.org/2")
+    plain, optimized = render_both(text, color_system=color_system)
+    assert simulate(plain) == simulate(optimized)
+    assert len(optimized) < len(plain)
+
+
+def test_equivalent_output_table() -> None:
+    table = Table(title="Movies", style="on blue", header_style="bold magenta")
+    table.add_column("Released", style="cyan")
+    table.add_column("Title", style="bold green")
+    table.add_row("Dec 20, 2019", "[b]Star Wars[/]: The [i]Rise[/i] of Skywalker")
+    table.add_row("May 25, 2018", "Solo: A [red][b]Star Wars[/] Story[/]")
+    plain, optimized = render_both(table, color_system="truecolor")
+    assert simulate(plain) == simulate(optimized)
+    assert len(optimized) < len(plain)
+
+
+def test_sgr_transition() -> None:
+    bold_red = get_sgr_state(Style.parse("bold red"), ColorSystem.STANDARD)
+    bold_blue = get_sgr_state(Style.parse("bold blue"), ColorSystem.STANDARD)
+    dim_blue = get_sgr_state(Style.parse("dim blue"), ColorSystem.STANDARD)
+    assert get_sgr_transition(NULL_STATE, bold_red) == "\x1b[1;31m"
+    assert get_sgr_transition(bold_red, bold_red) == ""
+    assert get_sgr_transition(bold_red, bold_blue) == "\x1b[34m"
+    assert get_sgr_transition(bold_blue, dim_blue) == "\x1b[22;2m"
+    assert get_sgr_transition(bold_blue, NULL_STATE) == "\x1b[0m"
+
+
+def test_sgr_render() -> None:
+    bold = Style(bold=True)
+    segments = [
+        Segment("foo", bold),
+        Segment("bar", bold + Style(italic=True)),
+        Segment("baz", bold),
+        Segment("\n"),
+        Segment("\x1b[1A", None, [(ControlType.CURSOR_UP, 1)]),
+    ]
+    assert (
+        sgr_render(segments, ColorSystem.TRUECOLOR)
+        == "\x1b[1mfoo\x1b[3mbar\x1b[23mbaz\x1b[0m\n\x1b[1A"
+    )
+    assert (
+        sgr_render(segments, ColorSystem.TRUECOLOR, not_terminal=True)
+        == "\x1b[1mfoo\x1b[3mbar\x1b[23mbaz\x1b[0m\n"
+    )
+    assert sgr_render(segments, None) == "foobarbaz\n\x1b[1A"
+
+
+def test_sgr_render_links() -> None:
+    link = Style(link="https://example.org")
+    segments = [
+        Segment("foo", link),
+        Segment("bar", link),
+        Segment("baz"),
+    ]
+    output = sgr_render(segments, ColorSystem.TRUECOLOR)
+    assert output.count("\x1b]8;id=") == 1
+    assert output.endswith("foobar\x1b]8;;\x1b\\baz")
+    assert "\x1b]8" not in sgr_render(
+        segments, ColorSystem.TRUECOLOR, legacy_windows=True
+    )
+
+
+def test_no_color() -> None:
+    plain, optimized = render_both(
+        Text("foo", style="bold red on blue"), color_system="truecolor", no_color=True
+    )
+    assert simulate(plain) == simulate(optimized)
@@ -0,0 +1,29 @@
+from rich._span_index import SpanIndex
+from rich.text import Span
+
+
+def test_span_index():
+    spans = [Span(0, 5, "bold"), Span(3, 8, "red"), Span(6, 6, "blue")]
+    span_index = SpanIndex(spans)
+    assert span_index.boundaries == [0, 3, 5, 6, 8]
+    assert span_index.active == [(0,), (0, 1), (1,), (1,), ()]
+    assert span_index.get_spans_at(-1) == ()
+    assert span_index.get_spans_at(4) == (0, 1)
+    assert span_index.get_spans_at(6) == (1,)
+    assert span_index.get_spans_at(100) == ()
+
+
+def test_span_index_update():
+    spans = [Span(0, 2, "bold")]
+    span_index = SpanIndex(spans)
+    spans.extend([Span(2, 4, "red"), Span(6, 6, "blue"), Span(6, 9, "green")])
+    span_index.update()
+    assert span_index.count == 4
+    assert span_index.boundaries == SpanIndex(spans).boundaries
+    assert span_index.active == SpanIndex(spans).active
+
+    # A span which doesn't start at the end causes a rebuild
+    spans.append(Span(1, 7, "italic"))
+    span_index.update()
+    assert span_index.active == SpanIndex(spans).active
+    assert span_index.get_spans_at(6) == (3, 4)
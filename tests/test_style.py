@@ -1,8 +1,10 @@
+import pickle
+
 import pytest
 
 from rich import errors
 from rich.color import Color, ColorSystem, ColorType
-from rich.style import Style, StyleStack
+from rich.style import Style, StyleStack, _style_interner, _StyleInterner
 
 
 def test_str():
@@ -265,3 +267,80 @@ def test_clear_meta_and_links_clears_hash():
 
     clear_style = style.clear_meta_and_links()
     assert clear_style._hash is None
+
+
+def test_interned_id():
+    interner = _style_interner
+    style1 = Style(bold=True, color="magenta")
+    style2 = Style(color="magenta", bold=True)
+    assert style1._id == style2._id == 0
+    style_id = interner.get_id(style1)
+    assert style_id > 0
+    assert interner.get_id(style2) == style_id
+    assert style2._id == style_id
+    assert style1.copy()._id == style_id
+    assert interner.get_id(Style(italic=True)) != style_id
+    interner.clear()
+    # IDs are not re-used once cleared
+    assert interner.get_id(Style(bold=True, color="magenta")) > style_id
+    assert style1 + Style(italic=True) == Style(bold=True, italic=True, color="magenta")
+
+
+def test_add_memoized():
+    style1 = Style(bold=True)
+    style2 = Style(color="red")
+    combined = style1 + style2
+    assert Style(bold=True) + Style(color="red") is combined
+    linked = style1 + Style(link="https://example.org")
+    assert linked.link == "https://example.org"
+    assert (style1 + Style(link="https://example.org")) is not linked
+
+
+def test_interner_maxsize():
+    interner = _StyleInterner(maxsize=2)
+    for index in range(5):
+        interner.get_id(Style(color=f"color({index})"))
+    assert len(interner.ids) <= 2
+
+
+def test_render_color_systems():
+    style = Style(color="#ff0000")
+    assert style.render("foo", color_system=ColorSystem.TRUECOLOR) == (
+        "\x1b[38;2;255;0;0mfoo\x1b[0m"
+    )
+    assert style.render("foo", color_system=ColorSystem.STANDARD) == (
+        "\x1b[31mfoo\x1b[0m"
+    )
+    assert Style(color="#ff0000").render("foo", color_system=ColorSystem.STANDARD) == (
+        "\x1b[31mfoo\x1b[0m"
+    )
+
+
+def test_pickle_id():
+    style = Style(bold=True, link="https://example.org")
+    _style_interner.get_id(style)
+    unpickled = pickle.loads(pickle.dumps(style))
+    assert unpickled == style
+    assert unpickled._id == 0
+    assert unpickled.link_id == style.link_id
+
+
+def test_unpickle_earlier_version():
+    # Style(color="red", bold=True, link="https://example.org") pickled by rich 14
+    data = (
+        b"\x80\x02crich.style\nStyle\nq\x00)\x81q\x01N}q\x02(X\x06\x00\x00\x00_c"
+        b"olorq\x03crich.color\nColor\nq\x04(X\x03\x00\x00\x00redq\x05crich.colo"
+        b"r\nColorType\nq\x06K\x01\x85q\x07Rq\x08K\x01Ntq\t\x81q\nX\x08\x00\x00\x00_"
+        b"bgcolorq\x0bNX\x0b\x00\x00\x00_attributesq\x0cK\x01X\x0f\x00\x00\x00_s"
+        b"et_attributesq\rK\x01X\x05\x00\x00\x00_linkq\x0eX\x13\x00\x00\x00https"
+        b"://example.orgq\x0fX\x08\x00\x00\x00_link_idq\x10X\x13\x00\x00\x001043"
+        b"708792590801854q\x11X\x05\x00\x00\x00_ansiq\x12NX\x11\x00\x00\x00_styl"
+        b"e_definitionq\x13NX\x05\x00\x00\x00_hashq\x14NX\x05\x00\x00\x00_nullq\x15\x89X"
+        b"\x05\x00\x00\x00_metaq\x16Nu\x86q\x17b."
+    )
+    style = pickle.loads(data)
+    assert style == Style(color="red", bold=True, link="https://example.org")
+    assert style._id == 0
+    assert style + Style(italic=True) == Style(
+        color="red", bold=True, italic=True, link="https://example.org"
+    )
@@ -137,6 +137,18 @@ def test_python_render_line_range_indent_guides() -> None:
     assert rendered_syntax == expected
 
 
+@pytest.mark.parametrize("line_range", [(150, 160), (1, 5), (155, None), (500, 600)])
+def test_python_render_line_range_checkpoints(monkeypatch, line_range) -> None:
+    monkeypatch.setattr("rich._lexed_code.CHECKPOINT_LINES", 7)
+    code = CODE * 20
+    syntax = Syntax(code, lexer="python", line_numbers=True, line_range=line_range)
+    syntax.stylize_range("reverse", (152, 4), (170, 0))
+    rendered_syntax = render(syntax)
+    # Lex the whole code without checkpoints
+    monkeypatch.setattr("rich.syntax.get_lexed_code", lambda lexer, code: None)
+    assert rendered_syntax == render(syntax)
+
+
 def test_python_render_indent_guides() -> None:
     syntax = Panel.fit(
         Syntax(
@@ -9,7 +9,7 @@ from rich import box, errors
 from rich.console import Console
 from rich.measure import Measurement
 from rich.style import Style
-from rich.table import Column, Table
+from rich.table import Column, Table, TableStream, TableView
 from rich.text import Text
 
 
@@ -406,6 +406,217 @@ def test_padding_width():
     assert output == expected
 
 
+def test_measurement_cache() -> None:
+    table = Table()
+    table.add_column("Name")
+    text = Text("foo")
+    table.add_row("[bold]Hello[/bold]")
+    table.add_row(text)
+    console = Console(file=io.StringIO(), width=40)
+    assert console.measure(table) == Measurement(9, 9)
+    measurements = dict(table._measurements)
+    assert measurements
+    assert console.measure(table) == Measurement(9, 9)
+    assert table._measurements == measurements
+
+    # Cells are cached by their content, so changes are measured
+    text.append(" bar baz qux")
+    assert console.measure(table) == Measurement(9, 19)
+    table.add_row("[bold]Hello[/bold], World!")
+    assert console.measure(table) == Measurement(10, 19)
+
+    # Markup changes the measurement of strings
+    assert console.measure(table, options=console.options.update(markup=False)) == (
+        Measurement(23, 30)
+    )
+
+
+def test_measurement_cache_not_cached() -> None:
+    table = Table()
+    table.add_column("Name")
+    inner = Table.grid()
+    inner.add_row("foo")
+    table.add_row(inner)
+    console = Console(file=io.StringIO(), width=40)
+    assert console.measure(table) == Measurement(8, 8)
+    inner.add_row("foo bar baz")
+    assert console.measure(table) == Measurement(8, 15)
+
+
+def make_view_table(rows: int) -> Table:
+    table = Table(title="Numbers", row_styles=["", "dim"], show_footer=True)
+    table.add_column("Number", footer="Total")
+    table.add_column("Name", footer=str(rows))
+    for number in range(rows):
+        table.add_row(str(number), f"Row {number}" + " more" * (number % 3))
+    return table
+
+
+def render(renderable, width: int = 30, height=None, color_system=None) -> str:
+    console = Console(file=io.StringIO(), width=width, color_system=color_system)
+    console.print(renderable, height=height)
+    return console.file.getvalue()
+
+
+def test_table_view_all_rows() -> None:
+    table = make_view_table(20)
+    assert render(TableView(table)) == render(table)
+    console = Console(file=io.StringIO(), width=30)
+    assert console.measure(TableView(table)) == console.measure(table)
+
+
+def test_table_view_window() -> None:
+    table = make_view_table(100)
+    output = render(TableView(table, offset=50, height=10))
+    assert output.count("\n") == 10
+    assert "│ 50     │ Row 50 more more │" in output
+    assert "│ 52     │ Row 52 more      │" in output
+    assert "Row 53" not in output and "Row 49" not in output
+    assert "Total" in output
+
+
+def test_table_view_row_styles() -> None:
+    table = make_view_table(10)
+    full_lines = render(table, color_system="truecolor").splitlines()
+    view_lines = render(
+        TableView(table, offset=5), color_system="truecolor"
+    ).splitlines()
+    # Title and header, then rows from the offset
+    assert view_lines[:4] == full_lines[:4]
+    assert view_lines[4:] == full_lines[9:]
+
+
+def test_table_view_options_height() -> None:
+    table = make_view_table(100)
+    output = render(TableView(table, offset=20), height=12)
+    assert output.count("\n") == 12
+
+
+def test_table_view_multi_line_rows() -> None:
+    table = make_view_table(100)
+    # Each row is two or three lines high
+    output = render(TableView(table, offset=1, height=16), width=20)
+    assert output.count("\n") <= 16
+    assert output.count("\n") >= 14
+
+
+def test_table_view_sample() -> None:
+    table = make_view_table(100)
+    table.add_row("0", "This cell isn't in the sample")
+    view = TableView(table, sample_size=10)
+    assert len(view._get_sample().rows) == 10
+    # The last row is wrapped, since it wasn't measured
+    assert render(view) != render(table)
+    assert "│ 0      │ This cell isn't  │" in render(view)
+
+
+STREAM_ROWS = [
+    (str(number), "x" * (number % 5) + " y" * (number % 3)) for number in range(7)
+]
+
+
+@pytest.mark.parametrize(
+    "table_options",
+    [
+        {},
+        {"show_lines": True},
+        {"show_footer": True},
+        {"show_header": False},
+        {"box": None},
+        {"show_edge": False},
+        {"leading": 1},
+        {"padding": (1, 2)},
+        {"box": box.ROUNDED, "show_header": False, "show_footer": True},
+    ],
+)
+@pytest.mark.parametrize("row_count", [0, 1, 2, 7])
+def test_table_stream(table_options, row_count: int) -> None:
+    def make_table() -> Table:
+        table = Table(
+            title="Title", caption="Caption", row_styles=["", "dim"], **table_options
+        )
+        table.add_column("Number", footer="Total")
+        table.add_column("Name", footer="foo")
+        return table
+
+    table = make_table()
+    for row in STREAM_ROWS[:row_count]:
+        table.add_row(*row)
+    table_stream = TableStream(make_table(), STREAM_ROWS[:row_count], sample_size=3)
+    assert render(table_stream, color_system="truecolor") == render(
+        table, color_system="truecolor"
+    )
+
+
+@pytest.mark.parametrize("padding", [(1, 1), (0, 1, 1, 1), (1, 1, 0, 1), (2, 0, 1, 2)])
+@pytest.mark.parametrize("pad_edge", [True, False])
+@pytest.mark.parametrize("collapse_padding", [True, False])
+@pytest.mark.parametrize(
+    "table_options",
+    [{}, {"show_header": False}, {"show_footer": True}, {"show_lines": True}],
+)
+@pytest.mark.parametrize("row_count", [1, 2, 4])
+def test_table_stream_padding(
+    padding, pad_edge: bool, collapse_padding: bool, table_options, row_count: int
+) -> None:
+    def make_table() -> Table:
+        table = Table(
+            padding=padding,
+            pad_edge=pad_edge,
+            collapse_padding=collapse_padding,
+            **table_options,
+        )
+        table.add_column("Number", footer="Total")
+        table.add_column("Name", footer="foo")
+        return table
+
+    table = make_table()
+    for row in STREAM_ROWS[:row_count]:
+        table.add_row(*row)
+    table_stream = TableStream(make_table(), STREAM_ROWS[:row_count])
+    assert render(table_stream) == render(table)
+
+
+def test_table_stream_no_columns() -> None:
+    assert render(TableStream(Table(), [])) == "\n"
+
+
+def test_table_stream_fixed_widths() -> None:
+    table = Table(Column("Number", width=6), Column("Name", width=4))
+    output = render(TableStream(table, [("1", "foo"), ("2", "foo bar")]))
+    assert output.splitlines()[-3:] == [
+        "│ 2      │ foo  │",
+        "│        │ bar  │",
+        "└────────┴──────┘",
+    ]
+
+
+def test_table_stream_invalid_rows() -> None:
+    table = Table("foo")
+    with pytest.raises(ValueError):
+        render(TableStream(table, [("1", "2")]))
+    with pytest.raises(errors.NotRenderableError):
+        render(TableStream(table, [(object(),)]))
+    assert render(TableStream(table, [(None,)])) == render(TableStream(table, [("",)]))
+
+
+def test_print_table_stream() -> None:
+    console = Console(file=io.StringIO(), width=30)
+
+    def get_rows():
+        for number in range(5):
+            if number > 2:
+                # A row is written once the next row is known not to be the last
+                assert f"Row {number - 2}" in console.file.getvalue()
+            yield (str(number), f"Row {number}")
+
+    table = Table("Number", "Name")
+    console.print_table_stream(table, get_rows(), sample_size=2)
+    output = console.file.getvalue()
+    assert "Row 4" in output
+    assert output.endswith("└────────┴───────┘\n")
+
+
 if __name__ == "__main__":
     render = render_tables()
     print(render)
@@ -6,8 +6,9 @@ import pytest
 
 from rich.console import Console, Group
 from rich.measure import Measurement
+from rich.segment import Segment
 from rich.style import Style
-from rich.text import Span, Text
+from rich.text import SPAN_INDEX_THRESHOLD, Span, Text
 
 
 def test_span():
@@ -446,6 +447,18 @@ def test_divide():
     ]
 
 
+def test_divide_spans_across_lines():
+    text = Text("foo bar baz", spans=[Span(2, 9, "bold"), Span(4, 4, "red")])
+    lines = text.divide([4, 4, 8])
+    assert [str(line) for line in lines] == ["foo ", "", "bar ", "baz"]
+    assert [line._spans for line in lines] == [
+        [Span(2, 4, "bold")],
+        [],
+        [Span(0, 4, "bold")],
+        [Span(0, 1, "bold")],
+    ]
+
+
 def test_right_crop():
     text = Text()
     text.append("foobar", "red")
@@ -896,6 +909,39 @@ def test_get_style_at_offset():
     assert text.get_style_at_offset(console, 6) == Style(bold=True)
 
 
+def test_span_index(monkeypatch):
+    console = Console()
+    text = Text("a b c d " * 10, style="italic")
+    for offset in range(0, 40, 2):
+        text.stylize("bold" if offset % 4 else "red", offset, offset + 1)
+    text.stylize("underline", 10, 30)
+    assert len(text._spans) >= SPAN_INDEX_THRESHOLD
+    assert list(text.render(console))[:3] == [
+        Segment("a", Style.parse("italic red")),
+        Segment(" ", Style.parse("italic")),
+        Segment("b", Style.parse("italic bold")),
+    ]
+    assert text._span_index is not None
+
+    assert text.get_style_at_offset(console, 12) == Style.parse("italic red underline")
+    assert text.get_style_at_offset(console, 31) == Style.parse("italic")
+    assert text[14].spans == [Span(0, 1, "bold"), Span(0, 1, "underline")]
+
+    # The index is updated when spans are appended
+    text.append("foo", "blue")
+    assert text.get_style_at_offset(console, -1) == Style.parse("italic blue")
+
+    # Modifying the spans discards the index
+    text.spans[0] = Span(0, 2, "green")
+    assert text._span_index is None
+    assert text.get_style_at_offset(console, 1) == Style.parse("italic green")
+
+    # Render is the same without the index
+    indexed_segments = list(text.render(console))
+    monkeypatch.setattr("rich.text.SPAN_INDEX_THRESHOLD", 1000)
+    assert list(text.copy().render(console)) == indexed_segments
+
+
 @pytest.mark.parametrize(
     "input, count, expected",
     [
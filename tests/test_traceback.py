@@ -1,4 +1,5 @@
 import io
+import os
 import re
 import sys
 from typing import List
@@ -397,3 +398,32 @@ def test_recursive_exception() -> None:
             console.print_exception(show_locals=True)
 
     bar()
+
+
+def test_frame_syntax_cache(tmp_path) -> None:
+    import linecache
+
+    path = tmp_path / "error.py"
+    path.write_text("def error():\n    raise ValueError('foo')\n")
+    code = compile(path.read_text(), str(path), "exec")
+    namespace: dict = {}
+    exec(code, namespace)
+
+    def render_error() -> str:
+        console = Console(width=100, file=io.StringIO(), color_system=None)
+        try:
+            namespace["error"]()
+        except ValueError:
+            console.print(Traceback())
+        return console.file.getvalue()
+
+    first_render = render_error()
+    assert "raise ValueError('foo')" in first_render
+    # Rendered again from the cache
+    assert render_error() == first_render
+
+    # A modified file is highlighted again
+    path.write_text("def error():\n    raise ValueError('bar')\n")
+    os.utime(path, ns=(0, 0))
+    linecache.checkcache(str(path))
+    assert "raise ValueError('bar')" in render_error()
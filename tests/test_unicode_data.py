@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
 import pytest
 
-from rich._unicode_data import VERSIONS, _parse_version, load
+import rich
+
+from rich._unicode_data import VERSIONS, _parse_version, load, load_width_table
+from rich._unicode_data._packed import pack, unpack
+from rich._unicode_data._width_table import WidthTable
 
 
 def test_load():
@@ -62,3 +73,88 @@ def test_load_version_invalid() -> None:
     assert load("foo").unicode_version == "17.0.0"
     assert load("a.b.c").unicode_version == "17.0.0"
     assert load("1.2.3a").unicode_version == "17.0.0"
+
+
+def _get_width(codepoint: int, widths: list[tuple[int, int, int]]) -> int:
+    """Get the width of a codepoint by searching the ranges in a cell table."""
+    if 0 < codepoint < 32 or 0x7F <= codepoint < 0xA0:
+        return 0
+    for start, end, width in widths:
+        if start <= codepoint <= end:
+            return width
+    return 1
+
+
+@pytest.mark.parametrize("version", ["4.1.0", "9.0.0", "17.0.0"])
+def test_width_table(version: str) -> None:
+    """Check the width table agrees with the ranges in the cell table."""
+    widths = load(version).widths
+    width_table = load_width_table(version)
+    width_table._compile()
+    for start, end, _width in widths:
+        for codepoint in {max(0, start - 1), start, end, min(end + 1, 0x10FFFF)}:
+            expected = _get_width(codepoint, widths)
+            assert width_table.get_width(codepoint) == expected
+            assert width_table.cell_len(chr(codepoint)) == expected
+    for codepoint in (0, 1, 31, 32, 0x7E, 0x7F, 0x9F, 0xA0, 0x10FFFF):
+        assert width_table.get_width(codepoint) == _get_width(codepoint, widths)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_width_table_cell_len(compiled: bool) -> None:
+    table = load_width_table("17.0.0")
+    width_table = WidthTable(table.index, table.pages, table.widths)
+    if compiled:
+        width_table._compile()
+    assert width_table.cell_len("") == 0
+    assert width_table.cell_len("hello") == 5
+    assert width_table.cell_len("こんにちは, world") == 17
+    assert width_table.cell_len("a\u0301\x1b") == 1
+    # Characters outside of the Basic Multilingual Plane
+    assert width_table.cell_len("💩 and 😽") == 9
+    assert width_table.cell_len("\U000e0100x") == 1
+
+
+def test_load_width_table_shared() -> None:
+    """Aliases of the same unicode version share a width table."""
+    assert load_width_table("latest") is load_width_table("17.0.0")
+
+
+def test_pack_unpack() -> None:
+    widths = [(0x300, 0x36F, 0), (0x1100, 0x115F, 2), (0x1F300, 0x1F5FF, 2)]
+    narrow_to_wide = frozenset(["#", "\u2764"])
+    width_table = WidthTable.from_widths(widths)
+    packed = pack(widths, narrow_to_wide, width_table)
+    unpacked_widths, unpacked_narrow_to_wide, unpacked_table = unpack(packed)
+    assert unpacked_widths == widths
+    assert unpacked_narrow_to_wide == narrow_to_wide
+    assert unpacked_table.index == width_table.index
+    assert unpacked_table.pages == width_table.pages
+
+
+def test_unpack_invalid() -> None:
+    with pytest.raises(ValueError):
+        unpack(zlib.compress(b"\0" * 64))
+
+
+def test_load_from_zip(tmp_path: Path) -> None:
+    """Check the unicode data may be loaded when rich is imported from a zip file."""
+    package_path = Path(rich.__file__).parent
+    zip_path = tmp_path / "rich.zip"
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        for path in package_path.rglob("*"):
+            if path.suffix in (".py", ".bin"):
+                zip_file.write(path, path.relative_to(package_path.parent))
+    code = (
+        "import rich, rich.cells; print(rich.__file__, rich.cells.cell_len('\u3053'))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(zip_path)},
+    ).stdout.split()
+    assert output[0].startswith(str(zip_path))
+    assert output[1] == "2"
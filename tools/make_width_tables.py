@@ -1,4 +1,3 @@
-import subprocess
 from pathlib import Path
 
 from wcwidth import list_versions
@@ -6,21 +5,23 @@ from wcwidth.table_vs16 import VS16_NARROW_TO_WIDE
 from wcwidth.table_wide import WIDE_EASTASIAN
 from wcwidth.table_zero import ZERO_WIDTH
 
-from rich.cells import CellTable
+from rich._unicode_data._packed import pack
+from rich._unicode_data._width_table import WidthTable
 
 UNICODE_VERSIONS: list[str] = list_versions()
 
 
 path = Path("../rich/_unicode_data/_versions.py").resolve().absolute()
+# Written as black would format it
+versions = "".join(f'    "{version}",\n' for version in UNICODE_VERSIONS)
 init = f"""\
-VERSIONS = {UNICODE_VERSIONS!r}
+VERSIONS = (
+{versions})
 """
 
 with open(path, "wt") as init_file:
     init_file.write(init)
 
-subprocess.run(f"black {path}", shell=True)
-
 
 narrow_to_wide: set[str] = set()
 for start, end in VS16_NARROW_TO_WIDE["9.0.0"]:
@@ -36,18 +37,9 @@ for version in UNICODE_VERSIONS:
         table.append((start, end, 0))
     table.sort()
 
-    cell_table = CellTable(version, table, frozenset(narrow_to_wide))
-
-    table_file = f"""# Auto generated by tools/make_width_tables.py
-# Data from wcwidth project (https://github.com/jquast/wcwidth)
-
-from rich.cells import CellTable
-
-cell_table = CellTable({cell_table.unicode_version!r}, {cell_table.widths!r}, frozenset({sorted(cell_table.narrow_to_wide)!r}))
-"""
+    # Data from wcwidth project (https://github.com/jquast/wcwidth)
+    packed = pack(table, frozenset(narrow_to_wide), WidthTable.from_widths(table))
     version_path = version.replace(".", "-")
-    path = Path(f"../rich/_unicode_data/unicode{version_path}.py").resolve().absolute()
-    with open(path, "wt") as file_out:
-        file_out.write(table_file)
-
-    subprocess.run(f"black {path}", shell=True)
+    path = Path(f"../rich/_unicode_data/unicode{version_path}.bin").resolve().absolute()
+    with open(path, "wb") as file_out:
+        file_out.write(packed)